@@ -1,8 +1,12 @@
+import warnings
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from itertools import combinations, chain
-from typing import Tuple, List, Dict, Union
+from multiprocessing import current_process
+from typing import Tuple, List, Dict, Iterator, Optional, Union
 
-from tqdm import tqdm
 from maggma.builders import Builder
+from maggma.utils import grouper
 from pymatgen.core.structure import Structure
 from matminer.datasets import load_dataset
 from emmet.core.thermo import ThermoType
@@ -41,7 +45,18 @@ class AlloyPairBuilder(Builder):
         oxi_states,
         alloy_pairs,
         thermo_type: Union[ThermoType, str] = ThermoType.GGA_GGA_U_R2SCAN,
+        pair_batch_size: int = 1000,
+        num_processes: int = 1,
     ):
+        """
+        Args:
+            pair_batch_size: number of candidate pairs handed to process_item at a time,
+                so found alloy pairs reach update_targets while an anonymous formula is
+                still being searched
+            num_processes: number of processes used to evaluate the candidate pairs
+                of a batch; pairs are evaluated serially when process_item runs in a
+                daemonic process (e.g. with maggma's multiprocessing)
+        """
         self.materials = materials
         self.thermo = thermo
         self.electronic_structure = electronic_structure
@@ -57,6 +72,8 @@ class AlloyPairBuilder(Builder):
             )
 
         self.thermo_type = t_type
+        self.pair_batch_size = pair_batch_size
+        self.num_processes = num_processes
 
         super().__init__(
             sources=[materials, thermo, electronic_structure, provenance, oxi_states],
@@ -154,50 +171,39 @@ class AlloyPairBuilder(Builder):
                     for key in ("theoretical",):
                         d["properties"][key] = provenance_docs[material_id][key]
 
+            candidate_pairs = _get_candidate_pairs(docs)
+
             print(
-                f"Starting {af} with {len(docs)} materials, anonymous formula {idx} of {len(ANON_FORMULAS)}"
+                f"Starting {af} with {len(docs)} materials, "
+                f"anonymous formula {idx} of {len(ANON_FORMULAS)}"
             )
 
-            yield docs
+            for batch in grouper(candidate_pairs, self.pair_batch_size):
+                batch_ids = set(chain.from_iterable(batch))
+                yield {
+                    "docs": {mpid: docs[mpid] for mpid in batch_ids},
+                    "pairs": list(batch),
+                }
 
     def process_item(self, item):
-        pairs = []
-        for mpids in tqdm(list(combinations(item.keys(), 2))):
-            if (
-                item[mpids[0]]["symmetry"]["number"]
-                == item[mpids[1]]["symmetry"]["number"]
-            ) or (
-                item[mpids[0]]["spacegroup_loose"] == item[mpids[1]]["spacegroup_loose"]
-            ):
-                # optionally, could restrict based on band gap too (e.g. at least one end-point semiconducting)
-                # if (item[mpids[0]]["band_gap"] > 0) or (item[mpids[1]]["band_gap"] > 0):
-                try:
-                    pair = AlloyPair.from_structures(
-                        structures=[
-                            item[mpids[0]]["structure"],
-                            item[mpids[1]]["structure"],
-                        ],
-                        structures_with_oxidation_states=[
-                            item[mpids[0]]["structure_oxi"],
-                            item[mpids[1]]["structure_oxi"],
-                        ],
-                        ids=[mpids[0], mpids[1]],
-                        properties=[
-                            item[mpids[0]]["properties"],
-                            item[mpids[1]]["properties"],
-                        ],
+        docs = item["docs"]
+        args = [(docs[mpid_a], docs[mpid_b]) for mpid_a, mpid_b in item["pairs"]]
+
+        # Daemonic processes, such as the workers of maggma's own multiprocessing,
+        # cannot start a pool of their own
+        if self.num_processes > 1 and len(args) > 1 and not current_process().daemon:
+            with ProcessPoolExecutor(max_workers=self.num_processes) as executor:
+                results = list(
+                    executor.map(
+                        _get_alloy_pair_doc,
+                        *zip(*args),
+                        chunksize=max(1, len(args) // (4 * self.num_processes)),
                     )
-                    pairs.append(
-                        {
-                            "alloy_pair": pair.as_dict(),
-                            "_search": pair.search_dict(),
-                            "pair_id": pair.pair_id,
-                        }
-                    )
-                except InvalidAlloy:
-                    pass
-                except Exception as exc:
-                    print(exc)
+                )
+        else:
+            results = [_get_alloy_pair_doc(*arg) for arg in args]
+
+        pairs = [pair for pair in results if pair is not None]
 
         if pairs:
             print(f"Found {len(pairs)} alloy(s)")
@@ -210,6 +216,54 @@ class AlloyPairBuilder(Builder):
             self.alloy_pairs.update(docs)
 
 
+def _get_candidate_pairs(docs: Dict[str, Dict]) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily yields the pairs of materials that share either their space group or
+    their loose space group, one space group bucket at a time. Only materials
+    within the same bucket are paired up, and every pair is yielded once.
+    """
+    by_number: Dict[int, List[str]] = defaultdict(list)
+    by_loose: Dict[int, List[str]] = defaultdict(list)
+    for mpid, d in docs.items():
+        by_number[d["symmetry"]["number"]].append(mpid)
+        by_loose[d["spacegroup_loose"]].append(mpid)
+
+    for bucket in by_number.values():
+        yield from combinations(bucket, 2)
+
+    for bucket in by_loose.values():
+        for mpid_a, mpid_b in combinations(bucket, 2):
+            # pairs that share a space group were already yielded above
+            if docs[mpid_a]["symmetry"]["number"] != docs[mpid_b]["symmetry"]["number"]:
+                yield mpid_a, mpid_b
+
+
+def _get_alloy_pair_doc(d1: Dict, d2: Dict) -> Optional[Dict]:
+    """
+    Builds the alloy pair document for two materials, or returns None
+    if they do not form a valid alloy pair
+    """
+    # optionally, could restrict based on band gap too (e.g. at least one end-point semiconducting)
+    # if (d1["band_gap"] > 0) or (d2["band_gap"] > 0):
+    try:
+        pair = AlloyPair.from_structures(
+            structures=[d1["structure"], d2["structure"]],
+            structures_with_oxidation_states=[d1["structure_oxi"], d2["structure_oxi"]],
+            ids=[d1["material_id"], d2["material_id"]],
+            properties=[d1["properties"], d2["properties"]],
+        )
+        return {
+            "alloy_pair": pair.as_dict(),
+            "_search": pair.search_dict(),
+            "pair_id": pair.pair_id,
+        }
+    except InvalidAlloy:
+        pass
+    except Exception as exc:
+        print(exc)
+    return None
+
+
 class AlloyPairMemberBuilder(Builder):
     """
     This builder iterates over available AlloyPairs by chemical system
@@ -270,10 +324,19 @@ class AlloyPairMemberBuilder(Builder):
     def process_item(self, item: Tuple[List[AlloyPair], Dict[str, Structure]]):
         pairs, structures = item
 
-        all_pair_members = []
-        for pair in pairs:
-            pair_members = {"pair_id": pair.pair_id, "members": []}
-            for db_id, structure in structures.items():
+        # Only pairs with a matching stoichiometry can contain a structure,
+        # see AlloyPair.is_compatible
+        pair_index = _get_pair_index(pairs)
+
+        all_members: Dict[str, List[Dict]] = {pair.pair_id: [] for pair in pairs}
+        for db_id, structure in structures.items():
+            try:
+                candidates = _get_candidate_pairs_for(pair_index, structure)
+            except Exception as exc:
+                print(f"Exception for {db_id}: {exc}")
+                continue
+
+            for pair in candidates:
                 try:
                     if pair.is_member(structure):
                         db, _ = db_id.split("-")
@@ -284,11 +347,15 @@ class AlloyPairMemberBuilder(Builder):
                             is_ordered=structure.is_ordered,
                             x=pair.get_x(structure.composition),
                         )
-                        pair_members["members"].append(member.as_dict())
+                        all_members[pair.pair_id].append(member.as_dict())
                 except Exception as exc:
                     print(f"Exception for {db_id}: {exc}")
-            if pair_members["members"]:
-                all_pair_members.append(pair_members)
+
+        all_pair_members = [
+            {"pair_id": pair_id, "members": members}
+            for pair_id, members in all_members.items()
+            if members
+        ]
 
         return all_pair_members
 
@@ -298,6 +365,39 @@ class AlloyPairMemberBuilder(Builder):
             self.alloy_pair_members.update(docs)
 
 
+def _get_pair_index(
+    pairs: List[AlloyPair],
+) -> Dict[Tuple[str, str], Dict[str, List[AlloyPair]]]:
+    """
+    Indexes alloy pairs by their alloying elements and then by formula_a
+    """
+    pair_index: Dict[Tuple[str, str], Dict[str, List[AlloyPair]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    for pair in pairs:
+        elements = (pair.alloying_element_a, pair.alloying_element_b)
+        pair_index[elements][pair.formula_a].append(pair)
+    return pair_index
+
+
+def _get_candidate_pairs_for(
+    pair_index: Dict[Tuple[str, str], Dict[str, List[AlloyPair]]],
+    structure: Structure,
+) -> List[AlloyPair]:
+    """
+    Alloy pairs from the index that are compatible with the composition of a
+    structure, in the same way as AlloyPair.is_compatible
+    """
+    composition = structure.composition.element_composition
+    candidates = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        for (element_a, element_b), pairs_by_formula in pair_index.items():
+            formula = composition.replace({element_b: element_a}).reduced_formula
+            candidates.extend(pairs_by_formula.get(formula, []))
+    return candidates
+
+
 class AlloySystemBuilder(Builder):
     """
     This builder stitches together the results of
@@ -1,17 +1,26 @@
 import warnings
-from collections import defaultdict
-from itertools import chain
-from typing import Dict, Iterable, Iterator, List, Optional
+from collections import OrderedDict, defaultdict
+from hashlib import sha1
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from math import ceil
 import copy
+import json
 
 from maggma.core import Builder, Store
 from maggma.utils import grouper
-from pymatgen.entries.computed_entries import ComputedStructureEntry
+from monty.json import jsanitize as monty_jsanitize
+from pymatgen.core import __version__ as pmg_version
+from pymatgen.entries.computed_entries import ComputedStructureEntry, EnergyAdjustment
 from pymatgen.entries.compatibility import Compatibility
 
 from emmet.core.utils import jsanitize
-from emmet.builders.utils import chemsys_permutations, HiddenPrints
+from emmet.builders.utils import (
+    chemsys_costs,
+    chemsys_permutations,
+    EntriesCache,
+    HiddenPrints,
+    partition_by_cost,
+)
 from emmet.core.thermo import ThermoType
 from emmet.core.corrected_entries import CorrectedEntriesDoc
 
@@ -25,6 +34,9 @@ class CorrectedEntriesBuilder(Builder):
         query: Optional[Dict] = None,
         compatibility: Optional[List[Compatibility]] = None,
         chunk_size: int = 1000,
+        entries_cache_size: int = 1024,
+        corrections_cache_size: int = 100000,
+        balance_prechunk: bool = False,
         **kwargs,
     ):
         """
@@ -39,6 +51,12 @@ class CorrectedEntriesBuilder(Builder):
             compatibility ([Compatability]): Compatability module
                 to ensure energies are compatible
             chunk_size (int): Size of chemsys chunks to process at any one time.
+            entries_cache_size (int): Memory budget in MB for the compressed cache of raw entries
+                reused between chemical systems.
+            corrections_cache_size (int): Maximum number of entry corrections cached for reuse
+                between chemical systems, the least recently used are evicted first.
+            balance_prechunk (bool): Whether to split chemical systems in prechunk by the number of
+                materials in them and their subsystems instead of by count.
         """
 
         self.materials = materials
@@ -47,7 +65,13 @@ class CorrectedEntriesBuilder(Builder):
         self.compatibility = compatibility or [None]
         self.oxidation_states = oxidation_states
         self.chunk_size = chunk_size
-        self._entries_cache: Dict[str, List[ComputedStructureEntry]] = defaultdict(list)
+        self.entries_cache_size = entries_cache_size
+        self.corrections_cache_size = corrections_cache_size
+        self.balance_prechunk = balance_prechunk
+        self._entries_cache = EntriesCache(max_size=entries_cache_size * 1024**2)
+        self._corrections_cache: "OrderedDict[Tuple[str, str], Optional[Tuple[EnergyAdjustment, ...]]]"
+        self._corrections_cache = OrderedDict()
+        self._scheme_keys: Dict[int, str] = {}
 
         if self.corrected_entries.key != "chemsys":
             warnings.warn(
@@ -95,6 +119,18 @@ class CorrectedEntriesBuilder(Builder):
     def prechunk(self, number_splits: int) -> Iterable[Dict]:  # pragma: no cover
         to_process_chemsys = self._get_chemsys_to_process()
 
+        if self.balance_prechunk:
+            counts: Dict[str, int] = defaultdict(int)
+            for d in self.materials.query(
+                {"deprecated": False, **self.query}, properties=["chemsys"]
+            ):
+                counts[d["chemsys"]] += 1
+
+            costs = chemsys_costs(to_process_chemsys, counts)
+            for chemsys_chunk in partition_by_cost(costs, number_splits):  # type: ignore
+                yield {"query": {"chemsys": {"$in": chemsys_chunk}}}
+            return
+
         N = ceil(len(to_process_chemsys) / number_splits)
 
         for chemsys_chunk in grouper(to_process_chemsys, N):
@@ -124,6 +160,8 @@ class CorrectedEntriesBuilder(Builder):
             entries = self.get_entries(chemsys)
             yield entries
 
+        self.logger.info(f"Entries cache: {self._entries_cache.stats()}")
+
     def process_item(self, item):
         """
         Applies correction schemes to entries and constructs CorrectedEntriesDoc objects
@@ -161,8 +199,8 @@ class CorrectedEntriesBuilder(Builder):
                                 ]
                                 corrected_entries["R2SCAN"] = only_scan_pd_entries
 
-                                pd_entries = compatability.process_entries(
-                                    copy.deepcopy(entries)
+                                pd_entries = self._process_entries(
+                                    compatability, entries
                                 )
 
                             else:
@@ -171,14 +209,10 @@ class CorrectedEntriesBuilder(Builder):
 
                         elif compatability.name == "MP2020":
                             thermo_type = ThermoType.GGA_GGA_U
-                            pd_entries = compatability.process_entries(
-                                copy.deepcopy(entries)
-                            )
+                            pd_entries = self._process_entries(compatability, entries)
                         else:
                             thermo_type = ThermoType.UNKNOWN
-                            pd_entries = compatability.process_entries(
-                                copy.deepcopy(entries)
-                            )
+                            pd_entries = self._process_entries(compatability, entries)
 
                         corrected_entries[str(thermo_type)] = pd_entries
 
@@ -196,6 +230,113 @@ class CorrectedEntriesBuilder(Builder):
 
         return jsanitize(doc.dict(), allow_bson=True)
 
+    def _process_entries(
+        self, compatibility: Compatibility, entries: List[ComputedStructureEntry]
+    ) -> List[ComputedStructureEntry]:
+        """
+        Applies a compatibility scheme to copies of the entries of a chemsys, reusing
+        the corrections already computed for each entry during this build
+
+        Args:
+            compatibility (Compatibility): Compatibility scheme to apply
+            entries ([ComputedStructureEntry]): Uncorrected entries of the chemsys
+        Returns:
+            list (ComputedStructureEntry): corrected entries compatible with the scheme
+        """
+
+        if compatibility.name != "MP DFT mixing scheme":
+            return self._apply_corrections(compatibility, entries)
+
+        if len(entries) == 1:
+            # The mixing scheme rejects single entries
+            return compatibility.process_entries(copy.deepcopy(entries))
+
+        # Only the mixing step depends on the chemsys. The per-functional corrections
+        # that the scheme applies first are entry specific and can be reused.
+        rtypes_1 = compatibility.valid_rtypes_1
+        rtypes_2 = compatibility.valid_rtypes_2
+
+        pre_corrected = self._apply_corrections(
+            compatibility.compat_1,
+            [e for e in entries if e.parameters.get("run_type") in rtypes_1],
+        ) + self._apply_corrections(
+            compatibility.compat_2,
+            [e for e in entries if e.parameters.get("run_type") in rtypes_2],
+        )
+
+        if len(pre_corrected) == 1:
+            # The mixing scheme would reject the single entry left after the
+            # per-functional corrections, so run the full scheme instead
+            return compatibility.process_entries(copy.deepcopy(entries))
+
+        mixing_scheme = copy.copy(compatibility)
+        mixing_scheme.compat_1 = None
+        mixing_scheme.compat_2 = None
+
+        return mixing_scheme.process_entries(pre_corrected, clean=False)
+
+    def _apply_corrections(
+        self,
+        compatibility: Optional[Compatibility],
+        entries: List[ComputedStructureEntry],
+    ) -> List[ComputedStructureEntry]:
+        """
+        Applies an entry-specific compatibility scheme to copies of the entries,
+        using the corrections cache for entries that were already corrected with
+        the same scheme in another chemsys
+        """
+        copies = [_copy_entry(e) for e in entries]
+
+        if compatibility is None:
+            return copies
+
+        scheme_key = self._get_scheme_key(compatibility)
+
+        to_process = []
+        cached = set()
+        for entry in copies:
+            key = (scheme_key, entry.entry_id)
+            if entry.entry_id is not None and key in self._corrections_cache:
+                self._corrections_cache.move_to_end(key)
+                adjustments = self._corrections_cache[key]
+                if adjustments is not None:
+                    entry.energy_adjustments = list(adjustments)
+                    cached.add(id(entry))
+            else:
+                to_process.append(entry)
+
+        processed = {id(e) for e in compatibility.process_entries(to_process)}
+
+        for entry in to_process:
+            if entry.entry_id is not None:
+                self._corrections_cache[(scheme_key, entry.entry_id)] = (
+                    tuple(entry.energy_adjustments) if id(entry) in processed else None
+                )
+
+        while len(self._corrections_cache) > self.corrections_cache_size:
+            self._corrections_cache.popitem(last=False)
+
+        self.logger.debug(
+            f"Reused {len(copies) - len(to_process)} of {len(copies)} cached corrections "
+            f"for {compatibility.name}"
+        )
+
+        return [e for e in copies if id(e) in processed or id(e) in cached]
+
+    def _get_scheme_key(self, compatibility: Compatibility) -> str:
+        """
+        Key identifying a compatibility scheme and its settings for the corrections cache
+        """
+        if id(compatibility) not in self._scheme_keys:
+            settings = json.dumps(
+                monty_jsanitize(compatibility.as_dict(), strict=True), sort_keys=True
+            )
+            self._scheme_keys[id(compatibility)] = "{}:{}:{}".format(
+                compatibility.name, pmg_version, sha1(settings.encode()).hexdigest()
+            )
+
+        return self._scheme_keys[id(compatibility)]
+
     def update_targets(self, items):
         """
         Inserts the new corrected entry docs into the corrected entries collection
@@ -220,15 +361,17 @@ class CorrectedEntriesBuilder(Builder):
 
         self.logger.info(f"Getting entries for: {chemsys}")
         # First check the cache
-        all_chemsys = chemsys_permutations(chemsys)
-        cached_chemsys = all_chemsys & set(self._entries_cache.keys())
-        query_chemsys = all_chemsys - cached_chemsys
-        all_entries = list(
-            chain.from_iterable(self._entries_cache[c] for c in cached_chemsys)
-        )
+        all_entries = []
+        query_chemsys = []
+        for sub_chemsys in chemsys_permutations(chemsys):
+            cached_entries = self._entries_cache.get(sub_chemsys)
+            if cached_entries is None:
+                query_chemsys.append(sub_chemsys)
+            else:
+                all_entries.extend(cached_entries)
 
         self.logger.debug(
-            f"Getting {len(cached_chemsys)} sub-chemsys from cache for {chemsys}"
+            f"Getting {len(chemsys_permutations(chemsys)) - len(query_chemsys)} sub-chemsys from cache for {chemsys}"
         )
         self.logger.debug(
             f"Getting {len(query_chemsys)} sub-chemsys from DB for {chemsys}"
@@ -265,6 +408,7 @@ class CorrectedEntriesBuilder(Builder):
         )
 
         # Convert entries into ComputedEntries and store
+        new_entries: Dict[str, List[Dict]] = defaultdict(list)
         for doc in materials_docs:
             for r_type, entry_dict in doc.get("entries", {}).items():
                 entry_dict["data"]["oxidation_states"] = oxi_states_data.get(
@@ -272,9 +416,15 @@ class CorrectedEntriesBuilder(Builder):
                 )
                 entry_dict["data"]["run_type"] = r_type
                 elsyms = sorted(set([el for el in entry_dict["composition"]]))
-                self._entries_cache["-".join(elsyms)].append(entry_dict)
+                new_entries["-".join(elsyms)].append(entry_dict)
                 all_entries.append(entry_dict)
 
+        # Sub-chemsys without any materials are cached as well to avoid querying them again
+        for sub_chemsys in query_chemsys:
+            self._entries_cache.put(sub_chemsys, new_entries.get(sub_chemsys, []))
+
+        self.logger.debug(f"Entries cache: {self._entries_cache.stats()}")
+
         self.logger.info(f"Total entries in {chemsys} : {len(all_entries)}")
 
         return all_entries
@@ -314,3 +464,16 @@ class CorrectedEntriesBuilder(Builder):
         ]
 
         return to_process_chemsys
+
+
+def _copy_entry(entry: ComputedStructureEntry) -> ComputedStructureEntry:
+    """
+    Copies an entry so that corrections can be applied to it without touching the
+    original. Only the mutable metadata is copied; the structure is shared since
+    no correction scheme modifies it.
+    """
+    new_entry = copy.copy(entry)
+    new_entry.energy_adjustments = list(entry.energy_adjustments)
+    new_entry.parameters = copy.deepcopy(entry.parameters)
+    new_entry.data = copy.deepcopy(entry.data)
+    return new_entry
@@ -91,6 +91,7 @@ class StructureGroupBuilder(Builder):
         angle_tol: float = default_build_settings.ANGLE_TOL,
         check_newer: bool = True,
         chunk_size: int = 1000,
+        incremental: bool = False,
         **kwargs,
     ):
         """
@@ -104,6 +105,9 @@ class StructureGroupBuilder(Builder):
                             only applied to the materials when we need to group structures
                             the phase diagram is still constructed with the entire set
             chunk_size (int): Size of chemsys chunks to process at any one time.
+            incremental (bool): Load the materials and sgroups of chunk_size chemsys at a time
+                with one query each, and only upsert the sgroups whose members changed instead
+                of removing every sgroup of a changed chemsys before regrouping it.
         """
         self.materials = materials
         self.sgroups = sgroups
@@ -114,6 +118,7 @@ class StructureGroupBuilder(Builder):
         self.angle_tol = angle_tol
         self.check_newer = check_newer
         self.chunk_size = chunk_size
+        self.incremental = incremental
 
         self.query[
             "deprecated"
@@ -190,6 +195,10 @@ class StructureGroupBuilder(Builder):
         )
         self.total = len(all_chemsys)
 
+        if self.incremental:
+            yield from self._get_items_incremental(all_chemsys)
+            return
+
         for chemsys_l in all_chemsys:
             chemsys = "-".join(sorted(chemsys_l))
             chemsys_wo = "-".join(sorted(set(chemsys_l) - {self.working_ion}))
@@ -268,8 +277,96 @@ class StructureGroupBuilder(Builder):
             else:
                 yield {"chemsys": chemsys, "materials": all_mats_in_chemsys}
 
+    def _get_items_incremental(self, all_chemsys: List[List[str]]) -> Iterator:
+        """
+        Loads the materials and existing sgroups for chunk_size chemsys at a time.
+        Chemsys that changed are yielded along with their existing sgroups so
+        process_item can work out which sgroups need to be replaced.
+        """
+        for chunk in grouper(all_chemsys, self.chunk_size):
+            chemsys_pairs = {
+                "-".join(sorted(chemsys_l)): "-".join(
+                    sorted(set(chemsys_l) - {self.working_ion})
+                )
+                for chemsys_l in chunk
+            }
+
+            mats_by_chemsys = defaultdict(list)
+            for mat_doc in self.materials.query(
+                criteria={
+                    "$and": [
+                        {
+                            "chemsys": {
+                                "$in": list(
+                                    set(chemsys_pairs) | set(chemsys_pairs.values())
+                                )
+                            }
+                        },
+                        self.query.copy(),
+                    ]
+                },
+                properties=MAT_PROPS + ["chemsys", self.materials.last_updated_field],
+            ):
+                mats_by_chemsys[mat_doc["chemsys"]].append(mat_doc)
+
+            target_docs_by_chemsys = defaultdict(list)
+            if self.check_newer:
+                for g_doc in self.sgroups.query(
+                    criteria={"chemsys": {"$in": list(chemsys_pairs)}},
+                    properties=[
+                        "chemsys",
+                        "group_id",
+                        self.sgroups.last_updated_field,
+                        "material_ids",
+                    ],
+                ):
+                    target_docs_by_chemsys[g_doc["chemsys"]].append(g_doc)
+
+            for chemsys, chemsys_wo in chemsys_pairs.items():
+                all_mats_in_chemsys = (
+                    mats_by_chemsys[chemsys_wo] + mats_by_chemsys[chemsys]
+                )
+                all_target_docs = target_docs_by_chemsys[chemsys]
+
+                mat_ids = {mat_doc["material_id"] for mat_doc in all_mats_in_chemsys}
+                target_ids = set(
+                    chain.from_iterable(g["material_ids"] for g in all_target_docs)
+                )
+                max_mat_time = max(
+                    (m[self.materials.last_updated_field] for m in all_mats_in_chemsys),
+                    default=datetime.min,
+                )
+                min_target_time = min(
+                    (g[self.sgroups.last_updated_field] for g in all_target_docs),
+                    default=datetime.max,
+                )
+
+                if (
+                    self.check_newer
+                    and mat_ids == target_ids
+                    and max_mat_time < min_target_time
+                ):
+                    self.logger.info(f"Skipping chemsys {chemsys}.")
+                    yield None
+                else:
+                    yield {
+                        "chemsys": chemsys,
+                        "materials": all_mats_in_chemsys,
+                        "target_docs": all_target_docs,
+                    }
+
     def update_targets(self, items: List):
-        items = list(filter(None, chain.from_iterable(items)))
+        if self.incremental:
+            items = list(filter(None, items))
+            removed_ids = list(
+                chain.from_iterable(item["removed_ids"] for item in items)
+            )
+            if len(removed_ids) > 0:
+                self.logger.info(f"Removing {len(removed_ids)} outdated sgroups")
+                self.sgroups.remove_docs({"group_id": {"$in": removed_ids}})
+            items = list(chain.from_iterable(item["sgroups"] for item in items))
+        else:
+            items = list(filter(None, chain.from_iterable(items)))
         if len(items) > 0:
             self.logger.info("Updating {} sgroups documents".format(len(items)))
             for struct_group_dict in items:
@@ -307,8 +404,49 @@ class StructureGroupBuilder(Builder):
             stol=self.stol,
             angle_tol=self.angle_tol,
         )
+        if self.incremental:
+            return self._get_changed_sgroups(
+                [sg.dict() for sg in s_groups],
+                item["materials"],
+                item["target_docs"],
+            )
         return [sg.dict() for sg in s_groups]
 
+    def _get_changed_sgroups(
+        self, sgroups: List[Dict], mat_docs: List[Dict], target_docs: List[Dict]
+    ) -> Dict:
+        """
+        Compares the new sgroups of a chemsys with the stored ones. Sgroups with the
+        same members as a stored sgroup that is newer than all of its materials are
+        left as they are, and stored sgroups that no longer exist are marked for removal.
+        """
+        mat_times = {
+            m["material_id"]: m[self.materials.last_updated_field] for m in mat_docs
+        }
+        stored = {frozenset(g["material_ids"]): g for g in target_docs}
+
+        changed = []
+        for sg in sgroups:
+            g_doc = stored.get(frozenset(sg["material_ids"]))
+            if (
+                g_doc is None
+                or g_doc["group_id"] != sg["group_id"]
+                or any(
+                    mat_times[mid] >= g_doc[self.sgroups.last_updated_field]
+                    for mid in sg["material_ids"]
+                )
+            ):
+                changed.append(sg)
+
+        new_group_ids = {sg["group_id"] for sg in sgroups}
+        removed_ids = [
+            g["group_id"] for g in target_docs if g["group_id"] not in new_group_ids
+        ]
+        self.logger.debug(
+            f"{len(changed)} of {len(sgroups)} sgroups changed, {len(removed_ids)} removed"
+        )
+        return {"sgroups": changed, "removed_ids": removed_ids}
+
     def _remove_targets(self, rm_ids):
         self.sgroups.remove_docs({"material_ids": {"$in": rm_ids}})
 
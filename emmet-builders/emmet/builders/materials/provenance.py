@@ -1,8 +1,10 @@
 from collections import defaultdict
+from itertools import chain
 from typing import Dict, Iterable, List, Optional, Tuple
 from math import ceil
 from datetime import datetime
 
+import numpy as np
 from maggma.core import Builder, Store
 from maggma.utils import grouper
 from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
@@ -10,7 +12,7 @@ from pymatgen.core.structure import Structure
 
 from emmet.builders.settings import EmmetBuildSettings
 from emmet.core.provenance import ProvenanceDoc, SNLDict
-from emmet.core.utils import get_sg, jsanitize
+from emmet.core.utils import _fingerprint_structures, get_sg, jsanitize
 
 
 class ProvenanceBuilder(Builder):
@@ -141,28 +143,40 @@ class ProvenanceBuilder(Builder):
             )
         ) & set(updated_materials)
 
-        self.total = len(mat_ids)
-
-        self.logger.info(f"Found {self.total} new/updated systems to process")
-
-        for mat_id in mat_ids:
-            mat = self.materials.query_one(
-                properties=[
-                    "material_id",
-                    "last_updated",
-                    "structure",
-                    "initial_structures",
-                    "formula_pretty",
-                    "deprecated",
-                ],
-                criteria={"material_id": mat_id},
-            )
+        self.logger.info(f"Found {len(mat_ids)} new/updated systems to process")
+
+        formulas = sorted(
+            {
+                mat["formula_pretty"]
+                for mat in self.materials.query(
+                    properties=["material_id", "formula_pretty"],
+                    criteria={"formula_pretty": {"$in": list(forms_to_update)}},
+                )
+                if mat["material_id"] in mat_ids
+            }
+        )
+        self.total = len(formulas)
+
+        for formula in formulas:
+            mats = [
+                mat
+                for mat in self.materials.query(
+                    properties=[
+                        "material_id",
+                        "last_updated",
+                        "structure",
+                        "initial_structures",
+                        "formula_pretty",
+                        "deprecated",
+                    ],
+                    criteria={"formula_pretty": formula},
+                )
+                if mat["material_id"] in mat_ids
+            ]
 
             snls = []  # type: list
             for source in self.source_snls:
-                snls.extend(
-                    source.query(criteria={"formula_pretty": mat["formula_pretty"]})
-                )
+                snls.extend(source.query(criteria={"formula_pretty": formula}))
 
             snl_groups = defaultdict(list)
             for snl in snls:
@@ -171,59 +185,72 @@ class ProvenanceBuilder(Builder):
                 struc.snl = SNLDict(**snl)
                 snl_groups[snl_sg].append(struc)
 
-            mat_sg = get_sg(Structure.from_dict(mat["structure"]))
-
-            snl_structs = snl_groups[mat_sg]
-
-            self.logger.debug(f"Found {len(snl_structs)} potential snls for {mat_id}")
-            yield mat, snl_structs
+            self.logger.debug(
+                f"Found {len(snls)} potential snls for {len(mats)} materials of {formula}"
+            )
+            yield mats, dict(snl_groups)
 
-    def process_item(self, item) -> Dict:
+    def process_item(self, item) -> List[Dict]:
         """
         Matches SNLS and Materials
         Args:
-            item (tuple): a tuple of materials and snls
+            item (tuple): a tuple of the materials of a formula and their candidate
+                snls grouped by spacegroup number
         Returns:
             list(dict): a list of collected snls with material ids
         """
-        mat, snl_structs = item
-        formula_pretty = mat["formula_pretty"]
-        snl_doc = None
+        mats, snl_groups = item
+        formula_pretty = mats[0]["formula_pretty"]
         self.logger.debug(f"Finding Provenance {formula_pretty}")
 
-        # Match up SNLS with materials
-
-        matched_snls = self.match(snl_structs, mat)
-
-        if len(matched_snls) > 0:
-            doc = ProvenanceDoc.from_SNLs(
-                material_id=mat["material_id"],
-                structure=Structure.from_dict(mat["structure"]),
-                snls=matched_snls,
-                deprecated=mat["deprecated"],
-            )
-        else:
-            doc = ProvenanceDoc(
-                material_id=mat["material_id"],
-                structure=Structure.from_dict(mat["structure"]),
-                deprecated=mat["deprecated"],
-                created_at=datetime.utcnow(),
+        # Reduce the SNL structures once for all materials of this formula
+        sm = self._get_structure_matcher()
+        reduced_snls = {
+            sg: _reduce_structures(sm, snl_structs)
+            for sg, snl_structs in snl_groups.items()
+        }
+
+        snl_docs = []
+        for mat in mats:
+            structure = Structure.from_dict(mat["structure"])
+            mat_sg = get_sg(structure)
+
+            # Match up SNLS with materials
+            matched_snls = self.match(
+                snl_groups.get(mat_sg, []), mat, reduced_snls.get(mat_sg)
             )
 
-        doc.authors.append(self.settings.DEFAULT_AUTHOR)
-        doc.history.append(self.settings.DEFAULT_HISTORY)
-        doc.references.append(self.settings.DEFAULT_REFERENCE)
+            if len(matched_snls) > 0:
+                doc = ProvenanceDoc.from_SNLs(
+                    material_id=mat["material_id"],
+                    structure=structure,
+                    snls=matched_snls,
+                    deprecated=mat["deprecated"],
+                )
+            else:
+                doc = ProvenanceDoc(
+                    material_id=mat["material_id"],
+                    structure=structure,
+                    deprecated=mat["deprecated"],
+                    created_at=datetime.utcnow(),
+                )
 
-        snl_doc = jsanitize(doc.dict(exclude_none=False), allow_bson=True)
+            doc.authors.append(self.settings.DEFAULT_AUTHOR)
+            doc.history.append(self.settings.DEFAULT_HISTORY)
+            doc.references.append(self.settings.DEFAULT_REFERENCE)
 
-        return snl_doc
+            snl_docs.append(jsanitize(doc.dict(exclude_none=False), allow_bson=True))
 
-    def match(self, snl_structs, mat):
+        return snl_docs
+
+    def match(self, snl_structs, mat, reduced_snls=None):
         """
         Finds a material doc that matches with the given snl
         Args:
             snl_structs ([dict]): the snls struct list
             mat (dict): a materials doc
+            reduced_snls (tuple): the reduced snl structures and their fingerprints
+                from _reduce_structures, computed from snl_structs if not given
         Returns:
             generator of materials doc keys
         """
@@ -232,7 +259,39 @@ class ProvenanceBuilder(Builder):
             Structure.from_dict(init_struc) for init_struc in mat["initial_structures"]
         ]
 
-        sm = StructureMatcher(
+        sm = self._get_structure_matcher()
+
+        snls = []
+        if not snl_structs:
+            return snls
+
+        reduced_m, m_fingerprints = _reduce_structures(sm, m_strucs)
+        reduced_snl, snl_fingerprints = reduced_snls or _reduce_structures(
+            sm, snl_structs
+        )
+        # Loosened slightly so numerical noise in the reduction never rejects a match
+        max_ratio = (1 + sm.ltol) * (1 + 1e-6)
+
+        for i, s in enumerate(reduced_m):
+            # Skip the fits that cannot succeed, see emmet.core.utils._fingerprint_structures
+            candidates = np.flatnonzero(
+                (snl_fingerprints["num_sites"] == m_fingerprints["num_sites"][i])
+                & (
+                    m_fingerprints["shortest"][i]
+                    <= max_ratio * snl_fingerprints["min_abc"]
+                )
+            )
+            for j in candidates:
+                snl_struc = snl_structs[j]
+                if sm.fit(s, reduced_snl[j], skip_structure_reduction=True):
+                    if snl_struc.snl not in snls:
+                        snls.append(snl_struc.snl)
+
+        self.logger.debug(f"Found {len(snls)} SNLs for {mat['material_id']}")
+        return snls
+
+    def _get_structure_matcher(self) -> StructureMatcher:
+        return StructureMatcher(
             ltol=self.settings.LTOL,
             stol=self.settings.STOL,
             angle_tol=self.settings.ANGLE_TOL,
@@ -243,25 +302,28 @@ class ProvenanceBuilder(Builder):
             comparator=ElementComparator(),
         )
 
-        snls = []
-
-        for s in m_strucs:
-            for snl_struc in snl_structs:
-                if sm.fit(s, snl_struc):
-                    if snl_struc.snl not in snls:
-                        snls.append(snl_struc.snl)
-
-        self.logger.debug(f"Found {len(snls)} SNLs for {mat['material_id']}")
-        return snls
-
     def update_targets(self, items):
         """
         Inserts the new SNL docs into the SNL collection
         """
-        snls = list(filter(None, items))
+        snls = list(filter(None, chain.from_iterable(items)))
 
         if len(snls) > 0:
             self.logger.info(f"Found {len(snls)} SNLs to update")
             self.provenance.update(snls)
         else:
             self.logger.info("No items to update")
+
+
+def _reduce_structures(
+    sm: StructureMatcher, structures: List[Structure]
+) -> Tuple[List[Structure], Dict[str, np.ndarray]]:
+    """
+    Reduces structures the same way StructureMatcher.fit does, so they can be
+    fit repeatedly with skip_structure_reduction, and fingerprints them
+    """
+    reduced = [
+        sm._get_reduced_structure(s, sm._primitive_cell, niggli=True)
+        for s in sm._process_species(structures)
+    ]
+    return reduced, _fingerprint_structures(reduced)
@@ -1,6 +1,9 @@
+from itertools import chain
+
 import numpy as np
 
 from maggma.builders import Builder
+from maggma.utils import grouper
 
 __author__ = "Nils E. R. Zimmermann <nerz@lbl.gov>"
 
@@ -10,7 +13,15 @@ __author__ = "Nils E. R. Zimmermann <nerz@lbl.gov>"
 
 
 class StructureSimilarityBuilder(Builder):
-    def __init__(self, site_descriptors, structure_similarity, fp_type="csf", **kwargs):
+    def __init__(
+        self,
+        site_descriptors,
+        structure_similarity,
+        fp_type="csf",
+        top_k=None,
+        block_size=1024,
+        **kwargs,
+    ):
         """
         Calculates similarity metrics between structures on the basis
         of site descriptors.
@@ -27,11 +38,24 @@ class StructureSimilarityBuilder(Builder):
                            CrystalSiteFingerprint class)
                            or "opsf" (based on matminer's
                            OPSiteFingerprint class)).
+            top_k (int): if set, only the top_k nearest neighbours
+                         (by Euclidean distance) of each material are
+                         stored, with one document per material. The
+                         default (None) stores one document for every
+                         pair of materials, i.e. N*(N-1)/2 documents for
+                         N materials.
+            block_size (int): number of materials per block. Items pair a
+                              block of rows with a block of columns, so
+                              each item yields at most block_size**2 pair
+                              documents (block_size documents with top_k)
+                              and holds block_size**2 similarity values.
         """
 
         self.site_descriptors = site_descriptors
         self.structure_similarity = structure_similarity
         self.fp_type = fp_type
+        self.top_k = top_k
+        self.block_size = block_size
 
         super().__init__(
             sources=[site_descriptors], targets=[structure_similarity], **kwargs
@@ -39,59 +63,71 @@ class StructureSimilarityBuilder(Builder):
 
     def get_items(self):
         """
-        Gets all materials that need new site descriptors.
+        Loads the site-fingerprint statistics of all materials into one
+        matrix and splits the materials into blocks to compute similarities for.
+
+        Items carry the ids and fingerprints of their materials so that they
+        can be processed by any (pickled, possibly remote) copy of the builder.
+        With top_k, every block of rows is compared against all materials,
+        which process_item streams from the site_descriptors store.
 
         Returns:
-            generator of materials to calculate site descriptors.
+            generator of items, each a dict with the "ids" and "fingerprints"
+            of a block of rows plus either "col_ids" and "col_fingerprints"
+            of a block of columns or the fingerprint "labels" (with top_k).
         """
 
         self.logger.info("Structure Similarity Builder Started")
 
-        self.logger.info("Setting indexes")
-
         # TODO: re-introduce last-updated filtering.
-        task_ids = list(self.site_descriptors.distinct(self.site_descriptors.key))
-        n_task_ids = len(task_ids)
-        for i in range(n_task_ids - 1):
-            d1 = self.site_descriptors.query_one(
-                properties=[self.site_descriptors.key, "statistics"],
-                criteria={self.site_descriptors.key: task_ids[i]},
-            )
-            for j in range(i + 1, n_task_ids):
-                d2 = self.site_descriptors.query_one(
-                    properties=[self.site_descriptors.key, "statistics"],
-                    criteria={self.site_descriptors.key: task_ids[j]},
-                )
-                yield list([d1, d2])
+        ids, labels, fingerprints = self._get_fingerprints()
+        n_ids = len(ids)
+        self.logger.info("Loaded fingerprints for {} materials".format(n_ids))
+
+        blocks = [
+            (start, min(start + self.block_size, n_ids))
+            for start in range(0, n_ids, self.block_size)
+        ]
+
+        if self.top_k:
+            self.total = len(blocks)
+            for start, stop in blocks:
+                yield {
+                    "ids": ids[start:stop],
+                    "fingerprints": fingerprints[start:stop],
+                    "labels": labels,
+                }
+
+        else:
+            self.total = len(blocks) * (len(blocks) + 1) // 2
+            for i, (start, stop) in enumerate(blocks):
+                for col_start, col_stop in blocks[i:]:
+                    yield {
+                        "ids": ids[start:stop],
+                        "fingerprints": fingerprints[start:stop],
+                        "col_ids": ids[col_start:col_stop],
+                        "col_fingerprints": fingerprints[col_start:col_stop],
+                        "diagonal": start == col_start,
+                    }
 
     def process_item(self, item):
         """
-        Calculates site descriptors for the structures
+        Calculates similarity measures for a block of materials
 
         Args:
-            item (list): a list (length 2) with each one document that
-                         carries a task ID in "task_id" and a statistics
-                         vector from OP site-fingerprints in
-                         "statistics".
+            item (dict): block of materials as yielded by get_items.
 
         Returns:
-            dict: similarity measures.
+            [dict]: similarity measures, either one document per pair of
+                    materials in the row and column blocks, or one
+                    document per material with its top_k nearest neighbours.
         """
-        self.logger.debug(
-            "Similarities for {} and {}".format(
-                item[0][self.site_descriptors.key], item[1][self.site_descriptors.key]
-            )
-        )
+        ids = item["ids"]
+        self.logger.debug("Similarities for {} to {}".format(ids[0], ids[-1]))
 
-        sim_doc = {}
-        sim_doc = self.get_similarities(item[0], item[1])
-        sim_doc[self.structure_similarity.key] = tuple(
-            sorted(
-                [item[0][self.site_descriptors.key], item[1][self.site_descriptors.key]]
-            )
-        )
-
-        return sim_doc
+        if self.top_k:
+            return self._get_nearest_neighbors(item)
+        return self._get_pair_similarities(item)
 
     def update_targets(self, items):
         """
@@ -100,12 +136,151 @@ class StructureSimilarityBuilder(Builder):
         Args:
             items ([[dict]]): a list of list of site-descriptors dictionaries to update.
         """
-        if len(items) > 0:
-            self.logger.info("Updating {} structure-similarity docs".format(len(items)))
-            self.structure_similarity.update(docs=items)
+        docs = list(chain.from_iterable(items))
+        if len(docs) > 0:
+            self.logger.info("Updating {} structure-similarity docs".format(len(docs)))
+            self.structure_similarity.update(docs=docs)
         else:
             self.logger.info("No items to update")
 
+    def _iter_fingerprints(self, labels=None, log_errors=True):
+        """
+        Reads the statistics vectors of all site descriptors in a single
+        query, aligned on the given labels or on those of the first one.
+
+        Yields:
+            (id, labels, row) for every site descriptor with matching labels.
+        """
+        for d in self.site_descriptors.query(
+            properties=[self.site_descriptors.key, "statistics"]
+        ):
+            values = {}
+            for opdict in d.get("statistics", {}).get(self.fp_type, []):
+                for stattype, val in opdict.items():
+                    if stattype != "name":
+                        values["{} {}".format(opdict["name"], stattype)] = val
+
+            if labels is None:
+                labels = list(values)
+            if set(values) != set(labels):
+                if log_errors:
+                    self.logger.error(
+                        "Failed calculating structure similarity metrics for {}: "
+                        "site-fingerprint statistics labels do not match".format(
+                            d[self.site_descriptors.key]
+                        )
+                    )
+                continue
+
+            yield d[self.site_descriptors.key], labels, [values[k] for k in labels]
+
+    def _get_fingerprints(self):
+        """
+        Returns:
+            ids ([str]): keys of the site descriptors in matrix row order.
+            labels ([str]): statistics labels in matrix column order.
+            fingerprints (np.ndarray): float32 matrix with one row per material.
+        """
+        ids, labels, rows = [], None, []
+        for fp_id, labels, row in self._iter_fingerprints():
+            ids.append(fp_id)
+            rows.append(row)
+
+        fingerprints = np.array(rows, dtype=np.float32).reshape(
+            len(rows), len(labels or [])
+        )
+        return ids, labels, fingerprints
+
+    def _iter_blocks(self, fingerprints, columns):
+        """
+        Yields cosine similarities and Euclidean distances between the rows
+        of fingerprints and each block of columns from columns, which yields
+        (column ids, column fingerprints) tuples.
+        """
+        rows = np.asarray(fingerprints, dtype=np.float64)
+        row_norms = np.linalg.norm(rows, axis=1)
+        for col_ids, cols in columns:
+            cols = np.asarray(cols, dtype=np.float64)
+            col_norms = np.linalg.norm(cols, axis=1)
+            dots = rows @ cols.T
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cos = dots / np.outer(row_norms, col_norms)
+            dist = np.sqrt(
+                np.maximum(
+                    row_norms[:, None] ** 2 + col_norms[None, :] ** 2 - 2 * dots, 0
+                )
+            )
+            yield col_ids, cos, dist
+
+    def _get_pair_similarities(self, item):
+        ids = item["ids"]
+        columns = [(item["col_ids"], item["col_fingerprints"])]
+        docs = []
+        for col_ids, cos, dist in self._iter_blocks(item["fingerprints"], columns):
+            if item["diagonal"]:
+                i, j = np.triu_indices(len(ids), k=1)
+            else:
+                i, j = np.indices(cos.shape).reshape(2, -1)
+            for ii, jj in zip(i, j):
+                doc = {"cos": float(cos[ii, jj]), "dist": float(dist[ii, jj])}
+                doc[self.structure_similarity.key] = tuple(
+                    sorted([ids[ii], col_ids[jj]])
+                )
+                docs.append(doc)
+        return docs
+
+    def _get_nearest_neighbors(self, item):
+        ids = item["ids"]
+        # workers receive an unconnected copy of the builder
+        self.site_descriptors.connect()
+        columns = (
+            ([fp_id for fp_id, _, _ in block], [row for _, _, row in block])
+            for block in grouper(
+                self._iter_fingerprints(item["labels"], log_errors=False),
+                self.block_size,
+            )
+        )
+
+        n_rows = len(ids)
+        row_ids = np.array(ids, dtype=object)[:, None]
+        best_dist = np.full((n_rows, 0), np.inf)
+        best_cos = np.empty((n_rows, 0))
+        best_ids = np.empty((n_rows, 0), dtype=object)
+        for col_ids, cos, dist in self._iter_blocks(item["fingerprints"], columns):
+            block_ids = np.broadcast_to(np.array(col_ids, dtype=object), dist.shape)
+            dist = np.where(block_ids == row_ids, np.inf, dist)
+
+            best_dist = np.concatenate([best_dist, dist], axis=1)
+            best_cos = np.concatenate([best_cos, cos], axis=1)
+            best_ids = np.concatenate([best_ids, block_ids], axis=1)
+            if best_dist.shape[1] > self.top_k:
+                keep = np.argpartition(best_dist, self.top_k - 1, axis=1)[
+                    :, : self.top_k
+                ]
+                best_dist = np.take_along_axis(best_dist, keep, axis=1)
+                best_cos = np.take_along_axis(best_cos, keep, axis=1)
+                best_ids = np.take_along_axis(best_ids, keep, axis=1)
+
+        docs = []
+        order = np.argsort(best_dist, axis=1, kind="stable")
+        for ii in range(n_rows):
+            neighbors = [
+                {
+                    self.site_descriptors.key: best_ids[ii, jj],
+                    "cos": float(best_cos[ii, jj]),
+                    "dist": float(best_dist[ii, jj]),
+                }
+                for jj in order[ii]
+                if np.isfinite(best_dist[ii, jj])
+            ]
+            docs.append(
+                {
+                    self.structure_similarity.key: ids[ii],
+                    "neighbors": neighbors,
+                }
+            )
+        return docs
+
     def get_similarities(self, d1, d2):
         doc = {}
 
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from math import ceil
 
 from maggma.builders import Builder
@@ -35,8 +36,21 @@ class SummaryBuilder(Builder):
         thermo_type=ThermoType.GGA_GGA_U_R2SCAN.value,
         chunk_size=100,
         query=None,
+        prefetch=False,
         **kwargs,
     ):
+        """
+        Builds summary documents from the materials and property stores
+
+        Args:
+            thermo_type: thermo type of the thermo docs to pull into the summary
+            chunk_size: number of materials to process at any one time; with
+                prefetch enabled this also bounds how many materials have their
+                property docs held in memory at once
+            query: dictionary to limit materials to be analyzed
+            prefetch: pull each source store once per chunk of materials with
+                $in queries instead of querying every store for every material
+        """
         self.materials = materials
         self.thermo = thermo
         self.xas = xas
@@ -62,6 +76,7 @@ class SummaryBuilder(Builder):
         self.summary = summary
         self.chunk_size = chunk_size
         self.query = query if query else {}
+        self.prefetch = prefetch
 
         super().__init__(
             sources=[
@@ -111,97 +126,240 @@ class SummaryBuilder(Builder):
 
         self.logger.debug("Processing {} materials.".format(self.total))
 
-        for entry in summary_set:
-            materials_doc = self.materials.query_one({self.materials.key: entry})
+        if self.prefetch:
+            for chunk in grouper(summary_set, self.chunk_size):
+                yield from self._get_prefetched_data(chunk)
+        else:
+            for entry in summary_set:
+                materials_doc = self.materials.query_one({self.materials.key: entry})
+                yield self._get_data(entry, materials_doc)
+
+    def _get_data(self, entry, materials_doc):
+        """
+        Queries every source store for the property docs of a single material
+        """
+        valid_static_tasks = set(
+            [
+                task_id
+                for task_id, task_type in materials_doc["task_types"].items()
+                if task_type == "Static"
+            ]
+        ) - set(materials_doc["deprecated_tasks"])
+
+        all_tasks = list(materials_doc["task_types"].keys())
+
+        data = {
+            HasProps.materials.value: materials_doc,
+            HasProps.thermo.value: self.thermo.query_one(
+                {self.materials.key: entry, "thermo_type": str(self.thermo_type)}
+            ),
+            HasProps.xas.value: list(
+                self.xas.query({self.xas.key: {"$in": all_tasks}})
+            ),
+            HasProps.grain_boundaries.value: list(
+                self.grain_boundaries.query({self.grain_boundaries.key: entry})
+            ),
+            HasProps.electronic_structure.value: self.electronic_structure.query_one(
+                {self.electronic_structure.key: entry}
+            ),
+            HasProps.magnetism.value: self.magnetism.query_one(
+                {self.magnetism.key: entry}
+            ),
+            HasProps.elasticity.value: self.elasticity.query_one(
+                {self.elasticity.key: {"$in": all_tasks}}
+            ),
+            HasProps.dielectric.value: self.dielectric.query_one(
+                {self.dielectric.key: entry}
+            ),
+            HasProps.piezoelectric.value: self.piezoelectric.query_one(
+                {self.piezoelectric.key: entry}
+            ),
+            HasProps.phonon.value: self.phonon.query_one(
+                {self.phonon.key: {"$in": all_tasks}},
+                [self.phonon.key],
+            ),
+            HasProps.insertion_electrodes.value: list(
+                self.insertion_electrodes.query(
+                    {"material_ids": entry},
+                    [self.insertion_electrodes.key],
+                )
+            ),
+            HasProps.surface_properties.value: self.surfaces.query_one(
+                {self.surfaces.key: {"$in": all_tasks}}
+            ),
+            HasProps.substrates.value: list(
+                self.substrates.query(
+                    {self.substrates.key: {"$in": all_tasks}}, [self.substrates.key]
+                )
+            ),
+            HasProps.oxi_states.value: self.oxi_states.query_one(
+                {self.oxi_states.key: entry}
+            ),
+            HasProps.eos.value: self.eos.query_one(
+                {self.eos.key: {"$in": all_tasks}}, [self.eos.key]
+            ),
+            HasProps.chemenv.value: self.chemenv.query_one({self.chemenv.key: entry}),
+            HasProps.absorption.value: self.absorption.query_one(
+                {self.absorption.key: entry}
+            ),
+            HasProps.provenance.value: self.provenance.query_one(
+                {self.provenance.key: entry}
+            ),
+            HasProps.charge_density.value: self.charge_density_index.query_one(
+                {"task_id": {"$in": list(valid_static_tasks)}}, ["task_id"]
+            ),
+        }
+
+        return self._reshape_data(data)
+
+    def _get_prefetched_data(self, mat_ids):
+        """
+        Pulls the property docs for a chunk of materials with a single $in query
+        per source store and joins them in memory
+
+        Args:
+            mat_ids: material_ids in this chunk
+
+        Returns:
+            generator of data dicts, one per material
+        """
+        materials_docs = list(
+            self.materials.query({self.materials.key: {"$in": list(mat_ids)}})
+        )
+
+        all_tasks = list(
+            {
+                task_id
+                for materials_doc in materials_docs
+                for task_id in materials_doc["task_types"]
+            }
+        )
+        static_tasks = list(
+            {
+                task_id
+                for materials_doc in materials_docs
+                for task_id, task_type in materials_doc["task_types"].items()
+                if task_type == "Static"
+            }
+        )
+
+        def _group(store, ids, key=None, properties=None, criteria=None):
+            key = key or store.key
+            q = {key: {"$in": ids}}
+            q.update(criteria or {})
+            grouped = defaultdict(list)
+            for doc in store.query(criteria=q, properties=properties):
+                grouped[doc[key]].append(doc)
+            return grouped
 
-            valid_static_tasks = set(
-                [
-                    task_id
-                    for task_id, task_type in materials_doc["task_types"].items()
-                    if task_type == "Static"
-                ]
-            ) - set(materials_doc["deprecated_tasks"])
+        by_material = {
+            HasProps.thermo.value: _group(
+                self.thermo,
+                mat_ids,
+                key=self.materials.key,
+                criteria={"thermo_type": str(self.thermo_type)},
+            ),
+            HasProps.grain_boundaries.value: _group(self.grain_boundaries, mat_ids),
+            HasProps.electronic_structure.value: _group(
+                self.electronic_structure, mat_ids
+            ),
+            HasProps.magnetism.value: _group(self.magnetism, mat_ids),
+            HasProps.dielectric.value: _group(self.dielectric, mat_ids),
+            HasProps.piezoelectric.value: _group(self.piezoelectric, mat_ids),
+            HasProps.oxi_states.value: _group(self.oxi_states, mat_ids),
+            HasProps.chemenv.value: _group(self.chemenv, mat_ids),
+            HasProps.absorption.value: _group(self.absorption, mat_ids),
+            HasProps.provenance.value: _group(self.provenance, mat_ids),
+        }
 
-            all_tasks = list(materials_doc["task_types"].keys())
+        by_task = {
+            HasProps.xas.value: _group(self.xas, all_tasks),
+            HasProps.elasticity.value: _group(self.elasticity, all_tasks),
+            HasProps.phonon.value: _group(
+                self.phonon, all_tasks, properties=[self.phonon.key]
+            ),
+            HasProps.surface_properties.value: _group(self.surfaces, all_tasks),
+            HasProps.substrates.value: _group(
+                self.substrates, all_tasks, properties=[self.substrates.key]
+            ),
+            HasProps.eos.value: _group(self.eos, all_tasks, properties=[self.eos.key]),
+            HasProps.charge_density.value: _group(
+                self.charge_density_index,
+                static_tasks,
+                key="task_id",
+                properties=["task_id"],
+            ),
+        }
+
+        # Electrodes reference their materials through an array field
+        electrodes = defaultdict(list)
+        for doc in self.insertion_electrodes.query(
+            criteria={"material_ids": {"$in": list(mat_ids)}},
+            properties=[self.insertion_electrodes.key, "material_ids"],
+        ):
+            for mat_id in set(doc.pop("material_ids", [])):
+                electrodes[mat_id].append(doc)
+
+        def _first(grouped, keys):
+            for key in keys:
+                if grouped.get(key):
+                    return grouped[key][0]
+            return None
+
+        def _all(grouped, keys):
+            return [doc for key in keys for doc in grouped.get(key, [])]
+
+        for materials_doc in materials_docs:
+            entry = materials_doc[self.materials.key]
+            all_mat_tasks = list(materials_doc["task_types"].keys())
+            valid_static_tasks = [
+                task_id
+                for task_id, task_type in materials_doc["task_types"].items()
+                if task_type == "Static"
+                and task_id not in materials_doc["deprecated_tasks"]
+            ]
 
             data = {
                 HasProps.materials.value: materials_doc,
-                HasProps.thermo.value: self.thermo.query_one(
-                    {self.materials.key: entry, "thermo_type": str(self.thermo_type)}
-                ),
-                HasProps.xas.value: list(
-                    self.xas.query({self.xas.key: {"$in": all_tasks}})
-                ),
-                HasProps.grain_boundaries.value: list(
-                    self.grain_boundaries.query({self.grain_boundaries.key: entry})
-                ),
-                HasProps.electronic_structure.value: self.electronic_structure.query_one(
-                    {self.electronic_structure.key: entry}
-                ),
-                HasProps.magnetism.value: self.magnetism.query_one(
-                    {self.magnetism.key: entry}
-                ),
-                HasProps.elasticity.value: self.elasticity.query_one(
-                    {self.elasticity.key: {"$in": all_tasks}}
-                ),
-                HasProps.dielectric.value: self.dielectric.query_one(
-                    {self.dielectric.key: entry}
-                ),
-                HasProps.piezoelectric.value: self.piezoelectric.query_one(
-                    {self.piezoelectric.key: entry}
-                ),
-                HasProps.phonon.value: self.phonon.query_one(
-                    {self.phonon.key: {"$in": all_tasks}},
-                    [self.phonon.key],
-                ),
-                HasProps.insertion_electrodes.value: list(
-                    self.insertion_electrodes.query(
-                        {"material_ids": entry},
-                        [self.insertion_electrodes.key],
-                    )
+                HasProps.xas.value: _all(by_task[HasProps.xas.value], all_mat_tasks),
+                HasProps.grain_boundaries.value: _all(
+                    by_material[HasProps.grain_boundaries.value], [entry]
                 ),
-                HasProps.surface_properties.value: self.surfaces.query_one(
-                    {self.surfaces.key: {"$in": all_tasks}}
+                HasProps.insertion_electrodes.value: electrodes.get(entry, []),
+                HasProps.substrates.value: _all(
+                    by_task[HasProps.substrates.value], all_mat_tasks
                 ),
-                HasProps.substrates.value: list(
-                    self.substrates.query(
-                        {self.substrates.key: {"$in": all_tasks}}, [self.substrates.key]
-                    )
-                ),
-                HasProps.oxi_states.value: self.oxi_states.query_one(
-                    {self.oxi_states.key: entry}
-                ),
-                HasProps.eos.value: self.eos.query_one(
-                    {self.eos.key: {"$in": all_tasks}}, [self.eos.key]
-                ),
-                HasProps.chemenv.value: self.chemenv.query_one(
-                    {self.chemenv.key: entry}
-                ),
-                HasProps.absorption.value: self.absorption.query_one(
-                    {self.absorption.key: entry}
-                ),
-                HasProps.provenance.value: self.provenance.query_one(
-                    {self.provenance.key: entry}
-                ),
-                HasProps.charge_density.value: self.charge_density_index.query_one(
-                    {"task_id": {"$in": list(valid_static_tasks)}}, ["task_id"]
+                HasProps.charge_density.value: _first(
+                    by_task[HasProps.charge_density.value], valid_static_tasks
                 ),
             }
 
-            sub_fields = {
-                HasProps.elasticity.value: "elasticity",
-            }
+            for prop, grouped in by_material.items():
+                data.setdefault(prop, _first(grouped, [entry]))
+
+            for prop, grouped in by_task.items():
+                data.setdefault(prop, _first(grouped, all_mat_tasks))
+
+            yield self._reshape_data(data)
+
+    def _reshape_data(self, data):
+        """
+        Pulls the relevant sub-fields out of the raw property docs
+        """
+        sub_fields = {
+            HasProps.elasticity.value: "elasticity",
+        }
 
-            for collection, sub_field in sub_fields.items():
-                if data[collection] is not None:
-                    data[collection] = (
-                        data[collection][sub_field]
-                        if (sub_field in data[collection])
-                        and (data[collection][sub_field] != {})
-                        else None
-                    )
+        for collection, sub_field in sub_fields.items():
+            if data[collection] is not None:
+                data[collection] = (
+                    data[collection][sub_field]
+                    if (sub_field in data[collection])
+                    and (data[collection][sub_field] != {})
+                    else None
+                )
 
-            yield data
+        return data
 
     def prechunk(self, number_splits: int):  # pragma: no cover
         """
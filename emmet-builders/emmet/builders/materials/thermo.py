@@ -1,7 +1,8 @@
+from hashlib import sha1
 from math import ceil
 import warnings
 from itertools import chain
-from typing import Dict, Iterator, List, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from maggma.core import Builder, Store
 from maggma.stores import S3Store
@@ -10,8 +11,12 @@ from monty.json import MontyDecoder
 from pymatgen.analysis.phase_diagram import PhaseDiagramError
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 
-from emmet.builders.utils import HiddenPrints
-from emmet.core.thermo import ThermoDoc, PhaseDiagramDoc
+from emmet.builders.utils import (
+    chemsys_permutations,
+    HiddenPrints,
+    partition_by_cost,
+)
+from emmet.core.thermo import ThermoDoc, PhaseDiagramDoc, ThermoType
 from emmet.core.utils import jsanitize
 
 
@@ -24,6 +29,8 @@ class ThermoBuilder(Builder):
         query: Optional[Dict] = None,
         num_phase_diagram_eles: Optional[int] = None,
         chunk_size: int = 1000,
+        use_subsystem_hulls: bool = False,
+        balance_prechunk: bool = False,
         **kwargs,
     ):
         """
@@ -40,6 +47,13 @@ class ThermoBuilder(Builder):
             num_phase_diagram_eles (int): Maximum number of elements to use in phase diagram construction
                 for data within the separate phase_diagram collection
             chunk_size (int): Size of chemsys chunks to process at any one time.
+            use_subsystem_hulls (bool): Whether to hand the hulls of already processed subsystems to
+                the systems containing them, so that entries unstable within a subsystem are left out
+                when computing the parent hull. Subsystems are yielded before their parents, and only
+                hulls that reached update_targets before a parent was yielded (e.g. in an earlier
+                chunk) are used.
+            balance_prechunk (bool): Whether to split chemical systems in prechunk by the number of
+                their corrected entries instead of by count.
         """
 
         self.thermo = thermo
@@ -48,7 +62,11 @@ class ThermoBuilder(Builder):
         self.phase_diagram = phase_diagram
         self.num_phase_diagram_eles = num_phase_diagram_eles
         self.chunk_size = chunk_size
+        self.use_subsystem_hulls = use_subsystem_hulls
+        self.balance_prechunk = balance_prechunk
         self._completed_tasks: Set[str] = set()
+        self._subsystem_hulls: Dict[str, Dict] = {}
+        self._pending_parents: Dict[str, Set[str]] = {}
 
         if self.thermo.key != "thermo_id":
             warnings.warn(
@@ -113,12 +131,32 @@ class ThermoBuilder(Builder):
     def prechunk(self, number_splits: int) -> Iterator[Dict]:  # pragma: no cover
         to_process_chemsys = self._get_chemsys_to_process()
 
+        if self.balance_prechunk:
+            # The corrected entries doc of a chemsys holds the entries of all its
+            # subsystems, and each of them is placed on the phase diagram
+            costs = {chemsys: 0 for chemsys in to_process_chemsys}
+            for d in self.corrected_entries.query(
+                {self.corrected_entries.key: {"$in": to_process_chemsys}},
+                properties=[self.corrected_entries.key]
+                + [
+                    f"entries.{thermo_type.value}.entry_id"
+                    for thermo_type in ThermoType
+                ],
+            ):
+                costs[d[self.corrected_entries.key]] = sum(
+                    len(entry_list or [])
+                    for entry_list in d.get("entries", {}).values()
+                )
+            for chemsys_chunk in partition_by_cost(costs, number_splits):  # type: ignore
+                yield {"query": {"chemsys": {"$in": chemsys_chunk}}}
+            return
+
         N = ceil(len(to_process_chemsys) / number_splits)
 
         for chemsys_chunk in grouper(to_process_chemsys, N):
             yield {"query": {"chemsys": {"$in": list(chemsys_chunk)}}}
 
-    def get_items(self) -> Iterator[List[Dict]]:
+    def get_items(self) -> Iterator[Dict]:
         """
         Gets whole chemical systems of entries to process
         """
@@ -135,6 +173,10 @@ class ThermoBuilder(Builder):
         )
         self.total = len(to_process_chemsys)
 
+        if self.use_subsystem_hulls:
+            yield from self._get_items_with_subsystem_hulls(to_process_chemsys)
+            return
+
         # Yield the chemical systems in order of increasing size
         # Will build them in a similar manner to fast Pourbaix
         for chemsys in sorted(
@@ -147,7 +189,41 @@ class ThermoBuilder(Builder):
         if not item:
             return None
 
+        pd_thermo_doc_pair_list, hull_summaries = self._process_chemsys(
+            item, item.get("subsystem_hulls")
+        )
+
+        if self.use_subsystem_hulls:
+            return {
+                "chemsys": item["chemsys"],
+                "thermo_pairs": pd_thermo_doc_pair_list,
+                "hulls": hull_summaries,
+            }
+
+        return pd_thermo_doc_pair_list
+
+    def _process_chemsys(
+        self, item: Dict, subsystem_hulls: Optional[Dict[str, Dict]] = None
+    ) -> Tuple[List, Dict]:
+        """
+        Produces the thermo and phase diagram doc pairs for every thermo type of a
+        corrected entries doc
+
+        Args:
+            item (dict): corrected entries doc
+            subsystem_hulls (dict): hull summaries of already processed subsystems, keyed
+                by thermo type and then chemsys
+
+        Returns:
+            list of thermo and phase diagram doc pairs, and the hull summaries of this
+            chemsys keyed by thermo type
+        """
+        if not item:
+            return [], {}
+
+        subsystem_hulls = subsystem_hulls or {}
         pd_thermo_doc_pair_list = []
+        hull_summaries = {}
 
         for thermo_type, entry_list in item["entries"].items():
             if entry_list:
@@ -161,21 +237,72 @@ class ThermoBuilder(Builder):
                     f"Processing {len(entries)} entries for {chemsys} and thermo type {thermo_type}"
                 )
 
+                hull_entries = _prune_hull_entries(
+                    entries, subsystem_hulls.get(thermo_type, {})
+                )
+
                 with warnings.catch_warnings():
                     warnings.simplefilter("ignore")
                     with HiddenPrints():
-                        pd_thermo_doc_pair_list.append(
-                            self._produce_pair(entries, thermo_type, elements)
+                        pair, pd = self._produce_pair(
+                            entries, thermo_type, elements, hull_entries
                         )
+                        pd_thermo_doc_pair_list.append(pair)
 
-        return pd_thermo_doc_pair_list
+                if pd is not None:
+                    hull_summaries[thermo_type] = (
+                        _entries_digest(entries),
+                        {e.entry_id for e in pd.stable_entries},
+                    )
 
-    def _produce_pair(self, pd_entries, thermo_type, elements):
+        return pd_thermo_doc_pair_list, hull_summaries
+
+    def _get_items_with_subsystem_hulls(
+        self, to_process_chemsys: List[str]
+    ) -> Iterator[Dict]:
+        """
+        Yields the corrected entries docs so that every chemsys comes after its
+        subsystems, each with the hull summaries of the subsystems that have already
+        been written by update_targets.
+
+        Returns:
+            generator of corrected entries docs with their "subsystem_hulls"
+        """
+        to_process = set(to_process_chemsys)
+        subsystems = {
+            chemsys: (chemsys_permutations(chemsys) & to_process) - {chemsys}
+            for chemsys in to_process
+        }
+        self._subsystem_hulls = {}
+        self._pending_parents = {chemsys: set() for chemsys in to_process}
+        for chemsys, subs in subsystems.items():
+            for sub in subs:
+                self._pending_parents[sub].add(chemsys)
+
+        for chemsys in sorted(to_process, key=lambda x: len(x.split("-"))):
+            subsystem_hulls: Dict[str, Dict] = {}
+            for sub in subsystems[chemsys]:
+                for thermo_type, summary in self._subsystem_hulls.get(sub, {}).items():
+                    subsystem_hulls.setdefault(thermo_type, {})[sub] = summary
+
+                # Hull summaries are only needed until every parent has been yielded
+                self._pending_parents[sub].discard(chemsys)
+                if not self._pending_parents[sub]:
+                    self._subsystem_hulls.pop(sub, None)
+
+            item = self.corrected_entries.query_one({"chemsys": chemsys})
+            if item:
+                item["subsystem_hulls"] = subsystem_hulls
+            yield item
+
+    def _produce_pair(self, pd_entries, thermo_type, elements, hull_entries=None):
         # Produce thermo and phase diagram pair
 
         try:
             # Obtain phase diagram
-            pd = ThermoDoc.construct_phase_diagram(pd_entries)
+            pd = ThermoDoc.construct_phase_diagram(
+                pd_entries, hull_entries=hull_entries
+            )
 
             # Iterate through entry material IDs and construct list of thermo docs to update
             docs = ThermoDoc.from_entries(
@@ -207,7 +334,7 @@ class ThermoBuilder(Builder):
                 pd_docs,
             )
 
-            return docs_pd_pair
+            return docs_pd_pair, pd
 
         except PhaseDiagramError as p:
             elsyms = []
@@ -217,17 +344,27 @@ class ThermoBuilder(Builder):
             self.logger.error(
                 f"Phase diagram error in chemsys {'-'.join(sorted(set(elsyms)))}: {p}"
             )
-            return (None, None)
+            return (None, None), None
 
     def update_targets(self, items):
         """
         Inserts the thermo and phase diagram docs into the thermo collection
         Args:
-            items ([[tuple(List[dict],List[dict])]]): a list of a list of thermo and phase diagram dict pairs to update
+            items ([[tuple(List[dict],List[dict])]]): a list of a list of thermo and phase diagram dict pairs to update,
+                wrapped in a dict with the chemsys and its hull summaries when use_subsystem_hulls is set
         """
 
-        thermo_docs = [pair[0] for pair_list in items for pair in pair_list]
-        phase_diagram_docs = [pair[1] for pair_list in items for pair in pair_list]
+        pair_lists = []
+        for item in filter(None, items):
+            if isinstance(item, dict):
+                # Keep the hull summaries for parents that have not been yielded yet
+                if item["hulls"] and self._pending_parents.get(item["chemsys"]):
+                    self._subsystem_hulls[item["chemsys"]] = item["hulls"]
+                item = item["thermo_pairs"]
+            pair_lists.append(item)
+
+        thermo_docs = [pair[0] for pair_list in pair_lists for pair in pair_list]
+        phase_diagram_docs = [pair[1] for pair_list in pair_lists for pair in pair_list]
 
         # flatten out lists
         thermo_docs = list(filter(None, chain.from_iterable(thermo_docs)))
@@ -289,3 +426,52 @@ class ThermoBuilder(Builder):
         ]
 
         return to_process_chemsys
+
+
+def _entries_digest(entries: List[ComputedStructureEntry]) -> str:
+    """
+    Digest of the ids and corrected energies of a set of entries, used to check that
+    a subsystem hull was computed from the same entries as a parent system sees
+    """
+    return sha1(
+        "|".join(sorted(f"{e.entry_id}:{e.energy!r}" for e in entries)).encode()
+    ).hexdigest()
+
+
+def _prune_hull_entries(
+    entries: List[ComputedStructureEntry], subsystem_hulls: Dict[str, Tuple]
+) -> List[ComputedStructureEntry]:
+    """
+    Drops entries that are unstable within an already computed subsystem hull.
+    The hull of a parent system restricted to a subsystem is the hull of that
+    subsystem, so these entries can never be vertices of the parent hull.
+    Subsystems whose entries or corrected energies differ from what the parent
+    sees are ignored.
+
+    Args:
+        entries: corrected entries of the parent chemsys
+        subsystem_hulls: (entries digest, stable entry ids) keyed by subsystem chemsys
+
+    Returns:
+        entries to use for the parent hull construction
+    """
+    if not subsystem_hulls:
+        return entries
+
+    entry_elements = [
+        frozenset(el.symbol for el in e.composition.elements) for e in entries
+    ]
+    keep = [True] * len(entries)
+
+    for sub_chemsys, (digest, stable_ids) in subsystem_hulls.items():
+        sub_elements = set(sub_chemsys.split("-"))
+        in_sub = [i for i, els in enumerate(entry_elements) if els <= sub_elements]
+
+        if _entries_digest([entries[i] for i in in_sub]) != digest:
+            continue
+
+        for i in in_sub:
+            if entries[i].entry_id not in stable_ids:
+                keep[i] = False
+
+    return [e for e, k in zip(entries, keep) if k]
@@ -1,9 +1,11 @@
+from collections import defaultdict
 from datetime import datetime
 from itertools import chain
 from math import ceil
 from typing import Optional, Iterable, Iterator, List, Dict
 import copy
 
+from pymatgen.core.composition import Composition
 from pymatgen.core.structure import Molecule
 from pymatgen.util.graph_hashing import weisfeiler_lehman_graph_hash
 
@@ -44,7 +46,7 @@ class MetalBindingBuilder(Builder):
     will be used.
 
     The process is as follows:
-        1. Gather MoleculeDocs by formula
+        1. Gather MoleculeDocs by formula, along with all of the documents needed in steps 3 and 5
         2. For each molecule, first identify if there are any metals. If not, then no MetalBindingDoc can be made.
             If so, then identify the possible solvents that can be used to generate MetalBindingDocs
         3. For each combination of Molecule ID and solvent, search for additional documents:
@@ -186,12 +188,15 @@ class MetalBindingBuilder(Builder):
         for formula_chunk in grouper(to_process_forms, N):
             yield {"query": {"formula_alphabetical": {"$in": list(formula_chunk)}}}
 
-    def get_items(self) -> Iterator[List[Dict]]:
+    def get_items(self) -> Iterator[Dict]:
         """
         Gets all items to process into metal_binding documents.
 
+        Every document needed by process_item is fetched here, so that
+        process_item never has to query a store.
+
         Returns:
-            generator or list relevant molecules to process into documents
+            generator or list of relevant molecules and property documents to process into documents
         """
 
         self.logger.info("Metal binding builder started")
@@ -231,24 +236,103 @@ class MetalBindingBuilder(Builder):
             mol_query["formula_alphabetical"] = formula
             molecules = list(self.molecules.query(criteria=mol_query))
 
-            yield molecules
+            yield self._get_docs_for_formula(formula, molecules)
+
+    def _get_docs_for_formula(self, formula: str, molecules: List[Dict]) -> Dict:
+        """
+        Fetch, with a handful of "$in" queries, all documents that could be needed
+        to construct MetalBindingDocs for the molecules of a single formula
+
+        Args:
+            formula (str): Alphabetical formula shared by all molecules
+            molecules (List[Dict]): MoleculeDocs in dict form
+
+        Returns:
+            dict: the molecules, along with their charges, spins, bonds, and thermo docs,
+                thermo docs for the isolated metals, and molecule and thermo docs for the
+                molecules without one metal atom
+        """
+
+        item: Dict[str, List[Dict]] = {
+            "molecules": molecules,
+            "charges": list(),
+            "spins": list(),
+            "bonds": list(),
+            "thermo": list(),
+            "metal_thermo": list(),
+            "nometal_molecules": list(),
+            "nometal_thermo": list(),
+        }
+
+        # All molecules share a formula, so either all or none of them contain metals
+        comp = Composition(formula)
+        metal_elements = [str(e) for e in comp.elements if str(e) in metals]
+        if len(molecules) == 0 or len(metal_elements) == 0 or comp.num_atoms == 1:
+            return item
+
+        mol_ids = [m["molecule_id"] for m in molecules]
+        open_shell_ids = [
+            m["molecule_id"] for m in molecules if m["spin_multiplicity"] != 1
+        ]
+
+        item["charges"] = list(self.charges.query({"molecule_id": {"$in": mol_ids}}))
+        if len(open_shell_ids) > 0:
+            item["spins"] = list(
+                self.spins.query({"molecule_id": {"$in": open_shell_ids}})
+            )
+        item["bonds"] = list(self.bonds.query({"molecule_id": {"$in": mol_ids}}))
+        item["thermo"] = list(self.thermo.query({"molecule_id": {"$in": mol_ids}}))
+
+        item["metal_thermo"] = list(
+            self.thermo.query(
+                {"formula_alphabetical": {"$in": [f"{m}1" for m in metal_elements]}}
+            )
+        )
+
+        nometal_formulas = [
+            (comp - Composition({m: 1})).alphabetical_formula for m in metal_elements
+        ]
+        item["nometal_molecules"] = list(
+            self.molecules.query(
+                {"formula_alphabetical": {"$in": nometal_formulas}},
+                ["molecule_id", "species_hash", "charge", "spin_multiplicity"],
+            )
+        )
+        if len(item["nometal_molecules"]) > 0:
+            item["nometal_thermo"] = list(
+                self.thermo.query(
+                    {
+                        "molecule_id": {
+                            "$in": [m["molecule_id"] for m in item["nometal_molecules"]]
+                        }
+                    }
+                )
+            )
 
-    def process_item(self, items: List[Dict]) -> List[Dict]:
+        return item
+
+    def process_item(self, item: Dict) -> List[Dict]:
         """
         Process molecule, bonding, partial charges, partial spins, and thermo documents into MetalBindingDocs
 
         Args:
-            tasks List[Dict] : a list of MoleculeDocs in dict form
+            item Dict : MoleculeDocs and property documents for one formula, as produced by get_items
 
         Returns:
             [dict] : a list of new metal binding docs
         """
 
-        mols = [MoleculeDoc(**item) for item in items]
+        mols = [MoleculeDoc(**e) for e in item["molecules"]]
         formula = mols[0].formula_alphabetical
         mol_ids = [m.molecule_id for m in mols]
         self.logger.debug(f"Processing {formula} : {mol_ids}")
 
+        docs_by_id: Dict[str, Dict[str, List[Dict]]] = dict()
+        for name in ["charges", "spins", "bonds", "thermo"]:
+            docs_by_id[name] = defaultdict(list)
+            for e in item[name]:
+                docs_by_id[name][e["molecule_id"]].append(e)
+
         binding_docs = list()
 
         for mol in mols:
@@ -263,24 +347,14 @@ class MetalBindingBuilder(Builder):
             molecule_id = mol.molecule_id
             solvents = mol.unique_solvents
             charges = [
-                PartialChargesDoc(**e)
-                for e in self.charges.query({"molecule_id": molecule_id})
+                PartialChargesDoc(**e) for e in docs_by_id["charges"][molecule_id]
             ]
             if mol.spin_multiplicity != 1:
-                spins = [
-                    PartialSpinsDoc(**e)
-                    for e in self.spins.query({"molecule_id": molecule_id})
-                ]
+                spins = [PartialSpinsDoc(**e) for e in docs_by_id["spins"][molecule_id]]
             else:
                 spins = list()
-            bonds = [
-                MoleculeBondingDoc(**e)
-                for e in self.bonds.query({"molecule_id": molecule_id})
-            ]
-            thermo = [
-                MoleculeThermoDoc(**e)
-                for e in self.thermo.query({"molecule_id": molecule_id})
-            ]
+            bonds = [MoleculeBondingDoc(**e) for e in docs_by_id["bonds"][molecule_id]]
+            thermo = [MoleculeThermoDoc(**e) for e in docs_by_id["thermo"][molecule_id]]
 
             if any([len(x) == 0 for x in [charges, bonds, thermo]]):
                 # Not enough information to construct MetalBindingDoc
@@ -416,22 +490,23 @@ class MetalBindingBuilder(Builder):
                                 charge -= 1
 
                         # Grab thermo doc for the relevant metal ion/atom (if available)
-                        this_metal_thermo = [
-                            MoleculeThermoDoc(**e)
-                            for e in self.thermo.query(
-                                {
-                                    "formula_alphabetical": f"{metal_species}1",
-                                    "charge": charge,
-                                    "spin_multiplicity": spin,
-                                    "lot_solvent": base_thermo_doc.lot_solvent,  # type: ignore
-                                }
-                            )
-                        ]
-                        if len(this_metal_thermo) == 0:
+                        this_metal_thermo = next(
+                            (
+                                e
+                                for e in item["metal_thermo"]
+                                if e["formula_alphabetical"] == f"{metal_species}1"
+                                and e["charge"] == charge
+                                and e["spin_multiplicity"] == spin
+                                and e["lot_solvent"] == base_thermo_doc.lot_solvent  # type: ignore
+                            ),
+                            None,
+                        )
+                        if this_metal_thermo is None:
                             continue
 
-                        this_metal_thermo = this_metal_thermo[0]
-                        metal_thermo[metal_index] = this_metal_thermo
+                        metal_thermo[metal_index] = MoleculeThermoDoc(
+                            **this_metal_thermo
+                        )
 
                         # Now the (somewhat) harder part - finding the document for this molecule without the metal
                         # Make sure charges and spins add up
@@ -442,34 +517,34 @@ class MetalBindingBuilder(Builder):
                         new_hash = weisfeiler_lehman_graph_hash(
                             mg_copy.graph.to_undirected(), node_attr="specie"
                         )
-                        nometal_mol_doc = [
-                            MoleculeDoc(**e)
-                            for e in self.molecules.query(
-                                {
-                                    "species_hash": new_hash,
-                                    "charge": nometal_charge,
-                                    "spin_multiplicity": nometal_spin,
-                                }
-                            )
-                        ]
-                        if len(nometal_mol_doc) == 0:
+                        nometal_mol_id = next(
+                            (
+                                e["molecule_id"]
+                                for e in item["nometal_molecules"]
+                                if e["species_hash"] == new_hash
+                                and e["charge"] == nometal_charge
+                                and e["spin_multiplicity"] == nometal_spin
+                            ),
+                            None,
+                        )
+                        if nometal_mol_id is None:
                             continue
 
-                        nometal_mol_id = nometal_mol_doc[0].molecule_id
-                        this_nometal_thermo = [
-                            MoleculeThermoDoc(**e)
-                            for e in self.thermo.query(
-                                {
-                                    "molecule_id": nometal_mol_id,
-                                    "lot_solvent": base_thermo_doc.lot_solvent,  # type: ignore
-                                }
-                            )
-                        ]
-                        if len(this_nometal_thermo) == 0:
+                        this_nometal_thermo = next(
+                            (
+                                e
+                                for e in item["nometal_thermo"]
+                                if e["molecule_id"] == nometal_mol_id
+                                and e["lot_solvent"] == base_thermo_doc.lot_solvent  # type: ignore
+                            ),
+                            None,
+                        )
+                        if this_nometal_thermo is None:
                             continue
 
-                        this_nometal_thermo = this_nometal_thermo[0]
-                        nometal_thermo[metal_index] = this_nometal_thermo
+                        nometal_thermo[metal_index] = MoleculeThermoDoc(
+                            **this_nometal_thermo
+                        )
 
                     doc = MetalBindingDoc.from_docs(
                         method=method,
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from datetime import datetime
 from itertools import chain
 from math import ceil
@@ -25,7 +26,7 @@ class SummaryBuilder(Builder):
     into a single MoleculeSummaryDoc
 
     The process is as follows:
-        1. Gather MoleculeDocs by formula
+        1. Gather MoleculeDocs by formula, along with all of their property docs
         2. For each doc, grab the relevant property docs
         3. Convert property docs to MoleculeSummaryDoc
     """
@@ -210,14 +211,17 @@ class SummaryBuilder(Builder):
         for formula_chunk in grouper(to_process_forms, N):
             yield {"query": {"formula_alphabetical": {"$in": list(formula_chunk)}}}
 
-    def get_items(self) -> Iterator[List[Dict]]:
+    def get_items(self) -> Iterator[Dict]:
         """
         Gets all items to process into summary documents.
         This does no datetime checking; relying on on whether
         task_ids are included in the summary Store
 
+        The property docs of all molecules with the same formula are fetched
+        together, so that process_item never has to query a store.
+
         Returns:
-            generator or list relevant tasks and molecules to process into documents
+            generator or list relevant molecules and property docs to process into documents
         """
 
         self.logger.info("Summary builder started")
@@ -257,14 +261,28 @@ class SummaryBuilder(Builder):
             mol_query["formula_alphabetical"] = formula
             molecules = list(self.molecules.query(criteria=mol_query))
 
-            yield molecules
-
-    def process_item(self, items: List[Dict]) -> List[Dict]:
+            mol_ids = [m["molecule_id"] for m in molecules]
+            item: Dict[str, List[Dict]] = {"molecules": molecules}
+            for name, store in [
+                ("partial_charges", self.charges),
+                ("partial_spins", self.spins),
+                ("bonding", self.bonds),
+                ("metal_binding", self.metal_binding),
+                ("orbitals", self.orbitals),
+                ("redox", self.redox),
+                ("thermo", self.thermo),
+                ("vibration", self.vibes),
+            ]:
+                item[name] = list(store.query({"molecule_id": {"$in": mol_ids}}))
+
+            yield item
+
+    def process_item(self, item: Dict) -> List[Dict]:
         """
         Process the tasks into a MoleculeSummaryDoc
 
         Args:
-            tasks List[Dict] : a list of MoleculeDocs in dict form
+            item Dict : MoleculeDocs and their property docs for one formula, as produced by get_items
 
         Returns:
             [dict] : a list of new orbital docs
@@ -294,43 +312,35 @@ class SummaryBuilder(Builder):
 
             return (grouped, by_method)
 
-        mols = items
+        mols = item["molecules"]
         formula = mols[0]["formula_alphabetical"]
         mol_ids = [m["molecule_id"] for m in mols]
         self.logger.debug(f"Processing {formula} : {mol_ids}")
 
+        by_method = {
+            "partial_charges": True,
+            "partial_spins": True,
+            "bonding": True,
+            "metal_binding": True,
+            "orbitals": False,
+            "redox": False,
+            "thermo": False,
+            "vibration": False,
+        }
+        docs_by_id: Dict[str, Dict[str, List[Dict]]] = dict()
+        for name in by_method:
+            docs_by_id[name] = defaultdict(list)
+            for doc in item[name]:
+                docs_by_id[name][doc["molecule_id"]].append(doc)
+
         summary_docs = list()
 
         for mol in mols:
             mol_id = mol["molecule_id"]
 
-            d = {
-                "molecules": mol,
-                "partial_charges": _group_docs(
-                    list(self.charges.query({"molecule_id": mol_id})), True
-                ),
-                "partial_spins": _group_docs(
-                    list(self.spins.query({"molecule_id": mol_id})), True
-                ),
-                "bonding": _group_docs(
-                    list(self.bonds.query({"molecule_id": mol_id})), True
-                ),
-                "metal_binding": _group_docs(
-                    list(self.metal_binding.query({"molecule_id": mol_id})), True
-                ),
-                "orbitals": _group_docs(
-                    list(self.orbitals.query({"molecule_id": mol_id})), False
-                ),
-                "redox": _group_docs(
-                    list(self.redox.query({"molecule_id": mol_id})), False
-                ),
-                "thermo": _group_docs(
-                    list(self.thermo.query({"molecule_id": mol_id})), False
-                ),
-                "vibration": _group_docs(
-                    list(self.vibes.query({"molecule_id": mol_id})), False
-                ),
-            }
+            d: Dict[str, Any] = {"molecules": mol}
+            for name, group_by_method in by_method.items():
+                d[name] = _group_docs(docs_by_id[name][mol_id], group_by_method)
 
             to_delete = list()
 
@@ -190,12 +190,15 @@ class ThermoBuilder(Builder):
         for formula_chunk in grouper(to_process_forms, N):
             yield {"query": {"formula_alphabetical": {"$in": list(formula_chunk)}}}
 
-    def get_items(self) -> Iterator[List[Dict]]:
+    def get_items(self) -> Iterator[Dict]:
         """
         Gets all items to process into thermo documents.
         This does no datetime checking; relying on on whether
         task_ids are included in the thermo Store
 
+        All tasks referenced by the molecules of a formula are fetched together,
+        so that process_item never has to query a store.
+
         Returns:
             generator or list relevant tasks and molecules to process into documents
         """
@@ -232,19 +235,61 @@ class ThermoBuilder(Builder):
         # Set total for builder bars to have a total
         self.total = len(to_process_forms)
 
+        projected_fields = [
+            "task_id",
+            "formula_alphabetical",
+            "charge",
+            "spin_multiplicity",
+            # needed for level of theory and solvent
+            "orig",
+            "custom_smd",
+            "special_run_type",
+            # needed for MoleculeThermoDoc.from_task
+            "output.initial_molecule",
+            "output.optimized_molecule",
+            "output.final_energy",
+            "output.enthalpy",
+            "output.entropy",
+            "calcs_reversed.ZPE",
+            "calcs_reversed.trans_enthalpy",
+            "calcs_reversed.rot_enthalpy",
+            "calcs_reversed.vib_enthalpy",
+            "calcs_reversed.gas_constant",
+            "calcs_reversed.trans_entropy",
+            "calcs_reversed.rot_entropy",
+            "calcs_reversed.vib_entropy",
+        ]
+
         for formula in to_process_forms:
             mol_query = dict(temp_query)
             mol_query["formula_alphabetical"] = formula
             molecules = list(self.molecules.query(criteria=mol_query))
 
-            yield molecules
+            # Task IDs can be stored as either strings or ints
+            task_ids = set()
+            for mol in molecules:
+                for entry in mol["entries"]:
+                    task_ids.add(entry["task_id"])
+                    try:
+                        task_ids.add(int(entry["task_id"]))
+                    except ValueError:
+                        pass
 
-    def process_item(self, items: List[Dict]) -> List[Dict]:
+            tasks = list(
+                self.tasks.query(
+                    criteria={"task_id": {"$in": list(task_ids)}},
+                    properties=projected_fields,
+                )
+            )
+
+            yield {"molecules": molecules, "tasks": tasks}
+
+    def process_item(self, item: Dict) -> List[Dict]:
         """
         Process the tasks into a MoleculeThermoDoc
 
         Args:
-            items List[dict] : a list of MoleculeDocs in dict form
+            item dict : MoleculeDocs in dict form and the tasks they reference, as produced by get_items
 
         Returns:
             [dict] : a list of new thermo docs
@@ -272,7 +317,30 @@ class ThermoBuilder(Builder):
                         )
             return doc
 
-        mols = [MoleculeDoc(**item) for item in items]
+        tasks_by_id = {t["task_id"]: t for t in item["tasks"]}
+
+        def _get_task(task_id, formula: Optional[str] = None) -> Optional[Dict]:
+            """
+            Look up a task by its ID, falling back on an integer ID. If a formula is
+            given, only tasks with that formula and an "orig" field are considered.
+            """
+            candidates = [tasks_by_id.get(task_id)]
+            try:
+                candidates.append(tasks_by_id.get(int(task_id)))
+            except ValueError:
+                pass
+
+            for tdoc in candidates:
+                if tdoc is None:
+                    continue
+                if formula is not None and (
+                    tdoc.get("formula_alphabetical") != formula or "orig" not in tdoc
+                ):
+                    continue
+                return tdoc
+            return None
+
+        mols = [MoleculeDoc(**e) for e in item["molecules"]]
         formula = mols[0].formula_alphabetical
         mol_ids = [m.molecule_id for m in mols]
         self.logger.debug(f"Processing {formula} : {mol_ids}")
@@ -331,25 +399,7 @@ class ThermoBuilder(Builder):
                 )[0]
                 task = best["task_id"]
 
-                tdoc = self.tasks.query_one(
-                    {
-                        "task_id": task,
-                        "formula_alphabetical": formula,
-                        "orig": {"$exists": True},
-                    }
-                )
-
-                if tdoc is None:
-                    try:
-                        tdoc = self.tasks.query_one(
-                            {
-                                "task_id": int(task),
-                                "formula_alphabetical": formula,
-                                "orig": {"$exists": True},
-                            }
-                        )
-                    except ValueError:
-                        tdoc = None
+                tdoc = _get_task(task, formula=formula)
 
                 if tdoc is None:
                     continue
@@ -400,19 +450,8 @@ class ThermoBuilder(Builder):
                     )[0]
                     task_dict = best_dict["task_id"]
 
-                    tdict = self.tasks.query_one({"task_id": task_dict})
-                    if tdict is None:
-                        try:
-                            tdict = self.tasks.query_one({"task_id": int(task_dict)})
-                        except ValueError:
-                            tdict = None
-
-                    tspec = self.tasks.query_one({"task_id": task_spec})
-                    if tspec is None:
-                        try:
-                            tspec = self.tasks.query_one({"task_id": int(task_spec)})
-                        except ValueError:
-                            tspec = None
+                    tdict = _get_task(task_dict)
+                    tspec = _get_task(task_spec)
 
                     if tdict is None or tspec is None:
                         continue
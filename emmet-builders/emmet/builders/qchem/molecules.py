@@ -10,7 +10,12 @@ from maggma.stores import Store
 from maggma.utils import grouper
 
 from emmet.builders.settings import EmmetBuildSettings
-from emmet.core.utils import get_molecule_id, group_molecules, jsanitize, make_mol_graph
+from emmet.core.utils import (
+    get_molecule_id,
+    group_molecules,
+    jsanitize,
+    make_mol_graphs,
+)
 from emmet.core.qchem.molecule import (
     best_lot,
     evaluate_lot,
@@ -698,14 +703,20 @@ class MoleculesBuilder(Builder):
         # First, group by charge, spin multiplicity
         # Then group by graph isomorphism, using OpenBabelNN + metal_edge_extender
 
-        def charge_spin(mol_doc):
-            return (mol_doc.charge, mol_doc.spin_multiplicity)
+        def charge_spin(index):
+            return (assoc[index].charge, assoc[index].spin_multiplicity)
+
+        # Build all graphs at once; geometries seen before come from the cache
+        mol_graphs = make_mol_graphs([mol_doc.molecule for mol_doc in assoc])
 
         # Group by charge and spin
-        for c_s, group in groupby(sorted(assoc, key=charge_spin), key=charge_spin):
+        for c_s, group in groupby(
+            sorted(range(len(assoc)), key=charge_spin), key=charge_spin
+        ):
             subgroups: List[Dict[str, Any]] = list()
-            for mol_doc in group:
-                mol_graph = make_mol_graph(mol_doc.molecule)
+            for index in group:
+                mol_doc = assoc[index]
+                mol_graph = mol_graphs[index]
                 mol_hash = mol_doc.species_hash
 
                 # Finally, group by graph isomorphism
@@ -1,7 +1,7 @@
 """
 Settings for defaults in the build pipelines for the Materials Project
 """
-from typing import List
+from typing import List, Optional
 
 from pydantic.fields import Field
 
@@ -30,6 +30,11 @@ class EmmetBuildSettings(EmmetSettings):
         [], description="Tags for calculations to deprecate"
     )
 
+    VASP_POTCAR_HASH_CACHE_FILE: Optional[str] = Field(
+        "~/.cache/emmet/potcar_hashes.json",
+        description="JSON file caching the POTCAR hashes used to validate tasks. Set to None to disable the cache",
+    )
+
     VASP_ALLOWED_VASP_TYPES: List[VaspTaskType] = Field(
         [t.value for t in VaspTaskType],
         description="Allowed task_types to build materials from",
@@ -1,6 +1,10 @@
-from typing import Set, Union
+from collections import OrderedDict
+from typing import Dict, Hashable, List, Optional, Set, Union
+import heapq
+import pickle
 import sys
 import os
+import zlib
 from itertools import chain, combinations
 from pymatgen.core import Structure
 from pymatgen.analysis.diffusion.neb.full_path_mapper import MigrationGraph
@@ -46,6 +50,118 @@ def chemsys_permutations(chemsys) -> Set:
     }
 
 
+def chemsys_costs(chemsys_list, counts: Dict[str, int]) -> Dict[str, int]:
+    """
+    Estimates the work for each chemical system as the number of documents
+    in it and all of its subsystems
+
+    chemsys_list ([str]): chemical systems to estimate the work for
+    counts (dict): number of documents keyed by their own chemical system
+    """
+    return {
+        chemsys: sum(counts.get(sub, 0) for sub in chemsys_permutations(chemsys))
+        for chemsys in chemsys_list
+    }
+
+
+def partition_by_cost(
+    costs: Dict[Hashable, float], number_splits: int
+) -> List[List[Hashable]]:
+    """
+    Splits keys into at most number_splits chunks of roughly equal total cost.
+    Keys are handed out from the most to the least expensive, each to the chunk
+    with the lowest total so far, so a few very expensive keys end up on their own
+    rather than alongside an equal share of the remaining keys
+
+    costs (dict): estimated cost of processing each key
+    number_splits (int): maximum number of chunks to return
+    """
+    number_splits = max(1, min(number_splits, len(costs)))
+    chunks: List[List[Hashable]] = [[] for _ in range(number_splits)]
+    heap = [(0.0, i) for i in range(number_splits)]
+
+    for key in sorted(costs, key=costs.get, reverse=True):  # type: ignore
+        total, i = heapq.heappop(heap)
+        chunks[i].append(key)
+        heapq.heappush(heap, (total + max(costs[key], 1), i))
+
+    return [chunk for chunk in chunks if chunk]
+
+
+class EntriesCache:
+    """
+    LRU cache of entry dicts grouped by chemical system. Entries are held as
+    compressed pickles and the least recently used chemical systems are evicted
+    once the compressed size exceeds the memory budget.
+    """
+
+    def __init__(self, max_size: int = 1024**3, compress_level: int = 1):
+        """
+        Args:
+            max_size (int): Memory budget for the compressed entries in bytes
+            compress_level (int): zlib compression level
+        """
+        self.max_size = max_size
+        self.compress_level = compress_level
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def __contains__(self, chemsys: str) -> bool:
+        return chemsys in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, chemsys: str) -> Optional[List[Dict]]:
+        """
+        Returns a fresh copy of the entries cached for a chemical system,
+        or None if the chemical system is not cached
+        """
+        if chemsys not in self._data:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._data.move_to_end(chemsys)
+        return pickle.loads(zlib.decompress(self._data[chemsys]))
+
+    def put(self, chemsys: str, entries: List[Dict]):
+        """
+        Caches the entries of a chemical system, evicting the least recently
+        used chemical systems if needed
+        """
+        if chemsys in self._data:
+            self.size -= len(self._data.pop(chemsys))
+
+        data = zlib.compress(
+            pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL),
+            self.compress_level,
+        )
+        if len(data) > self.max_size:
+            return
+
+        self._data[chemsys] = data
+        self.size += len(data)
+
+        while self.size > self.max_size:
+            _, evicted = self._data.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def clear(self):
+        self._data.clear()
+        self.size = 0
+
+    def stats(self) -> str:
+        return (
+            f"{len(self)} chemsys ({self.size / 1024**2:.1f} MB), "
+            f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions"
+        )
+
+
 def get_hop_cutoff(
     migration_graph_struct: Structure,
     mobile_specie: str,
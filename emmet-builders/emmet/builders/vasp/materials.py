@@ -1,6 +1,8 @@
+from collections import defaultdict
 from datetime import datetime
-from itertools import chain
+from itertools import chain, groupby
 from math import ceil
+from operator import itemgetter
 from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 from maggma.builders import Builder
@@ -13,6 +15,7 @@ from pymatgen.transformations.standard_transformations import (
 )
 
 from emmet.builders.settings import EmmetBuildSettings
+from emmet.builders.utils import partition_by_cost
 from emmet.core.utils import group_structures, jsanitize
 from emmet.core.vasp.calc_types import TaskType
 from emmet.core.vasp.material import MaterialsDoc
@@ -46,6 +49,8 @@ class MaterialsBuilder(Builder):
         task_validation: Optional[Store] = None,
         query: Optional[Dict] = None,
         settings: Optional[EmmetBuildSettings] = None,
+        stream_tasks: bool = False,
+        balance_prechunk: bool = False,
         **kwargs,
     ):
         """
@@ -55,6 +60,10 @@ class MaterialsBuilder(Builder):
             task_validation: Store for storing task validation results
             query: dictionary to limit tasks to be analyzed
             settings: EmmetSettings to use in the build process
+            stream_tasks: fetch the tasks for all unprocessed formulas through a
+                single cursor sorted by formula instead of one query per formula
+            balance_prechunk: split formulas in prechunk by the estimated structure
+                matching work, from their task counts and sizes, instead of by count
         """
 
         self.tasks = tasks
@@ -62,6 +71,8 @@ class MaterialsBuilder(Builder):
         self.task_validation = task_validation
         self.query = query if query else {}
         self.settings = EmmetBuildSettings.autoload(settings)
+        self.stream_tasks = stream_tasks
+        self.balance_prechunk = balance_prechunk
         self.kwargs = kwargs
 
         sources = [tasks]
@@ -102,9 +113,10 @@ class MaterialsBuilder(Builder):
             temp_query["tags"] = {"$in": self.settings.BUILD_TAGS}
 
         self.logger.info("Finding tasks to process")
-        all_tasks = list(
-            self.tasks.query(temp_query, [self.tasks.key, "formula_pretty"])
-        )
+        properties = [self.tasks.key, "formula_pretty"]
+        if self.balance_prechunk:
+            properties.append("nsites")
+        all_tasks = list(self.tasks.query(temp_query, properties))
 
         processed_tasks = set(self.materials.distinct("task_ids"))
         to_process_tasks = {d[self.tasks.key] for d in all_tasks} - processed_tasks
@@ -114,6 +126,22 @@ class MaterialsBuilder(Builder):
             if d[self.tasks.key] in to_process_tasks
         }
 
+        if self.balance_prechunk:
+            # Every task of a formula is matched against the others
+            num_tasks: Dict[str, int] = defaultdict(int)
+            num_sites: Dict[str, int] = defaultdict(int)
+            for d in all_tasks:
+                if d["formula_pretty"] in to_process_forms:
+                    num_tasks[d["formula_pretty"]] += 1
+                    num_sites[d["formula_pretty"]] += d.get("nsites") or 1
+            costs = {
+                formula: num_tasks[formula] * num_sites[formula]
+                for formula in to_process_forms
+            }
+            for formula_chunk in partition_by_cost(costs, number_splits):
+                yield {"query": {"formula_pretty": {"$in": formula_chunk}}}
+            return
+
         N = ceil(len(to_process_forms) / number_splits)
 
         for formula_chunk in grouper(to_process_forms, N):
@@ -204,12 +232,30 @@ class MaterialsBuilder(Builder):
             "tags",
         ]
 
-        for formula in to_process_forms:
+        if self.stream_tasks:
             tasks_query = dict(temp_query)
-            tasks_query["formula_pretty"] = formula
-            tasks = list(
-                self.tasks.query(criteria=tasks_query, properties=projected_fields)
+            tasks_query["formula_pretty"] = {"$in": list(to_process_forms)}
+            cursor = self.tasks.query(
+                criteria=tasks_query,
+                properties=projected_fields,
+                sort={"formula_pretty": 1},
+            )
+            task_groups: Iterable = (
+                list(tasks)
+                for _, tasks in groupby(cursor, key=itemgetter("formula_pretty"))
             )
+        else:
+            task_groups = (
+                list(
+                    self.tasks.query(
+                        criteria=dict(temp_query, formula_pretty=formula),
+                        properties=projected_fields,
+                    )
+                )
+                for formula in to_process_forms
+            )
+
+        for tasks in task_groups:
             for t in tasks:
                 t["is_valid"] = t[self.tasks.key] not in invalid_ids
 
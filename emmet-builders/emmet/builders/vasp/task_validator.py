@@ -1,5 +1,8 @@
-from typing import Dict, Optional
-from collections import defaultdict
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
 
 from maggma.builders import MapBuilder
 from maggma.core import Store
@@ -9,6 +12,9 @@ from emmet.core.vasp.task_valid import TaskDocument
 from emmet.core.vasp.calc_types.enums import CalcType
 from emmet.core.vasp.validation import DeprecationMessage, ValidationDoc
 
+# Bump to discard existing on-disk POTCAR hash caches
+_POTCAR_HASH_CACHE_VERSION = 1
+
 
 class TaskValidator(MapBuilder):
     def __init__(
@@ -39,22 +45,10 @@ class TaskValidator(MapBuilder):
         # Set up potcar cache if appropriate
         if self.settings.VASP_VALIDATE_POTCAR_HASHES:
             if not self.potcar_hashes:
-                from pymatgen.io.vasp.inputs import PotcarSingle
-
-                hashes = defaultdict(dict)  # type: dict
-
-                for (
-                    calc_type,
-                    input_set,
-                ) in self.settings.VASP_DEFAULT_INPUT_SETS.items():
-                    functional = input_set.CONFIG["POTCAR_FUNCTIONAL"]
-                    for potcar_symbol in input_set.CONFIG["POTCAR"].values():
-                        potcar = PotcarSingle.from_symbol_and_functional(
-                            symbol=potcar_symbol, functional=functional
-                        )
-                        hashes[calc_type][potcar_symbol] = potcar.get_potcar_hash()
-
-                self.potcar_hashes = potcar_hashes
+                self.potcar_hashes = get_potcar_hashes(
+                    self.settings.VASP_DEFAULT_INPUT_SETS,
+                    cache_file=self.settings.VASP_POTCAR_HASH_CACHE_FILE,
+                )
         else:
             self.potcar_hashes = None
 
@@ -98,3 +92,112 @@ class TaskValidator(MapBuilder):
             validation_doc.reasons.append(DeprecationMessage.MANUAL)
 
         return validation_doc
+
+
+def get_potcar_hashes(
+    input_sets: Dict[str, Any], cache_file: Optional[str] = None
+) -> Dict[str, Dict[str, str]]:
+    """
+    Hashes of the POTCARs used by each input set
+
+    Every POTCAR is only read and hashed once per functional. If a cache file
+    is given, hashes are read from and written to it. The hashes of a functional
+    are recomputed whenever its POTCAR directory changes (any file added, removed,
+    resized or touched) or pymatgen is upgraded. The file is replaced atomically,
+    so it can be shared by concurrent processes.
+
+    Args:
+        input_sets: dictionary of calc_types -> pymatgen input set
+        cache_file: optional path to the JSON file caching the hashes
+
+    Returns:
+        Mapping of calculation type -> potcar symbol -> hash value
+    """
+    from pymatgen.io.vasp.inputs import PotcarSingle
+
+    symbols_by_functional: Dict[str, set] = dict()
+    for input_set in input_sets.values():
+        functional = input_set.CONFIG["POTCAR_FUNCTIONAL"]
+        symbols_by_functional.setdefault(functional, set()).update(
+            input_set.CONFIG["POTCAR"].values()
+        )
+
+    cache_path = os.path.expanduser(cache_file) if cache_file else None
+    cache: Dict = {"version": _POTCAR_HASH_CACHE_VERSION, "functionals": {}}
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path) as f:
+                cached = json.load(f)
+            if cached.get("version") == _POTCAR_HASH_CACHE_VERSION:
+                cache = cached
+        except (OSError, ValueError):
+            pass
+
+    updated = False
+    for functional, symbols in symbols_by_functional.items():
+        fingerprint = _get_potcar_dir_fingerprint(functional)
+        entry = cache["functionals"].get(functional, {})
+        if fingerprint is None or entry.get("fingerprint") != fingerprint:
+            entry = {"fingerprint": fingerprint, "hashes": {}}
+
+        for symbol in sorted(symbols - set(entry["hashes"])):
+            potcar = PotcarSingle.from_symbol_and_functional(
+                symbol=symbol, functional=functional
+            )
+            entry["hashes"][symbol] = potcar.get_potcar_hash()
+            updated = True
+
+        cache["functionals"][functional] = entry
+
+    if cache_path and updated:
+        # The cache is only an optimization, so failing to write it is not an error
+        try:
+            cache_dir = os.path.dirname(os.path.abspath(cache_path))
+            os.makedirs(cache_dir, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=cache_dir, suffix=".tmp", delete=False
+            ) as tmp_file:
+                json.dump(cache, tmp_file)
+            os.replace(tmp_file.name, cache_path)
+        except OSError:
+            pass
+
+    return {
+        calc_type: {
+            symbol: cache["functionals"][input_set.CONFIG["POTCAR_FUNCTIONAL"]][
+                "hashes"
+            ][symbol]
+            for symbol in input_set.CONFIG["POTCAR"].values()
+        }
+        for calc_type, input_set in input_sets.items()
+    }
+
+
+def _get_potcar_dir_fingerprint(functional: str) -> Optional[str]:
+    """
+    Fingerprint of the POTCAR directory of a functional, built from the pymatgen
+    version and the path, size and modification time of every file in it.
+    Returns None if no POTCAR directory is configured
+    """
+    from pymatgen.core import SETTINGS as PMG_SETTINGS, __version__
+    from pymatgen.io.vasp.inputs import PotcarSingle
+
+    psp_dir = PMG_SETTINGS.get("PMG_VASP_PSP_DIR")
+    if psp_dir is None or functional not in PotcarSingle.functional_dir:
+        return None
+
+    func_dir = os.path.abspath(
+        os.path.join(
+            os.path.expanduser(psp_dir), PotcarSingle.functional_dir[functional]
+        )
+    )
+    sha = hashlib.sha1(f"{__version__}:{func_dir}".encode())
+    for root, dirs, files in os.walk(func_dir):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            sha.update(
+                f"{os.path.relpath(path, func_dir)}:{stat.st_size}:{stat.st_mtime_ns}".encode()
+            )
+    return sha.hexdigest()
@@ -37,3 +37,32 @@ def test_thermo_builder(tasks_store, mol_store, thermo_store):
 
     assert thermo_store.count() == 20
     assert thermo_store.count({"vibrational_enthalpy": None}) == 0
+
+
+def test_thermo_builder_projected_tasks(tasks_store, mol_store):
+    builder = ThermoBuilder(tasks_store, mol_store, MemoryStore())
+    builder.connect()
+
+    def strip_timestamps(docs):
+        for doc in docs:
+            doc.pop("last_updated")
+            doc.pop("_bt", None)
+            doc["builder_meta"].pop("build_date")
+            for origin in doc["origins"]:
+                origin.pop("last_updated")
+        return sorted(docs, key=lambda doc: doc["property_id"])
+
+    ndocs = 0
+    for item in builder.get_items():
+        task_ids = [task["task_id"] for task in item["tasks"]]
+        full_tasks = list(tasks_store.query({"task_id": {"$in": task_ids}}))
+        assert len(full_tasks) == len(item["tasks"])
+
+        docs = builder.process_item(item)
+        full_docs = builder.process_item(
+            {"molecules": item["molecules"], "tasks": full_tasks}
+        )
+        assert strip_timestamps(docs) == strip_timestamps(full_docs)
+        ndocs += len(docs)
+
+    assert ndocs == 20
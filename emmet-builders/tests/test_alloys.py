@@ -0,0 +1,186 @@
+import importlib
+from itertools import combinations
+
+import pandas as pd
+import pytest
+from maggma.stores import MemoryStore
+from pymatgen.analysis.alloys.core import AlloyPair
+from pymatgen.core import Lattice, Structure
+
+
+@pytest.fixture(scope="module")
+def alloys():
+    # the BoltzTraP effective masses are downloaded when the module is imported
+    import matminer.datasets
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            matminer.datasets,
+            "load_dataset",
+            lambda name: pd.DataFrame(columns=["mpid", "m_n", "m_p"]),
+        )
+        yield importlib.import_module("emmet.builders.materials.alloys")
+
+
+def zincblende(cation, anion, a):
+    return Structure.from_spacegroup(
+        "F-43m", Lattice.cubic(a), [cation, anion], [[0, 0, 0], [0.25, 0.25, 0.25]]
+    )
+
+
+@pytest.fixture
+def structures():
+    return {
+        "mp-1": zincblende("Ga", "As", 5.65),
+        "mp-2": zincblende("Al", "As", 5.66),
+        "mp-3": zincblende("Ga", "P", 5.45),
+        "mp-4": Structure.from_spacegroup(
+            "Fm-3m", Lattice.cubic(5.64), ["Na", "Cl"], [[0, 0, 0], [0.5, 0.5, 0.5]]
+        ),
+    }
+
+
+def test_get_candidate_pairs(alloys):
+    docs = {
+        f"mp-{i}": {"symmetry": {"number": number}, "spacegroup_loose": loose}
+        for i, (number, loose) in enumerate(
+            [(216, 216), (216, 216), (216, 225), (225, 225), (225, 216), (1, 2)]
+        )
+    }
+
+    pairs = list(alloys._get_candidate_pairs(docs))
+    assert len(pairs) == len(set(pairs))
+    assert {frozenset(pair) for pair in pairs} == {
+        frozenset((a, b))
+        for a, b in combinations(docs, 2)
+        if docs[a]["symmetry"]["number"] == docs[b]["symmetry"]["number"]
+        or docs[a]["spacegroup_loose"] == docs[b]["spacegroup_loose"]
+    }
+
+
+@pytest.fixture
+def alloy_pair_builder(alloys, structures):
+    materials = MemoryStore(key="material_id")
+    thermo = MemoryStore(key="thermo_id")
+    materials.connect()
+    thermo.connect()
+    for material_id, structure in structures.items():
+        materials.update(
+            {
+                "material_id": material_id,
+                "structure": structure.as_dict(),
+                "formula_anonymous": structure.composition.anonymized_formula,
+                "symmetry": {"number": structure.get_space_group_info()[1]},
+                "deprecated": False,
+            }
+        )
+        thermo.update(
+            {
+                "thermo_id": f"{material_id}_GGA_GGA+U_R2SCAN",
+                "material_id": material_id,
+                "thermo_type": "GGA_GGA+U_R2SCAN",
+                "energy_above_hull": 0.0,
+                "formation_energy_per_atom": -0.5,
+            }
+        )
+
+    return alloys.AlloyPairBuilder(
+        materials=materials,
+        thermo=thermo,
+        electronic_structure=MemoryStore(key="material_id"),
+        provenance=MemoryStore(key="material_id"),
+        oxi_states=MemoryStore(key="material_id"),
+        alloy_pairs=MemoryStore(key="pair_id"),
+        pair_batch_size=1,
+    )
+
+
+def test_alloy_pair_builder(alloy_pair_builder):
+    alloy_pair_builder.run()
+
+    pairs = {
+        d["pair_id"]: set(d["_search"]["id"])
+        for d in alloy_pair_builder.alloy_pairs.query()
+    }
+    assert pairs == {"mp-2_mp-1": {"mp-1", "mp-2"}, "mp-1_mp-3": {"mp-1", "mp-3"}}
+
+
+def test_alloy_pair_builder_processes(alloys, alloy_pair_builder, monkeypatch):
+    alloy_pair_builder.connect()
+    items = list(alloy_pair_builder.get_items())
+    item = {
+        "docs": {k: v for item in items for k, v in item["docs"].items()},
+        "pairs": [pair for item in items for pair in item["pairs"]],
+    }
+    serial = alloy_pair_builder.process_item(item)
+    assert len(serial) == 2
+
+    alloy_pair_builder.num_processes = 2
+    assert alloy_pair_builder.process_item(item) == serial
+
+    # pairs are evaluated in process when running in a daemonic worker
+    class DaemonProcess:
+        daemon = True
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("daemonic processes cannot start a pool")
+
+    monkeypatch.setattr(alloys, "current_process", lambda: DaemonProcess())
+    monkeypatch.setattr(alloys, "ProcessPoolExecutor", no_pool)
+    assert alloy_pair_builder.process_item(item) == serial
+
+
+def substituted(structure, old, new, n):
+    """copy of structure with the first n old sites replaced by new"""
+    structure = structure.copy()
+    for i in [i for i, site in enumerate(structure) if site.specie.symbol == old][:n]:
+        structure.replace(i, new)
+    return structure
+
+
+def test_alloy_pair_member_builder(alloys, structures):
+    pairs = [
+        AlloyPair.from_structures(
+            structures=[structures[a], structures[b]],
+            structures_with_oxidation_states=[structures[a], structures[b]],
+            ids=[a, b],
+            properties=[{}, {}],
+        )
+        for a, b in [("mp-1", "mp-2"), ("mp-1", "mp-3")]
+    ]
+    candidates = dict(structures)
+    candidates.update(
+        {
+            "mp-5": substituted(structures["mp-1"], "Ga", "Al", 2),
+            "mp-6": substituted(structures["mp-1"], "As", "P", 1),
+            "mp-7": substituted(structures["mp-3"], "Ga", "In", 2),
+            "snl-8": substituted(structures["mp-2"], "Al", "Ga", 3),
+        }
+    )
+
+    builder = alloys.AlloyPairMemberBuilder(
+        MemoryStore(), MemoryStore(), MemoryStore(), MemoryStore()
+    )
+    members = {
+        d["pair_id"]: sorted(m["id_"] for m in d["members"])
+        for d in builder.process_item((pairs, candidates))
+    }
+
+    # same memberships as checking every structure against every pair
+    def is_member(pair, structure):
+        try:
+            return pair.is_member(structure)
+        except Exception:
+            return False
+
+    expected = {
+        pair.pair_id: sorted(
+            db_id
+            for db_id, structure in candidates.items()
+            if is_member(pair, structure)
+        )
+        for pair in pairs
+    }
+    assert members == {k: v for k, v in expected.items() if v}
+    assert "mp-5" in members["mp-2_mp-1"] and "snl-8" in members["mp-2_mp-1"]
+    assert "mp-6" in members["mp-1_mp-3"]
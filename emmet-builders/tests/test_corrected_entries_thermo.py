@@ -1,10 +1,17 @@
+import copy
+from datetime import datetime
 from pathlib import Path
 
 import pytest
 from maggma.stores import JSONStore, MemoryStore
 from monty.serialization import dumpfn, loadfn
 
+from pymatgen.entries.compatibility import MaterialsProject2020Compatibility
+from pymatgen.entries.computed_entries import ComputedStructureEntry
+from pymatgen.entries.mixing_scheme import MaterialsProjectDFTMixingScheme
+
 from emmet.builders.materials.corrected_entries import CorrectedEntriesBuilder
+from emmet.builders.utils import HiddenPrints
 from emmet.builders.materials.thermo import ThermoBuilder
 from emmet.builders.vasp.materials import MaterialsBuilder
 
@@ -54,6 +61,131 @@ def test_corrected_entries_serialization(tmpdir):
     loadfn(Path(tmpdir) / "test.json")
 
 
+@pytest.fixture
+def fe_o_mixed_entries(test_dir):
+    energies = {
+        "Fe3O4": -382.146593528,
+        "Fe2O3a": -270.38765404,
+        "Fe": -13.00419661,
+        "O": -92.274692568,
+    }
+    potcars = {
+        "Fe": {"titel": "PAW_PBE Fe_pv 06Sep2000", "hash": None},
+        "O": {"titel": "PAW_PBE O 08Apr2002", "hash": None},
+    }
+
+    entries = []
+    for i, (name, energy) in enumerate(energies.items()):
+        structure = loadfn(test_dir / f"thermo/{name}_structure.json")
+        elements = {el.symbol for el in structure.composition}
+        for run_type in ["GGA+U", "R2SCAN"]:
+            if run_type == "GGA+U" and elements != {"Fe", "O"}:
+                run_type = "GGA"
+            entry = ComputedStructureEntry(
+                structure,
+                energy if run_type != "R2SCAN" else 1.7 * energy,
+                entry_id=f"mp-{i}-{run_type}",
+                parameters={
+                    "run_type": run_type,
+                    "is_hubbard": run_type == "GGA+U",
+                    "hubbards": {"Fe": 5.3, "O": 0.0} if run_type == "GGA+U" else {},
+                    "potcar_spec": [potcars[el] for el in sorted(elements)],
+                },
+                data={
+                    "material_id": f"mp-{i}",
+                    "task_id": f"mp-{i}0",
+                    "oxidation_states": {},
+                    "run_type": run_type,
+                },
+            )
+            entries.append(entry.as_dict())
+
+    return entries
+
+
+def test_corrected_entries_correction_cache(fe_o_mixed_entries):
+    compatibility = [
+        MaterialsProject2020Compatibility(),
+        MaterialsProjectDFTMixingScheme(),
+    ]
+    builder = CorrectedEntriesBuilder(
+        MemoryStore(), MemoryStore(), compatibility=compatibility
+    )
+
+    # Correcting a subsystem first fills the cache for the larger chemsys
+    builder.process_item(
+        [e for e in fe_o_mixed_entries if set(e["composition"]) == {"Fe"}]
+    )
+    assert len(builder._corrections_cache) > 0
+
+    doc = builder.process_item(fe_o_mixed_entries)
+    cached_doc = builder.process_item(fe_o_mixed_entries)
+    assert cached_doc["entries"] == doc["entries"]
+
+    entries = [ComputedStructureEntry.from_dict(e) for e in fe_o_mixed_entries]
+    with HiddenPrints():
+        reference = {
+            "GGA_GGA+U": compatibility[0].process_entries(copy.deepcopy(entries)),
+            "GGA_GGA+U_R2SCAN": compatibility[1].process_entries(
+                copy.deepcopy(entries)
+            ),
+        }
+
+    for thermo_type, ref_entries in reference.items():
+        assert len(ref_entries) > 0
+        assert {
+            e["entry_id"]: e["energy"] + e["correction"]
+            for e in doc["entries"][thermo_type]
+        } == pytest.approx({e.entry_id: e.energy for e in ref_entries})
+
+    # A cache smaller than one chemsys still gives the same corrections
+    small_builder = CorrectedEntriesBuilder(
+        MemoryStore(),
+        MemoryStore(),
+        compatibility=compatibility,
+        corrections_cache_size=2,
+    )
+    small_doc = small_builder.process_item(fe_o_mixed_entries)
+    assert (
+        small_builder.process_item(fe_o_mixed_entries)["entries"]
+        == small_doc["entries"]
+    )
+    assert small_doc["entries"] == doc["entries"]
+    assert len(small_builder._corrections_cache) == 2
+
+
+def test_corrected_entries_single_pre_corrected_entry(fe_o_mixed_entries):
+    # An Fe GGA entry with a POTCAR rejected by MP2020 leaves a single entry
+    # for the mixing step
+    entries = [
+        copy.deepcopy(e) for e in fe_o_mixed_entries if set(e["composition"]) == {"Fe"}
+    ]
+    for e in entries:
+        if e["parameters"]["run_type"] == "GGA":
+            e["parameters"]["potcar_spec"] = [
+                {"titel": "PAW_PBE Fe 06Sep2000", "hash": None}
+            ]
+
+    compatibility = [
+        MaterialsProject2020Compatibility(),
+        MaterialsProjectDFTMixingScheme(),
+    ]
+    builder = CorrectedEntriesBuilder(
+        MemoryStore(), MemoryStore(), compatibility=compatibility
+    )
+    doc = builder.process_item(entries)
+
+    with HiddenPrints():
+        reference = compatibility[1].process_entries(
+            [ComputedStructureEntry.from_dict(e) for e in entries]
+        )
+
+    assert len(reference) == 1
+    assert [e["entry_id"] for e in doc["entries"]["GGA_GGA+U_R2SCAN"]] == [
+        e.entry_id for e in reference
+    ]
+
+
 def test_thermo_builder(corrected_entries_store, thermo_store, phase_diagram_store):
     builder = ThermoBuilder(
         thermo=thermo_store,
@@ -73,3 +205,122 @@ def test_thermo_serialization(tmpdir):
 
     dumpfn(builder.as_dict(), Path(tmpdir) / "test.json")
     loadfn(Path(tmpdir) / "test.json")
+
+
+@pytest.fixture
+def fe_o_corrected_entries_store(test_dir):
+    structures = {
+        name: loadfn(test_dir / f"thermo/{name}_structure.json")
+        for name in ["Fe3O4", "Fe2O3a", "Fe2O3b", "Fe", "O"]
+    }
+    energies = {
+        "Fe3O4": -382.146593528,
+        "Fe2O3a": -270.38765404,
+        "Fe2O3b": -1080.82678592,
+        "Fe": -13.00419661,
+        "O": -92.274692568,
+    }
+
+    entries = []
+    for i, (name, structure) in enumerate(structures.items()):
+        entries.append(
+            {
+                "@module": "pymatgen.entries.computed_entries",
+                "@class": "ComputedStructureEntry",
+                "correction": 0.0,
+                "structure": structure.as_dict(),
+                "entry_id": f"mp-{i}",
+                "energy": energies[name],
+                "composition": structure.composition.as_dict(),
+                "data": {
+                    "material_id": f"mp-{i}",
+                    "run_type": "Unknown",
+                    "task_id": f"mp-{i}0",
+                },
+            }
+        )
+
+    store = MemoryStore(key="chemsys")
+    store.connect()
+    store.update(
+        [
+            {
+                "chemsys": chemsys,
+                "last_updated": datetime.utcnow(),
+                "entries": {
+                    "UNKNOWN": [
+                        e
+                        for e in entries
+                        if set(e["composition"]) <= set(chemsys.split("-"))
+                    ]
+                },
+            }
+            for chemsys in ["Fe", "O", "Fe-O"]
+        ]
+    )
+    return store
+
+
+@pytest.mark.parametrize("chunk_size", [1, 1000])
+def test_thermo_builder_subsystem_hulls(fe_o_corrected_entries_store, chunk_size):
+    thermo_store = MemoryStore(key="thermo_id")
+    ThermoBuilder(
+        thermo=thermo_store, corrected_entries=fe_o_corrected_entries_store
+    ).run()
+
+    scheduled_thermo_store = MemoryStore(key="thermo_id")
+    builder = ThermoBuilder(
+        thermo=scheduled_thermo_store,
+        corrected_entries=fe_o_corrected_entries_store,
+        use_subsystem_hulls=True,
+        chunk_size=chunk_size,
+    )
+    builder.run()
+
+    fields = ["thermo_id", "energy_above_hull", "is_stable", "decomposes_to"]
+    docs = sorted(thermo_store.query(properties=fields), key=lambda d: d["thermo_id"])
+    scheduled_docs = sorted(
+        scheduled_thermo_store.query(properties=fields),
+        key=lambda d: d["thermo_id"],
+    )
+
+    assert len(docs) == 5
+    assert [{k: d.get(k) for k in fields} for d in docs] == [
+        {k: d.get(k) for k in fields} for d in scheduled_docs
+    ]
+
+    # Fe-O is yielded with the hulls of Fe and O once they reached update_targets
+    builder = ThermoBuilder(
+        thermo=MemoryStore(key="thermo_id"),
+        corrected_entries=fe_o_corrected_entries_store,
+        use_subsystem_hulls=True,
+    )
+    builder.connect()
+    subsystem_hulls = {}
+    for item in builder.get_items():
+        subsystem_hulls[item["chemsys"]] = item["subsystem_hulls"]
+        builder.update_targets([builder.process_item(item)])
+
+    assert subsystem_hulls["Fe"] == subsystem_hulls["O"] == {}
+    assert set(subsystem_hulls["Fe-O"]["UNKNOWN"]) == {"Fe", "O"}
+    assert builder._subsystem_hulls == {}
+
+
+def test_thermo_builder_balanced_prechunk(fe_o_corrected_entries_store):
+    fe_o_corrected_entries_store.update(
+        {
+            "chemsys": "Li",
+            "last_updated": datetime.utcnow(),
+            "entries": {"UNKNOWN": [{"entry_id": f"li-{i}"} for i in range(6)]},
+        }
+    )
+    builder = ThermoBuilder(
+        thermo=MemoryStore(key="thermo_id"),
+        corrected_entries=fe_o_corrected_entries_store,
+        balance_prechunk=True,
+    )
+    builder.connect()
+
+    # Chunks are balanced by the number of entries: Li (6), Fe-O (5), Fe (1), O (1)
+    chunks = [chunk["query"]["chemsys"]["$in"] for chunk in builder.prechunk(2)]
+    assert chunks == [["Li", "O"], ["Fe-O", "Fe"]]
@@ -0,0 +1,87 @@
+from datetime import datetime
+
+import pytest
+from maggma.stores import MemoryStore
+from monty.serialization import loadfn
+
+from emmet.builders.materials.electrodes import StructureGroupBuilder
+
+POTCAR_TITELS = {
+    "Li": "PAW_PBE Li_sv 23Jan2001",
+    "Co": "PAW_PBE Co 06Sep2000",
+    "O": "PAW_PBE O 08Apr2002",
+}
+
+
+@pytest.fixture
+def materials_store(test_dir):
+    docs = []
+    for itr, entry in enumerate(loadfn(test_dir / "LiCoO2_batt.json")):
+        material_id = f"mp-{itr}"
+        elements = sorted(str(el) for el in entry.composition.elements)
+        is_hubbard = "Co" in elements and "O" in elements
+        entry.entry_id = material_id
+        entry.data["material_id"] = material_id
+        entry.parameters = {
+            "run_type": "GGA+U" if is_hubbard else "GGA",
+            "is_hubbard": is_hubbard,
+            "hubbards": {"Co": 3.32} if is_hubbard else {},
+            "potcar_spec": [
+                {"titel": POTCAR_TITELS[el], "hash": None} for el in elements
+            ],
+        }
+        docs.append(
+            {
+                "material_id": material_id,
+                "chemsys": "-".join(elements),
+                "elements": elements,
+                "formula_pretty": entry.composition.reduced_formula,
+                "structure": entry.structure.as_dict(),
+                "entries": {"GGA+U" if is_hubbard else "GGA": entry.as_dict()},
+                "deprecated": False,
+                "last_updated": datetime.utcnow(),
+            }
+        )
+
+    store = MemoryStore(key="material_id")
+    store.connect()
+    store.update(docs)
+    return store
+
+
+def test_structure_group_builder_incremental(materials_store):
+    sgroups = MemoryStore(key="group_id")
+    StructureGroupBuilder(materials_store, sgroups, working_ion="Li").run()
+    expected = {d["group_id"]: sorted(d["material_ids"]) for d in sgroups.query()}
+    assert len(expected) > 1
+
+    sgroups = MemoryStore(key="group_id")
+    builder = StructureGroupBuilder(
+        materials_store, sgroups, working_ion="Li", incremental=True
+    )
+    builder.run()
+    assert {
+        d["group_id"]: sorted(d["material_ids"]) for d in sgroups.query()
+    } == expected
+
+    # Nothing changed, so no sgroup is rewritten
+    last_updated = {d["group_id"]: d["last_updated"] for d in sgroups.query()}
+    builder.run()
+    assert {d["group_id"]: d["last_updated"] for d in sgroups.query()} == last_updated
+
+    # Only the sgroup of an updated material is rewritten
+    group_id, material_ids = next(iter(expected.items()))
+    materials_store.update(
+        [
+            dict(
+                materials_store.query_one({"material_id": material_ids[0]}),
+                last_updated=datetime.utcnow(),
+            )
+        ]
+    )
+    builder.run()
+    new_last_updated = {d["group_id"]: d["last_updated"] for d in sgroups.query()}
+    assert new_last_updated.keys() == last_updated.keys()
+    assert [
+        gid for gid in last_updated if new_last_updated[gid] != last_updated[gid]
+    ] == [group_id]
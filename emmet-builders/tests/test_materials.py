@@ -30,9 +30,15 @@ def materials_store():
     return MemoryStore()
 
 
-def test_materials_builder(tasks_store, validation_store, materials_store):
+@pytest.mark.parametrize("stream_tasks", [False, True])
+def test_materials_builder(
+    tasks_store, validation_store, materials_store, stream_tasks
+):
     builder = MaterialsBuilder(
-        tasks=tasks_store, task_validation=validation_store, materials=materials_store
+        tasks=tasks_store,
+        task_validation=validation_store,
+        materials=materials_store,
+        stream_tasks=stream_tasks,
     )
     builder.run()
     assert materials_store.count() == 1
@@ -0,0 +1,88 @@
+from datetime import datetime
+
+import pytest
+from maggma.stores import MemoryStore
+from pymatgen.core import Lattice, Structure
+from pymatgen.util.provenance import Author, HistoryNode, StructureNL
+
+from emmet.builders.materials.provenance import ProvenanceBuilder
+
+
+@pytest.fixture
+def fe_structures():
+    return {
+        "bcc": Structure.from_spacegroup(
+            "Im-3m", Lattice.cubic(2.87), ["Fe"], [[0, 0, 0]]
+        ),
+        "fcc": Structure.from_spacegroup(
+            "Fm-3m", Lattice.cubic(3.6), ["Fe"], [[0, 0, 0]]
+        ),
+        "hcp": Structure.from_spacegroup(
+            "P6_3/mmc", Lattice.hexagonal(2.47, 3.96), ["Fe"], [[1 / 3, 2 / 3, 1 / 4]]
+        ),
+    }
+
+
+@pytest.fixture
+def materials_store(fe_structures):
+    store = MemoryStore(key="material_id")
+    store.connect()
+    store.update(
+        [
+            {
+                "material_id": f"mp-{i}",
+                "structure": fe_structures[name].as_dict(),
+                "initial_structures": [fe_structures[name].as_dict()],
+                "formula_pretty": "Fe",
+                "deprecated": False,
+                "last_updated": datetime.utcnow(),
+            }
+            for i, name in enumerate(["bcc", "fcc", "hcp"])
+        ]
+    )
+    return store
+
+
+@pytest.fixture
+def snls_store(fe_structures):
+    docs = []
+    for snl_id, name, scale in [
+        ("icsd-1", "bcc", 1.05),
+        ("icsd-2", "bcc", 0.98),
+        ("pf-3", "fcc", 1.0),
+    ]:
+        structure = fe_structures[name].copy()
+        structure.scale_lattice(structure.volume * scale)
+        doc = StructureNL(
+            structure,
+            authors=[Author("test", "test@test.com").as_dict()],
+            history=[HistoryNode("nothing", "url.com", {})],
+            created_at=datetime.utcnow(),
+            references="",
+        ).as_dict()
+        doc["snl_id"] = snl_id
+        doc["formula_pretty"] = "Fe"
+        docs.append(doc)
+
+    store = MemoryStore(key="snl_id")
+    store.connect()
+    store.update(docs)
+    return store
+
+
+def test_provenance_builder(materials_store, snls_store):
+    provenance_store = MemoryStore(key="material_id")
+    builder = ProvenanceBuilder(
+        materials=materials_store,
+        provenance=provenance_store,
+        source_snls=[snls_store],
+    )
+    builder.run()
+
+    assert provenance_store.count() == 3
+    database_ids = {
+        d["material_id"]: d["database_IDs"] for d in provenance_store.query()
+    }
+    assert sorted(database_ids["mp-0"]["icsd"]) == ["icsd-1", "icsd-2"]
+    assert database_ids["mp-1"] == {"pf": ["pf-3"]}
+    assert database_ids["mp-2"] == {}
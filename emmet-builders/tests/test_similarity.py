@@ -1,5 +1,8 @@
+import pickle
+
 import pytest
 from maggma.stores import JSONStore, MemoryStore
+from monty.serialization import dumpfn
 
 from emmet.builders.materials.basic_descriptors import BasicDescriptorsBuilder
 from emmet.builders.vasp.materials import MaterialsBuilder
@@ -40,3 +43,51 @@ def test_basic_descriptions(descriptors_store):
 
     print(similarity_store.query_one({}))
     assert similarity_store.count() == 1
+
+
+def test_similarity_engine(descriptors_store, tmp_path):
+    builder = StructureSimilarityBuilder(
+        structure_similarity=MemoryStore(),
+        site_descriptors=descriptors_store,
+        block_size=1,
+    )
+    items = list(builder.get_items())
+    assert len(items) == 3
+    worker = pickle.loads(pickle.dumps(builder))
+    pair_docs = [doc for item in items for doc in worker.process_item(item)]
+    assert len(pair_docs) == 1
+
+    d1, d2 = descriptors_store.query()
+    expected = builder.get_similarities(d1, d2)
+    assert pair_docs[0]["cos"] == pytest.approx(expected["cos"], rel=1e-5)
+    assert pair_docs[0]["dist"] == pytest.approx(expected["dist"], rel=1e-5)
+
+    similarity_store = MemoryStore(key="task_id")
+    builder = StructureSimilarityBuilder(
+        structure_similarity=similarity_store,
+        site_descriptors=descriptors_store,
+        top_k=5,
+    )
+    builder.run()
+    assert similarity_store.count() == 2
+    for doc in similarity_store.query():
+        assert len(doc["neighbors"]) == 1
+        assert doc["neighbors"][0]["task_id"] != doc["task_id"]
+        assert doc["neighbors"][0]["dist"] == pytest.approx(expected["dist"], rel=1e-5)
+
+    # top_k items are processed by a copy that reads the columns from the store
+    dumpfn(list(descriptors_store.query()), tmp_path / "descriptors.json")
+    builder = StructureSimilarityBuilder(
+        structure_similarity=MemoryStore(key="task_id"),
+        site_descriptors=JSONStore(tmp_path / "descriptors.json", key="task_id"),
+        top_k=5,
+        block_size=1,
+    )
+    builder.connect()
+    items = list(builder.get_items())
+    assert len(items) == 2
+    worker = pickle.loads(pickle.dumps(builder))
+    nn_docs = [doc for item in items for doc in worker.process_item(item)]
+    assert [len(doc["neighbors"]) for doc in nn_docs] == [1, 1]
+    for doc in nn_docs:
+        assert doc["neighbors"][0]["dist"] == pytest.approx(expected["dist"], rel=1e-5)
@@ -165,6 +165,99 @@ def test_summary_builder(
     assert summary.count() == 1
 
 
+def test_summary_builder_prefetch(
+    materials,
+    thermo,
+    xas,
+    chemenv,
+    absorption,
+    grain_boundaries,
+    electronic_structure,
+    magnetism,
+    elasticity,
+    dielectric,
+    piezoelectric,
+    phonon,
+    insertion_electrodes,
+    substrates,
+    surfaces,
+    oxi_states,
+    eos,
+    provenance,
+    charge_density_index,
+    summary,
+):
+    for store in [thermo, xas, insertion_electrodes, elasticity]:
+        store.connect()
+
+    mat_doc = materials.query_one()
+    material_id = mat_doc["material_id"]
+    task_ids = list(mat_doc["task_types"].keys())
+
+    thermo.update(
+        [
+            {
+                "material_id": material_id,
+                "thermo_type": "GGA_GGA+U_R2SCAN",
+                "energy_above_hull": 0.0,
+            }
+        ]
+    )
+    xas.update([{"task_id": task_id, "edge": "K"} for task_id in task_ids])
+    insertion_electrodes.update(
+        [{"task_id": "electrode-1", "material_ids": [material_id, "mp-0"]}]
+    )
+    elasticity.update([{"task_id": task_ids[0], "elasticity": {"k_vrh": 1.0}}])
+
+    kwargs = dict(
+        materials=materials,
+        electronic_structure=electronic_structure,
+        thermo=thermo,
+        magnetism=magnetism,
+        chemenv=chemenv,
+        absorption=absorption,
+        dielectric=dielectric,
+        piezoelectric=piezoelectric,
+        phonon=phonon,
+        insertion_electrodes=insertion_electrodes,
+        elasticity=elasticity,
+        substrates=substrates,
+        surfaces=surfaces,
+        oxi_states=oxi_states,
+        xas=xas,
+        grain_boundaries=grain_boundaries,
+        eos=eos,
+        provenance=provenance,
+        charge_density_index=charge_density_index,
+        summary=summary,
+    )
+
+    def _strip_ids(data):
+        for value in data.values():
+            for doc in value if isinstance(value, list) else [value]:
+                if isinstance(doc, dict):
+                    doc.pop("_id", None)
+        return data
+
+    builder = SummaryBuilder(**kwargs)
+    builder.connect()
+    items = [_strip_ids(d) for d in builder.get_items()]
+
+    prefetch_builder = SummaryBuilder(prefetch=True, **kwargs)
+    prefetch_builder.connect()
+    prefetched_items = [_strip_ids(d) for d in prefetch_builder.get_items()]
+
+    assert len(prefetched_items) == len(items) == 1
+    assert prefetched_items[0]["thermo"]["energy_above_hull"] == 0.0
+    assert len(prefetched_items[0]["xas"]) == len(task_ids)
+    assert prefetched_items[0]["elasticity"] == {"k_vrh": 1.0}
+    assert prefetched_items[0]["insertion_electrodes"] == [{"task_id": "electrode-1"}]
+    assert prefetched_items == items
+
+    prefetch_builder.run()
+    assert summary.count() == 1
+
+
 def test_serialization(tmpdir):
     builder = SummaryBuilder(
         MemoryStore(),
@@ -1,11 +1,15 @@
 from emmet.builders.utils import (
+    EntriesCache,
+    chemsys_costs,
     chemsys_permutations,
+    partition_by_cost,
     maximal_spanning_non_intersecting_subsets,
     get_hop_cutoff,
 )
 from pymatgen.analysis.diffusion.neb.full_path_mapper import MigrationGraph
 from numpy.testing import assert_almost_equal
 from monty.serialization import loadfn
+from itertools import chain
 
 
 def test_maximal_spanning_non_intersecting_subsets():
@@ -28,6 +32,19 @@ def test_chemsys_permutations(test_dir):
     assert len(chemsys_permutations("Sr-Hf-O")) == 7
 
 
+def test_partition_by_cost():
+    costs = {"Fe-O": 100, "Li-O": 40, "Li": 30, "O": 20, "Fe": 10, "Li-Fe": 0}
+    chunks = partition_by_cost(costs, 2)
+    assert sorted(chain.from_iterable(chunks)) == sorted(costs)
+    assert [sum(costs[k] for k in chunk) for chunk in chunks] == [100, 100]
+
+    assert len(partition_by_cost(costs, 10)) == len(costs)
+    assert partition_by_cost({}, 4) == []
+
+    counts = {"Li": 2, "O": 3, "Li-O": 5, "Fe-O": 7}
+    assert chemsys_costs(["Li-O", "Fe-Li-O"], counts) == {"Li-O": 10, "Fe-Li-O": 17}
+
+
 def test_get_hop_cutoff(test_dir):
     spinel_mg = loadfn(test_dir / "mobility/migration_graph_spinel_MgMn2O4.json")
     nasicon_mg = loadfn(test_dir / "mobility/migration_graph_nasicon_MgV2(PO4)3.json")
@@ -55,3 +72,29 @@ def test_get_hop_cutoff(test_dir):
     check_mg = MigrationGraph.with_distance(nasicon_mg.structure, "Mg", d)
     assert_almost_equal(d, 4.59, decimal=2)
     assert len(check_mg.unique_hops) == 6
+
+
+def test_entries_cache():
+    entries = [{"entry_id": f"mp-{i}", "energy": -1.0 * i} for i in range(100)]
+
+    cache = EntriesCache()
+    cache.put("Li-O", entries)
+    assert cache.get("Li-O") == entries
+    assert cache.get("Li-O") is not cache.get("Li-O")
+    assert cache.get("Fe-O") is None
+    assert (cache.hits, cache.misses) == (3, 1)
+
+    # The budget only fits two chemsys, the least recently used one is evicted
+    cache = EntriesCache(max_size=int(cache.size * 2.5))
+    cache.put("Li-O", entries)
+    cache.put("Fe-O", entries)
+    cache.get("Li-O")
+    cache.put("Mn-O", entries)
+    assert "Li-O" in cache and "Mn-O" in cache and "Fe-O" not in cache
+    assert cache.evictions == 1
+    assert cache.size <= cache.max_size
+
+    cache.put(
+        "Li-Fe-O", [{"entry_id": f"mp-{i}", "energy": -1.0 * i} for i in range(5000)]
+    )
+    assert "Li-Fe-O" not in cache
@@ -2,7 +2,7 @@ import pytest
 from maggma.stores import JSONStore, MemoryStore
 
 from emmet.builders.settings import EmmetBuildSettings
-from emmet.builders.vasp.task_validator import TaskValidator
+from emmet.builders.vasp.task_validator import TaskValidator, get_potcar_hashes
 
 intermediate_stores = ["validation"]
 
@@ -26,3 +26,58 @@ def test_validator(tasks_store, validation_store):
     assert validation_store.count() == tasks_store.count()
     assert validation_store.count({"valid": True}) == tasks_store.count()
     assert all(list(d["run_type"] == "GGA" for d in validation_store.query()))
+
+
+def test_get_potcar_hashes(tmp_path, monkeypatch):
+    from pymatgen.core import SETTINGS as PMG_SETTINGS
+    from pymatgen.io.vasp.inputs import PotcarSingle
+    from pymatgen.io.vasp.sets import MPRelaxSet, MPScanRelaxSet
+
+    psp_dir = tmp_path / "psp"
+    for functional in ["PBE", "PBE_54"]:
+        func_dir = psp_dir / PotcarSingle.functional_dir[functional]
+        func_dir.mkdir(parents=True)
+        (func_dir / "POTCAR.Si.gz").write_text(functional)
+    monkeypatch.setitem(PMG_SETTINGS, "PMG_VASP_PSP_DIR", str(psp_dir))
+
+    calls = []
+
+    class FakePotcar:
+        def __init__(self, symbol, functional):
+            self.symbol, self.functional = symbol, functional
+
+        def get_potcar_hash(self):
+            return f"{self.functional}-{self.symbol}"
+
+    def from_symbol_and_functional(symbol, functional):
+        calls.append((symbol, functional))
+        return FakePotcar(symbol, functional)
+
+    monkeypatch.setattr(
+        PotcarSingle, "from_symbol_and_functional", from_symbol_and_functional
+    )
+
+    input_sets = {
+        "GGA Structure Optimization": MPRelaxSet,
+        "GGA Static": MPRelaxSet,
+        "R2SCAN Structure Optimization": MPScanRelaxSet,
+    }
+    cache_file = tmp_path / "cache" / "potcar_hashes.json"
+
+    hashes = get_potcar_hashes(input_sets, cache_file=str(cache_file))
+    assert hashes["GGA Static"]["Si"] == "PBE-Si"
+    assert hashes["R2SCAN Structure Optimization"]["Si"] == "PBE_54-Si"
+    # Each POTCAR is only hashed once per functional
+    assert len(calls) == len(set(calls))
+    assert cache_file.exists()
+
+    calls.clear()
+    assert get_potcar_hashes(input_sets, cache_file=str(cache_file)) == hashes
+    assert calls == []
+
+    # Changing a POTCAR directory only invalidates the hashes of that functional
+    (psp_dir / PotcarSingle.functional_dir["PBE"] / "POTCAR.Si.gz").write_text(
+        "updated"
+    )
+    assert get_potcar_hashes(input_sets, cache_file=str(cache_file)) == hashes
+    assert {functional for _, functional in calls} == {"PBE"}
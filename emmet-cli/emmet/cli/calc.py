@@ -4,6 +4,7 @@ import os
 import struct
 import tarfile
 from collections import defaultdict
+from datetime import datetime
 from fnmatch import fnmatch
 from zipfile import ZipFile
 
@@ -12,6 +13,7 @@ import click
 from pymatgen.alchemy.materials import TransformedStructure
 from pymatgen.core import Structure
 from pymatgen.util.provenance import Author, StructureNL
+from pymongo import ReplaceOne
 
 from emmet.cli import SETTINGS
 from emmet.cli.utils import (
@@ -22,7 +24,12 @@ from emmet.cli.utils import (
     load_structure,
     structures_match,
 )
-from emmet.core.utils import get_sg, group_structures
+from emmet.core.utils import (
+    get_sg,
+    get_structure_fingerprints,
+    group_structures,
+    structures_may_match,
+)
 
 _UNPACK_INT = struct.Struct("<i").unpack
 logger = logging.getLogger("emmet")
@@ -38,10 +45,59 @@ def get_format(fname):
         raise EmmetCliError(f"reading {fname} not supported (yet)")
 
 
+def set_fingerprints(structures):
+    for s, fingerprint in zip(structures, get_structure_fingerprints(structures)):
+        s.fingerprint = fingerprint
+
+
+def to_index_entry(s):
+    return {
+        "id": s.id,
+        "structure": s.as_dict(verbosity=0),
+        "fingerprint": s.fingerprint,
+    }
+
+
+def from_index_entry(dct):
+    s = Structure.from_dict(dct["structure"])
+    s.id = dct["id"]
+    s.fingerprint = dct["fingerprint"]
+    return s
+
+
+def get_source_state(collection, query):
+    """number of documents for query in collection and their latest _id and update
+
+    Documents that are added, removed or replaced (new `_id` or `last_updated`)
+    change the state, as do documents that stop or start matching query.
+    """
+    group = {
+        "_id": None,
+        "ndocs": {"$sum": 1},
+        "max_id": {"$max": "$_id"},
+        "max_last_updated": {"$max": "$last_updated"},
+    }
+    for state in collection.aggregate([{"$match": query}, {"$group": group}]):
+        state.pop("_id")
+        return state
+    return {"ndocs": 0, "max_id": None, "max_last_updated": None}
+
+
 def load_canonical_structures(ctx, full_name, formula):
+    """load canonical structures per spacegroup for formula in collection full_name
+
+    Canonical structures are kept in a persistent index (`canonical_structures`
+    collection of the user DB) with one document per collection, formula and
+    structure id. A header document (id None) per collection and formula records
+    the state (see `get_source_state`) of the documents for the formula the index
+    was built from; the index is only rebuilt from the collection if it changed.
+    Rebuilds upsert the entries and the header last, so that concurrent jobs can
+    rebuild the same formula.
+    """
     from emmet.core.vasp.calc_types import task_type  # TODO import error
 
     collection = ctx.obj["COLLECTIONS"][full_name]
+    index = ctx.obj["CANONICAL_INDEX"]
 
     if formula not in canonical_structures[full_name]:
         canonical_structures[full_name][formula] = {}
@@ -50,37 +106,99 @@ def load_canonical_structures(ctx, full_name, formula):
         if "tasks" in full_name:
             query = {"formula_pretty": formula}
             query.update(SETTINGS.task_base_query)
-            projection = {"input.structure": 1, "task_id": 1, "orig_inputs": 1}
-            tasks = collection.find(query, projection)
-
-            for task in tasks:
-                task_label = task_type(task["orig_inputs"], include_calc_type=False)
-                if task_label == "Structure Optimization":
-                    s = load_structure(task["input"]["structure"])
-                    s.id = task["task_id"]
-                    structures[get_sg(s)].append(s)
-
         elif "snl" in full_name:
             query = {"$or": [{k: formula} for k in SETTINGS.aggregation_keys]}
             query.update(SETTINGS.exclude)
             query.update(SETTINGS.base_query)
+        else:
+            return
+
+        index_key = {"collection": full_name, "formula": formula}
+        state = get_source_state(collection, query)
+        header = index.find_one(dict(index_key, id=None))
 
-            for group in aggregate_by_formula(collection, query):
-                for dct in group["structures"]:
-                    s = load_structure(dct)
-                    s.id = dct["snl_id"] if "snl_id" in dct else dct["task_id"]
-                    structures[get_sg(s)].append(s)
+        if header and all(header.get(k) == v for k, v in state.items()):
+            for entry in index.find(dict(index_key, id={"$ne": None})):
+                canonical_structures[full_name][formula].setdefault(
+                    entry["spacegroup"], []
+                ).append(from_index_entry(entry))
 
-        if structures:
+        else:
+            if "tasks" in full_name:
+                projection = {"input.structure": 1, "task_id": 1, "orig_inputs": 1}
+                tasks = collection.find(query, projection)
+
+                for task in tasks:
+                    task_label = task_type(task["orig_inputs"], include_calc_type=False)
+                    if task_label == "Structure Optimization":
+                        s = load_structure(task["input"]["structure"])
+                        s.id = task["task_id"]
+                        structures[get_sg(s)].append(s)
+
+            else:
+                for group in aggregate_by_formula(collection, query):
+                    for dct in group["structures"]:
+                        s = load_structure(dct)
+                        s.id = dct["snl_id"] if "snl_id" in dct else dct["task_id"]
+                        structures[get_sg(s)].append(s)
+
+            now = datetime.utcnow()
+            ids, requests = [], []
             for sg, slist in structures.items():
-                canonical_structures[full_name][formula][sg] = [
-                    g[0] for g in group_structures(slist)
-                ]
+                canonical = [g[0] for g in group_structures(slist)]
+                set_fingerprints(canonical)
+                canonical_structures[full_name][formula][sg] = canonical
+                for s in canonical:
+                    ids.append(s.id)
+                    entry = dict(index_key, spacegroup=sg, last_updated=now)
+                    entry.update(to_index_entry(s))
+                    requests.append(
+                        ReplaceOne(dict(index_key, id=s.id), entry, upsert=True)
+                    )
+
+            if requests:
+                index.bulk_write(requests, ordered=False)
+
+            index.delete_many(dict(index_key, id={"$nin": ids + [None]}))
+            index.replace_one(
+                dict(index_key, id=None),
+                dict(index_key, id=None, last_updated=now, **state),
+                upsert=True,
+            )
 
         total = sum([len(x) for x in canonical_structures[full_name][formula].values()])
         logger.debug(f"{total} canonical structure(s) for {formula} in {full_name}")
 
 
+def add_canonical_structures(ctx, full_name, snls):
+    """add newly inserted (unique) SNLs to the canonical structures of full_name"""
+    index = ctx.obj["CANONICAL_INDEX"]
+    for snl_dct in snls:
+        s = load_structure(snl_dct)
+        s.id = snl_dct["snl_id"]
+        set_fingerprints([s])
+        formula, sg = s.composition.reduced_formula, get_sg(s)
+        if formula in canonical_structures[full_name]:
+            canonical_structures[full_name][formula].setdefault(sg, []).append(s)
+
+        # keep the header in sync with the inserted SNL for formula in full_name
+        # (the index is rebuilt on next use if the SNL is not accounted for there)
+        index_key = {"collection": full_name, "formula": formula}
+        now = datetime.utcnow()
+        result = index.update_one(
+            dict(index_key, id=None),
+            {
+                "$inc": {"ndocs": 1},
+                "$max": {"max_id": snl_dct["_id"]},
+                "$set": {"last_updated": now},
+            },
+        )
+        if result.matched_count:
+            entry = dict(index_key, spacegroup=sg, last_updated=now)
+            entry.update(to_index_entry(s))
+            index.replace_one(dict(index_key, id=s.id), entry, upsert=True)
+
+
 def save_logs(ctx):
     handler = ctx.obj["MONGO_HANDLER"]
     cnt = len(handler.buffer)
@@ -91,10 +209,12 @@ def save_logs(ctx):
 def insert_snls(ctx, snls):
     if ctx.obj["RUN"] and snls:
         logger.info(f"add {len(snls)} SNLs ...")
-        result = ctx.obj["CLIENT"].db.snls.insert_many(snls)
+        snl_collection = ctx.obj["CLIENT"].db.snls
+        result = snl_collection.insert_many(snls)
         logger.info(
             click.style(f"#SNLs inserted: {len(result.inserted_ids)}", fg="green")
         )
+        add_canonical_structures(ctx, snl_collection.full_name, snls)
 
     snls.clear()
     save_logs(ctx)
@@ -157,6 +277,10 @@ def calc(ctx, specs, nmax, skip):
         logger.debug(f"{coll.count()} docs in {full_name}")
 
     ctx.obj["COLLECTIONS"] = collections
+    ctx.obj["CANONICAL_INDEX"] = ctx.obj["CLIENT"].db.canonical_structures
+    ctx.obj["CANONICAL_INDEX"].create_index(
+        [("collection", 1), ("formula", 1), ("id", 1)], unique=True
+    )
     ctx.obj["NMAX"] = nmax
     ctx.obj["SKIP"] = skip
 
@@ -296,6 +420,7 @@ def prep(ctx, archive, authors):  # noqa: C901
             )
             continue
 
+        fingerprint = get_structure_fingerprints([struct])[0]
         for full_name, coll in collections.items():
             # load canonical structures in collection for current formula and
             # duplicate-check them against current structure
@@ -303,7 +428,9 @@ def prep(ctx, archive, authors):  # noqa: C901
             for canonical_structure in canonical_structures[full_name][formula].get(
                 sg, []
             ):
-                if structures_match(struct, canonical_structure):
+                if structures_may_match(
+                    fingerprint, canonical_structure.fingerprint
+                ) and structures_match(struct, canonical_structure):
                     logger.log(
                         logging.WARNING if run else logging.INFO,
                         f"Duplicate for {istruct.source_id} ({formula}/{sg}): {canonical_structure.id}",
@@ -5,6 +5,8 @@ from pydantic import Field
 
 from emmet.core.settings import EmmetSettings
 
+SKIP_LABELS = ["He", "He0+", "Ar", "Ar0+", "Ne", "Ne0+", "D", "D+", "T", "M"]
+
 
 class EmmetCLISettings(EmmetSettings):
     exclude: Dict[str, Dict] = Field(
@@ -14,16 +16,14 @@ class EmmetCLISettings(EmmetSettings):
         },
         description="",
     )
-    skip_labels: List[str] = Field(
-        ["He", "He0+", "Ar", "Ar0+", "Ne", "Ne0+", "D", "D+", "T", "M"], description=""
-    )
+    skip_labels: List[str] = Field(SKIP_LABELS, description="")
     base_query: Dict = Field(
         {
             "is_ordered": True,
             "is_valid": True,
             "nsites": {"$lt": 200},
-            "sites.label": {"$nin": skip_labels},
-            "snl.sites.label": {"$nin": skip_labels},
+            "sites.label": {"$nin": SKIP_LABELS},
+            "snl.sites.label": {"$nin": SKIP_LABELS},
         },
         description="",
     )
@@ -124,3 +124,17 @@ class EmmetCLISettings(EmmetSettings):
         ["mp_{}".format(y) for y in range(2018, int(datetime.today().year) + 1)],
         description="list of years to tag tasks",
     )
+
+    gzip_block_size: int = Field(
+        16 * 1024**2,
+        description="size in bytes of the blocks streamed through gzip per file",
+    )
+
+    gzip_threads: int = Field(
+        8, description="number of threads compressing the files of launchers"
+    )
+
+    gzip_lookahead: int = Field(
+        4,
+        description="number of launchers compressed ahead of the one handed to parsing",
+    )
@@ -1,15 +1,16 @@
 import json
 import logging
-import math
 import multiprocessing
 import os
+import queue
 import shlex
 import shutil
 import subprocess
 import sys
-import time
+import threading
 
-from collections import defaultdict, deque
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from fnmatch import fnmatch
 from pathlib import Path
 from datetime import datetime
@@ -24,10 +25,13 @@ from emmet.cli.utils import (
     EmmetCliError,
     ReturnCodes,
     VaspDirsGenerator,
-    chunks,
     ensure_indexes,
-    iterator_slice,
-    parse_vasp_dirs,
+    get_parsed_launchers,
+    get_subdir,
+    init_parse_worker,
+    parse_vasp_dir,
+    reserve_ids,
+    write_tasks,
     get_symlinked_path,
 )
 
@@ -516,7 +520,6 @@ def parsers(ctx, task_ids):
             ret = ctx.parent.invoke(parse, nproc=20, task_ids=task_ids)
             msg += f" -> {ret.value}"
             comment_txt.append(msg)
-            time.sleep(90)  # give jobs time to start (cf insertion of separator task)
         else:
             logger.info(msg)
 
@@ -545,6 +548,13 @@ def parsers(ctx, task_ids):
     show_default=True,
     help="Number of processes for parallel parsing.",
 )
+@click.option(
+    "--batch-size",
+    type=int,
+    default=50,
+    show_default=True,
+    help="Number of tasks to insert into the target at once.",
+)
 @click.option(
     "-s",
     "--store-volumetric-data",
@@ -559,7 +569,9 @@ def parsers(ctx, task_ids):
     default=["precondition", "relax1", "relax2", "static"],
     help="Naming scheme for multiple calculations in one folder - subfolder or extension.",
 )
-def parse(task_ids, snl_metas, nproc, store_volumetric_data, runs):  # noqa: C901
+def parse(  # noqa: C901
+    task_ids, snl_metas, nproc, batch_size, store_volumetric_data, runs
+):
     """Parse VASP launchers into tasks"""
     ctx = click.get_current_context()
     if "CLIENT" not in ctx.obj:
@@ -579,110 +591,162 @@ def parse(task_ids, snl_metas, nproc, store_volumetric_data, runs):  # noqa: C90
         ["task_id", "tags", "dir_name", "retired_task_id"], [target.collection]
     )
 
-    chunk_size = math.ceil(nmax / nproc)
-    if nproc > 1 and nmax <= chunk_size:
-        nproc = 1
-        logger.warning(
-            f"nmax = {nmax} but chunk size = {chunk_size} -> sequential parsing."
-        )
-
-    from multiprocessing_logging import install_mp_handler
-
-    install_mp_handler(logger=logger)
-
-    pool = multiprocessing.Pool(processes=nproc)
-    gen = VaspDirsGenerator()
-    iterator = iterator_slice(gen, chunk_size)  # process in chunks
-    queue = deque()
-    count = 0
-
-    sep_tid = None
     if task_ids:
         with open(task_ids, "r") as f:
             task_ids = json.load(f)
     else:
-        # reserve list of task_ids to avoid collisions during multiprocessing
-        # insert empty doc with max ID + 1 into target collection for parallel SLURM jobs
-        pipeline = [
-            {"$match": {"task_id": {"$regex": r"^mp-\d{7,}$"}}},
-            {"$project": {"task_id": 1, "prefix_num": {"$split": ["$task_id", "-"]}}},
-            {"$project": {"num": {"$arrayElemAt": ["$prefix_num", -1]}}},
-            {"$addFields": {"num_int": {"$toInt": "$num"}}},
-            {"$group": {"_id": None, "num_max": {"$max": "$num_int"}}},
-        ]
-        result = list(client.collection.aggregate(pipeline))
-        next_tid = result[0]["num_max"] + 1
-        lst = [f"mp-{next_tid + n}" for n in range(nmax)]
-        task_ids = chunks(lst, chunk_size)
-
-        if run:
-            sep_tid = f"mp-{next_tid + nmax}"
-            target.collection.insert_one({"task_id": sep_tid})
-            logger.info(f"Inserted separator task with task_id {sep_tid}.")
-            logger.info(f"Reserved {len(lst)} task ID(s).")
-        else:
-            logger.info(f"Would reserve {len(lst)} task ID(s).")
+        # reserve range of task_ids to avoid collisions with parallel SLURM jobs
+        def max_task_id():
+            pipeline = [
+                {"$match": {"task_id": {"$regex": r"^mp-\d{7,}$"}}},
+                {
+                    "$project": {
+                        "task_id": 1,
+                        "prefix_num": {"$split": ["$task_id", "-"]},
+                    }
+                },
+                {"$project": {"num": {"$arrayElemAt": ["$prefix_num", -1]}}},
+                {"$addFields": {"num_int": {"$toInt": "$num"}}},
+                {"$group": {"_id": None, "num_max": {"$max": "$num_int"}}},
+            ]
+            result = list(target.collection.aggregate(pipeline))
+            return "mp", result[0]["num_max"] if result else 0
+
+        lst = reserve_ids(target.collection, "task_id", nmax, max_task_id, run=run)
+        task_ids = iter(lst)
+        msg = "Reserved" if run else "Would reserve"
+        logger.info(f"{msg} {len(lst)} task ID(s).")
 
-    sep_snlid = None
     if snl_metas:
         with open(snl_metas, "r") as f:
             snl_metas = json.load(f)
 
-        # reserve list of snl_ids to avoid collisions during multiprocessing
-        # insert empty doc with max ID + 1 into target collection for parallel SLURM jobs
-        all_snl_ids = snl_collection.distinct("snl_id")
-        prefixes = set()
-        next_snlid = -1
-
-        for snlid in all_snl_ids:
-            prefix, index = snlid.split("-", 1)
-            index = int(index)
-            prefixes.add(prefix)
-            if index > next_snlid:
-                next_snlid = index
-
-        next_snlid += 1
-        prefix = prefixes.pop()  # NOTE use the first prefix found
+        # reserve range of snl_ids to avoid collisions with parallel SLURM jobs
+        def max_snl_id():
+            prefixes = set()
+            num_max = -1
+
+            for snlid in snl_collection.distinct("snl_id"):
+                prefix, index = snlid.split("-", 1)
+                index = int(index)
+                prefixes.add(prefix)
+                if index > num_max:
+                    num_max = index
+
+            return prefixes.pop(), num_max  # NOTE use the first prefix found
+
         nsnls = len(snl_metas)
+        snl_ids = reserve_ids(snl_collection, "snl_id", nsnls, max_snl_id, run=run)
 
-        for n, launcher in enumerate(snl_metas):
-            snl_id = f"{prefix}-{next_snlid + n}"
+        for launcher, snl_id in zip(snl_metas, snl_ids):
             snl_metas[launcher]["snl_id"] = snl_id
 
-        if run:
-            sep_snlid = f"{prefix}-{next_snlid + nsnls}"
-            snl_collection.insert({"snl_id": sep_snlid})
-            logger.info(f"Inserted separator SNL with snl_id {sep_snlid}.")
-            logger.info(f"Reserved {nsnls} SNL ID(s).")
+        msg = "Reserved" if run else "Would reserve"
+        logger.info(f"{msg} {nsnls} SNL ID(s).")
+
+    from multiprocessing_logging import install_mp_handler
+
+    install_mp_handler(logger=logger)
+
+    no_dupe_check = ctx.parent.parent.params["no_dupe_check"]
+    manual_taskid = isinstance(task_ids, dict)
+    sbxn = list(filter(None, target.collection.distinct("sbxn")))
+    logger.info(f"Using sandboxes {sbxn}.")
+
+    # launchers submitted to the parse workers but not yet written to the target;
+    # bounds memory and blocks the directory walker while the writer catches up
+    inflight = threading.BoundedSemaphore(2 * nproc + batch_size)
+    results = queue.Queue()
+
+    def on_parsed(result):
+        if result is None:
+            inflight.release()
         else:
-            logger.info(f"Would reserve {nsnls} SNL ID(s).")
+            results.put(result)
+
+    def on_error(exc):
+        logger.error(f"Failed to parse launcher: {exc}")
+        inflight.release()
+
+    tags = [tag, SETTINGS.year_tags[-1]]
+    # parse workers offload GridFS data themselves to keep it out of this process
+    target_spec = ctx.parent.parent.params["spec_or_dbfile"] if run else None
+    initargs = (tags, store_volumetric_data, runs, target_spec)
+    pool = multiprocessing.Pool(nproc, initializer=init_parse_worker, initargs=initargs)
+    replace = {}  # re-parsed launcher -> dir_name of its previously parsed task
+    writer = ThreadPoolExecutor(max_workers=1)
+    written = writer.submit(
+        write_tasks,
+        target,
+        results,
+        inflight,
+        batch_size=batch_size,
+        run=run,
+        replace=replace,
+    )
+    parsed_blocks = {}  # block dir -> {launcher: dir_name} of already parsed tasks
+    gen = VaspDirsGenerator()
 
-    while iterator or queue:
-        try:
-            args = [next(iterator), tag, task_ids, snl_metas]
-            queue.append(pool.apply_async(parse_vasp_dirs, args))
-        except (StopIteration, TypeError):
-            iterator = None
-
-        while queue and (len(queue) >= pool._processes or not iterator):
-            process = queue.pop()
-            process.wait(1)
-            if not process.ready():
-                queue.append(process)
-            else:
-                count += process.get()
+    try:
+        for vaspdir in gen:
+            launcher = get_subdir(vaspdir)
+            parsed_launchers = get_parsed_launchers(
+                target.collection, [vaspdir], cache=parsed_blocks
+            )
+            existing_tags = None
+
+            if launcher in parsed_launchers:
+                if not no_dupe_check:
+                    if run:
+                        shutil.rmtree(vaspdir)
+                        logger.warning(f"{launcher} already parsed -> removed.")
+                    else:
+                        logger.warning(f"{launcher} already parsed -> would remove.")
+                    continue
+
+                logger.warning(f"FORCING re-parse of {launcher}!")
+                if not manual_taskid:
+                    raise ValueError("need --task-ids when re-parsing!")
+
+                doc = target.collection.find_one(
+                    {"dir_name": parsed_launchers[launcher]},
+                    {"tags": 1},
+                    sort=[("_id", -1)],
+                )
+                if doc and doc.get("tags"):
+                    # run through set to implicitly remove duplicate tags
+                    existing_tags = list(set(doc["tags"]))
+
+                replace[vaspdir] = parsed_launchers[launcher]
+
+            task_id = task_ids.get(launcher) if manual_taskid else next(task_ids)
+            if not task_id:
+                logger.error(f"Unable to determine task_id for {launcher}")
+                continue
+
+            snl_meta = snl_metas.get(launcher) if isinstance(snl_metas, dict) else None
+            while not inflight.acquire(timeout=5):
+                if written.done():
+                    written.result()  # re-raise if the writer failed
+                    raise EmmetCliError("Writer stopped before all tasks were parsed!")
+            pool.apply_async(
+                parse_vasp_dir,
+                (vaspdir, task_id, sbxn, snl_meta, existing_tags),
+                callback=on_parsed,
+                error_callback=on_error,
+            )
+    finally:
+        pool.close()
+        pool.join()
+        results.put(None)  # all launchers parsed -> let the writer finish
+
+    count = written.result()
+    writer.shutdown()
 
-    pool.close()
     if run:
         logger.info(
             f"Successfully parsed and inserted {count}/{gen.value} tasks in {directory}."
         )
-        if sep_tid:
-            target.collection.delete_one({"task_id": sep_tid})
-            logger.info(f"Removed separator task {sep_tid}.")
-        if sep_snlid:
-            snl_collection.remove({"snl_id": sep_snlid})
-            logger.info(f"Removed separator SNL {sep_snlid}.")
     else:
         logger.info(f"Would parse and insert {count}/{gen.value} tasks in {directory}.")
     return ReturnCodes.SUCCESS if count and gen.value else ReturnCodes.WARNING
@@ -1,10 +1,16 @@
+import gzip
 import itertools
+import json
 import logging
 import multiprocessing
 import os
+import queue
+import re
 import shutil
 import stat
-from collections import defaultdict
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
 from fnmatch import fnmatch
@@ -12,16 +18,23 @@ from glob import glob
 from pathlib import Path
 
 import click
-import mgzip
 from botocore.exceptions import EndpointConnectionError
 from atomate.vasp.database import VaspCalcDb
+from atomate.utils.utils import get_uri
 from atomate.vasp.drones import VaspDrone
 from dotty_dict import dotty
 from fireworks.fw_config import FW_BLOCK_FORMAT
 from mongogrant.client import Client
 from pymatgen.core import Structure
 from pymatgen.util.provenance import StructureNL
-from pymongo.errors import DocumentTooLarge
+from monty.json import MontyEncoder, jsanitize
+from pymongo import ReturnDocument
+from pymongo.errors import (
+    BulkWriteError,
+    DocumentTooLarge,
+    DuplicateKeyError,
+    PyMongoError,
+)
 from emmet.core.vasp.task_valid import TaskDocument
 from emmet.core.vasp.validation import ValidationDoc
 from pymatgen.entries.compatibility import MaterialsProject2020Compatibility
@@ -31,6 +44,10 @@ from emmet.core.utils import group_structures
 
 logger = logging.getLogger("emmet")
 perms = stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IWGRP
+_drone = None  # set per parse worker process by init_parse_worker
+_target = None  # target DB of a parse worker to offload GridFS data with
+fs_keys = ["bandstructure", "dos", "chgcar", "locpot", "elfcar"]
+fs_keys += [f"aeccar{i}" for i in range(3)]
 
 
 class EmmetCliError(Exception):
@@ -84,6 +101,57 @@ def calcdb_from_mgrant(spec_or_dbfile):
     )
 
 
+def reserve_ids(collection, field, n, bootstrap, run=True):
+    """reserve n consecutive `<prefix>-<number>` IDs for `field` in collection
+
+    Ranges are handed out by atomically incrementing a counter document in the
+    `counter` collection of the same database, so concurrent jobs never get
+    overlapping IDs. `bootstrap` returns the prefix and the current maximum number.
+    It is called to initialize the counter, and to move the counter past the IDs
+    inserted without it if a reserved range turns out to be in use already. Nothing
+    is reserved (and no counter created or moved) if not `run`.
+    """
+    counters = collection.database.counter
+    counter_id = f"{collection.name}.{field}"
+    counter = counters.find_one({"_id": counter_id})
+    synced = counter is None
+
+    if counter is None:
+        prefix, num_max = bootstrap()
+        counter = {"_id": counter_id, "prefix": prefix, "c": num_max}
+        if run:
+            try:
+                counters.insert_one(counter)
+                logger.info(f"Initialized counter {counter_id} at {prefix}-{num_max}.")
+            except DuplicateKeyError:
+                pass  # initialized by a concurrent job
+
+    while True:
+        if run:
+            counter = counters.find_one_and_update(
+                {"_id": counter_id},
+                {"$inc": {"c": n}},
+                return_document=ReturnDocument.AFTER,
+            )
+        else:
+            counter = dict(counter, c=counter["c"] + n)
+
+        start = counter["c"] - n + 1
+        ids = [f"{counter['prefix']}-{start + i}" for i in range(n)]
+        if synced or not collection.count_documents({field: {"$in": ids}}, limit=1):
+            return ids
+
+        _, num_max = bootstrap()
+        logger.warning(
+            f"Counter {counter_id} behind {field}s in use, moved to {num_max}."
+        )
+        synced = True
+        if run:
+            counters.update_one({"_id": counter_id}, {"$max": {"c": num_max}})
+        else:
+            counter = dict(counter, c=max(counter["c"] - n, num_max))
+
+
 def get_meta_from_structure(struct):
     d = {"formula_pretty": struct.composition.reduced_formula}
     d["nelements"] = len(set(struct.composition.elements))
@@ -111,7 +179,7 @@ def aggregate_by_formula(coll, q, key=None):
                 f"could not find one of the aggregation keys {SETTINGS.aggregation_keys} in {coll.full_name}!"
             )
 
-    push = {k.split(".")[-1]: f"${k}" for k in structure_keys[nested]}
+    push = {k.split(".")[-1]: f"${k}" for k in SETTINGS.structure_keys[nested]}
     return coll.aggregate(
         [
             {"$match": query},
@@ -148,6 +216,39 @@ def get_subdir(dn):
     return dn.rstrip(os.sep).rsplit(os.sep, 1)[-1]
 
 
+def get_parsed_launchers(collection, vaspdirs, cache=None):
+    """map launchers in vaspdirs to the dir_name of their already parsed task
+
+    Runs one projected query per block (parent directory of the launchers) on the
+    `dir_name` prefix (`host:/path/to/block/`) the drone gives the tasks parsed from
+    it. The anchored prefix is answered from the `dir_name` index alone. Results are
+    stored per block in `cache` so that each block is only queried once per run.
+    """
+    cache = {} if cache is None else cache
+    launchers = defaultdict(list)
+    for vaspdir in vaspdirs:
+        block_dir, launcher = os.path.split(vaspdir.rstrip(os.sep))
+        launchers[block_dir].append(launcher)
+
+    parsed = {}
+    for block_dir, block_launchers in launchers.items():
+        if block_dir not in cache:
+            prefix = get_uri(block_dir).rstrip(os.sep) + os.sep
+            query = {"dir_name": {"$regex": "^" + re.escape(prefix)}}
+            projection = {"_id": 0, "dir_name": 1}
+            cache[block_dir] = {
+                get_subdir(doc["dir_name"]): doc["dir_name"]
+                for doc in collection.find(query, projection)
+            }
+            logger.debug(f"Found {len(cache[block_dir])} parsed launchers in {prefix}.")
+
+        for launcher in block_launchers:
+            if launcher in cache[block_dir]:
+                parsed[launcher] = cache[block_dir][launcher]
+
+    return parsed
+
+
 def get_timestamp_dir(prefix="launcher"):
     time_now = datetime.utcnow().strftime(FW_BLOCK_FORMAT)
     return "_".join([prefix, time_now])
@@ -242,7 +343,28 @@ class VaspDirsGenerator:
         self.value = yield from self.gen
 
 
-def get_vasp_dirs():
+def gzip_file(fn):
+    """gzip a file in place, streaming it in blocks of `gzip_block_size` bytes
+
+    Returns the number of uncompressed bytes and the start and end time.
+    """
+    start = time.perf_counter()
+    fn_gz = fn + ".gz"
+    if os.path.exists(fn_gz):
+        os.remove(fn_gz)  # remove left-over gz (cancelled job)
+
+    with open(fn, "rb") as fo, gzip.open(fn_gz, "wb") as fw:
+        shutil.copyfileobj(fo, fw, SETTINGS.gzip_block_size)
+        nbytes = fo.tell()
+
+    if os.path.exists(fn):
+        os.remove(fn)  # remove original
+
+    shutil.chown(fn_gz, group="matgen")
+    return nbytes, start, time.perf_counter()
+
+
+def get_vasp_dirs():  # noqa: C901
     ctx = click.get_current_context()
     nmax = ctx.parent.params["nmax"]
     pattern = ctx.parent.params["pattern"]
@@ -255,81 +377,113 @@ def get_vasp_dirs():
         pattern_split = pattern.split(os.sep)
         pattern_split_len = len(pattern_split)
 
-    counter = 0
-    for root, dirs, files in os.walk(base_path, topdown=True):
-        if counter and not counter % 2000:
-            logger.info(f"{counter} launchers found ...")
-        if counter == nmax:
-            break
+    # launchers are compressed on a thread pool while the walk continues; up to
+    # `gzip_lookahead` launchers are in flight before the oldest one is yielded
+    pending = deque()
+    stats = {"bytes": 0, "start": float("inf"), "end": float("-inf")}
+
+    def finish_launcher(root, dir_type, jobs):
+        nbytes, starts, ends = 0, [], []
+        for job in jobs:
+            size, start, end = job.result()
+            nbytes += size
+            starts.append(start)
+            ends.append(end)
+
+        # NOTE skip symlink'ing on MP calculations from the early days
+        vasp_dir = get_symlinked_path(root, base_path_index) if reorg else root
+        if dir_type == "vasp":
+            create_orig_inputs(vasp_dir)
+
+        if jobs:
+            elapsed = max(ends) - min(starts)
+            stats["bytes"] += nbytes
+            stats["start"] = min([stats["start"]] + starts)
+            stats["end"] = max([stats["end"]] + ends)
+            rate = nbytes / 1024**2 / elapsed if elapsed else 0.0
+            logger.info(
+                f"{vasp_dir} (gzipped {len(jobs)} files, {nbytes / 1024**2:.1f} MB, {rate:.1f} MB/s)"
+            )
+        else:
+            logger.debug(vasp_dir)
 
-        level = len(root.split(os.sep)) - base_path_index
-        if pattern and dirs and pattern_split_len > level:
-            p = pattern_split[level]
-            dirs[:] = [d for d in dirs if fnmatch(d, p)]
-
-        for d in dirs:
-            dn = os.path.join(root, d)
-            st = os.stat(dn)
-            if not bool(st.st_mode & perms):
-                raise EmmetCliError(f"Insufficient permissions {st.st_mode} for {dn}.")
-
-        dir_type = get_dir_type(files)
-
-        if dir_type:
-            gzipped = False
-            for f in files:
-                fn = os.path.join(root, f)
-                if os.path.islink(fn):
-                    if run:
-                        fn_real = os.path.realpath(fn)
-                        if os.path.exists(fn_real):
-                            dst_name = f"{f}_copy"
-                            dst = os.path.join(root, dst_name)
-                            if os.path.isdir(fn_real):
-                                shutil.copytree(fn_real, dst)
-                            else:
-                                shutil.copy(fn_real, dst)
+        return vasp_dir
 
-                            os.unlink(fn)
-                            shutil.move(dst, fn)
-                            logger.debug(f"Resolved {fn}.")
-                        else:
-                            os.unlink(fn)
-                            logger.debug(f"Unlinked {fn}.")
-                    else:
-                        logger.debug(f"Would resolve or unlink {fn}.")
-                    continue
+    counter = 0
+    with ThreadPoolExecutor(max_workers=SETTINGS.gzip_threads) as executor:
+        for root, dirs, files in os.walk(base_path, topdown=True):
+            if counter and not counter % 2000:
+                logger.info(f"{counter} launchers found ...")
+            if counter + len(pending) == nmax:
+                break
+
+            level = len(root.split(os.sep)) - base_path_index
+            if pattern and dirs and pattern_split_len > level:
+                p = pattern_split[level]
+                dirs[:] = [d for d in dirs if fnmatch(d, p)]
 
-                st = os.stat(fn)
+            for d in dirs:
+                dn = os.path.join(root, d)
+                st = os.stat(dn)
                 if not bool(st.st_mode & perms):
                     raise EmmetCliError(
-                        f"Insufficient permissions {st.st_mode} for {fn}."
+                        f"Insufficient permissions {st.st_mode} for {dn}."
                     )
 
-                if run and not f.endswith(".gz"):
-                    fn_gz = fn + ".gz"
-                    if os.path.exists(fn_gz):
-                        os.remove(fn_gz)  # remove left-over gz (cancelled job)
+            dir_type = get_dir_type(files)
+
+            if dir_type:
+                jobs = []
+                for f in files:
+                    fn = os.path.join(root, f)
+                    if os.path.islink(fn):
+                        if run:
+                            fn_real = os.path.realpath(fn)
+                            if os.path.exists(fn_real):
+                                dst_name = f"{f}_copy"
+                                dst = os.path.join(root, dst_name)
+                                if os.path.isdir(fn_real):
+                                    shutil.copytree(fn_real, dst)
+                                else:
+                                    shutil.copy(fn_real, dst)
+
+                                os.unlink(fn)
+                                shutil.move(dst, fn)
+                                logger.debug(f"Resolved {fn}.")
+                            else:
+                                os.unlink(fn)
+                                logger.debug(f"Unlinked {fn}.")
+                        else:
+                            logger.debug(f"Would resolve or unlink {fn}.")
+                        continue
 
-                    with open(fn, "rb") as fo, mgzip.open(fn_gz, "wb", thread=0) as fw:
-                        fw.write(fo.read())
+                    st = os.stat(fn)
+                    if not bool(st.st_mode & perms):
+                        raise EmmetCliError(
+                            f"Insufficient permissions {st.st_mode} for {fn}."
+                        )
 
-                    if os.path.exists(fn):
-                        os.remove(fn)  # remove original
+                    if run and not f.endswith(".gz"):
+                        jobs.append(executor.submit(gzip_file, fn))
 
-                    shutil.chown(fn_gz, group="matgen")
-                    gzipped = True
+                dirs[:] = []  # don't descend further (i.e. ignore relax1/2)
+                pending.append((root, dir_type, jobs))
 
-            # NOTE skip symlink'ing on MP calculations from the early days
-            vasp_dir = get_symlinked_path(root, base_path_index) if reorg else root
-            if dir_type == "vasp":
-                create_orig_inputs(vasp_dir)
+                if len(pending) > SETTINGS.gzip_lookahead:
+                    yield finish_launcher(*pending.popleft())
+                    counter += 1
 
-            dirs[:] = []  # don't descend further (i.e. ignore relax1/2)
-            logger.log(logging.INFO if gzipped else logging.DEBUG, vasp_dir)
-            yield vasp_dir
+        while pending:
+            yield finish_launcher(*pending.popleft())
             counter += 1
 
+    if stats["bytes"]:
+        elapsed = stats["end"] - stats["start"]
+        rate = stats["bytes"] / 1024**2 / elapsed if elapsed else 0.0
+        logger.info(
+            f"Compressed {stats['bytes'] / 1024**3:.2f} GB in {elapsed:.1f}s ({rate:.1f} MB/s)."
+        )
+
     return counter
 
 
@@ -365,197 +519,291 @@ def reconstruct_command(sbatch=False):
     return " ".join(command).strip().strip("\\")
 
 
-def parse_vasp_dirs(vaspdirs, tag, task_ids, snl_metas):  # noqa: C901
-    process = multiprocessing.current_process()
-    name = process.name
-    chunk_idx = int(name.rsplit("-")[1]) - 1
-    logger.info(f"{name} starting.")
-    tags = [tag, SETTINGS.year_tags[-1]]
-    ctx = click.get_current_context()
-    spec_or_dbfile = ctx.parent.parent.params["spec_or_dbfile"]
-    target = calcdb_from_mgrant(spec_or_dbfile)
-    snl_collection = target.db.snls_user
-    sbxn = list(filter(None, target.collection.distinct("sbxn")))
-    logger.info(f"Using sandboxes {sbxn}.")
-    no_dupe_check = ctx.parent.parent.params["no_dupe_check"]
-    run = ctx.parent.parent.params["run"]
-    projection = {"tags": 1, "task_id": 1}
-    # projection = {"tags": 1, "task_id": 1, "calcs_reversed": 1}
-    count = 0
-    drone = VaspDrone(
+def init_parse_worker(tags, store_volumetric_data, runs, target_spec=None):
+    """set up the drone used by `parse_vasp_dir` in a parse worker process
+
+    With `target_spec`, the worker connects to the target DB to offload volumetric
+    data, DOS and band structures to GridFS itself.
+    """
+    global _drone, _target
+    _drone = VaspDrone(
         additional_fields={"tags": tags},
-        store_volumetric_data=ctx.params["store_volumetric_data"],
-        runs=ctx.params["runs"],
+        store_volumetric_data=store_volumetric_data,
+        runs=runs,
     )
-    # fs_keys = ["bandstructure", "dos", "chgcar", "locpot", "elfcar"]
-    # for i in range(3):
-    #    fs_keys.append(f"aeccar{i}")
+    _target = calcdb_from_mgrant(target_spec) if target_spec else None
 
-    for vaspdir in vaspdirs:
-        logger.info(f"{name} VaspDir: {vaspdir}")
-        launcher = get_subdir(vaspdir)
-        query = {"dir_name": {"$regex": launcher}}
-        manual_taskid = isinstance(task_ids, dict)
-        docs = list(
-            target.collection.find(query, projection).sort([("_id", -1)]).limit(1)
-        )
 
-        if docs:
-            if no_dupe_check:
-                logger.warning(f"FORCING re-parse of {launcher}!")
-                if not manual_taskid:
-                    raise ValueError("need --task-ids when re-parsing!")
-            else:
-                if run:
-                    shutil.rmtree(vaspdir)
-                    logger.warning(f"{name} {launcher} already parsed -> removed.")
-                else:
-                    logger.warning(f"{name} {launcher} already parsed -> would remove.")
-                continue
+def parse_vasp_dir(vaspdir, task_id, sbxn, snl_meta=None, existing_tags=None):
+    """assimilate and validate a single launcher in a parse worker
 
-        try:
-            task_doc = drone.assimilate(vaspdir)
-        except Exception as ex:
-            logger.error(f"Failed to assimilate {vaspdir}: {ex}")
-            continue
+    Returns a (vaspdir, task_doc, snl_dct) tuple for the writer stage or None if the
+    launcher did not yield a valid task. GridFS data is offloaded to the target of
+    the worker (or dropped without one), so that only slim task docs are handed back.
+    """
+    name = multiprocessing.current_process().name
+    launcher = get_subdir(vaspdir)
+    logger.info(f"{name} VaspDir: {vaspdir}")
 
-        task_doc["sbxn"] = sbxn
-        snl_metas_avail = isinstance(snl_metas, dict)
-        task_id = (
-            task_ids.get(launcher) if manual_taskid else task_ids[chunk_idx][count]
-        )
+    try:
+        task_doc = _drone.assimilate(vaspdir)
+    except Exception as ex:
+        logger.error(f"Failed to assimilate {vaspdir}: {ex}")
+        return None
 
-        if not task_id:
-            logger.error(f"Unable to determine task_id for {launcher}")
-            continue
+    task_doc["sbxn"] = sbxn
+    task_doc["task_id"] = task_id
+    logger.info(f"Using {task_id} for {launcher}.")
 
-        task_doc["task_id"] = task_id
-        logger.info(f"Using {task_id} for {launcher}.")
+    if existing_tags:
+        # make sure that task gets the same tags as the previously parsed task
+        task_doc["tags"] = task_doc["tags"] + existing_tags
+        logger.info(f"Adding existing tags {existing_tags} to {task_doc['tags']}.")
 
-        if docs:
-            # make sure that task gets the same tags as the previously parsed task
-            # (run through set to implicitly remove duplicate tags)
-            if docs[0]["tags"]:
-                existing_tags = list(set(docs[0]["tags"]))
-                task_doc["tags"] += existing_tags
-                logger.info(f"Adding existing tags {existing_tags} to {tags}.")
+    try:
+        task_document = TaskDocument(**task_doc)
+    except Exception as exc:
+        logger.error(f"Unable to construct a valid TaskDocument: {exc}")
+        return None
 
-        try:
-            task_document = TaskDocument(**task_doc)
-        except Exception as exc:
-            logger.error(f"Unable to construct a valid TaskDocument: {exc}")
-            continue
+    try:
+        validation_doc = ValidationDoc.from_task_doc(task_document)
+    except Exception as exc:
+        logger.error(f"Unable to construct a valid ValidationDoc: {exc}")
+        return None
+
+    if not validation_doc.valid:
+        logger.error(f"Not valid: {validation_doc.reasons}")
+        return None
+
+    if validation_doc.warnings:
+        logger.warn(validation_doc.warnings)
 
+    try:
+        MaterialsProject2020Compatibility().process_entry(task_document.structure_entry)
+    except Exception as exc:
+        logger.error(f"Unable to apply corrections: {exc}")
+        return None
+
+    snl_dct = None
+    if snl_meta:
+        references = snl_meta.get("references")
+        authors = snl_meta.get(
+            "authors", ["Materials Project <feedback@materialsproject.org>"]
+        )
+        kwargs = {"projects": [task_doc["tags"][0]]}  # tag of parsed directory
+        if references:
+            kwargs["references"] = references
+
+        struct = Structure.from_dict(task_doc["input"]["structure"])
+        snl = StructureNL(struct, authors, **kwargs)
+        snl_dct = snl.as_dict()
+        snl_dct.update(get_meta_from_structure(struct))
+        snl_id = snl_meta["snl_id"]
+        snl_dct["snl_id"] = snl_id
+        logger.info(f"Created SNL object for {snl_id}.")
+
+    if _target is not None and task_doc["state"] == "successful":
         try:
-            validation_doc = ValidationDoc.from_task_doc(task_document)
+            offload_task_data(_target, task_doc)
+        except EndpointConnectionError as exc:
+            logger.error(f"Connection failed for {task_id}: {exc}")
+            return None
         except Exception as exc:
-            logger.error(f"Unable to construct a valid ValidationDoc: {exc}")
-            continue
+            logger.error(f"Failed to offload data of {task_id} to GridFS: {exc}")
+            return None
+    else:
+        for calc in task_doc.get("calcs_reversed") or []:
+            for data_key in fs_keys:
+                calc.pop(data_key, None)
+
+    return vaspdir, task_doc, snl_dct
+
+
+def insert_task_doc(target, task_doc):
+    """insert a single task, dropping large outputs if it exceeds the BSON limit"""
+    try:
+        target.collection.insert_one(task_doc)
+        return True
+    except DocumentTooLarge:
+        output = dotty(task_doc["calcs_reversed"][0]["output"])
+        pop_keys = [
+            "normalmode_eigenvecs",
+            "force_constants",
+            "outcar.onsite_density_matrices",
+        ]
+
+        for k in pop_keys:
+            if k not in output:
+                continue
 
-        if not validation_doc.valid:
-            logger.error(f"Not valid: {validation_doc.reasons}")
+            logger.warning(f"Remove {k} from {task_doc['task_id']} and retry ...")
+            output.pop(k)
+            try:
+                target.collection.insert_one(task_doc)
+                return True
+            except DocumentTooLarge:
+                continue
+
+        logger.warning(f"Failed to reduce document size of {task_doc['task_id']}")
+        return False
+
+
+def offload_task_data(target, task_doc):
+    """move volumetric data, DOS and band structure of a task doc into GridFS"""
+    task_id = task_doc["task_id"]
+    calcs_reversed = task_doc.get("calcs_reversed")
+    for data_key in fs_keys:
+        if not calcs_reversed or data_key not in calcs_reversed[0]:
             continue
 
-        if validation_doc.warnings:
-            logger.warn(validation_doc.warnings)
+        data = calcs_reversed[0][data_key]
+        for calc in calcs_reversed:
+            calc.pop(data_key, None)
+
+        # insert_gridfs expects the serialized document (cf. VaspCalcDb.insert_task)
+        data = json.dumps(data, cls=MontyEncoder)
+        fs_id, compression = target.insert_gridfs(
+            data, collection=f"{data_key}_fs", task_id=task_id
+        )
+        calcs_reversed[0][f"{data_key}_fs_id"] = fs_id
+        calcs_reversed[0][f"{data_key}_compression"] = compression
+
+
+def insert_tasks(target, parsed, replace=None):  # noqa: C901
+    """insert a batch of parsed launchers into the target and remove them
+
+    Volumetric data, DOS and band structures not yet offloaded by the parse workers
+    are offloaded to GridFS per task before all task documents are written with a
+    single `insert_many`. Tasks that fail are
+    logged and skipped without affecting the rest of the batch. `replace` maps
+    launcher directories to the `dir_name` of their previously parsed task, which is
+    removed before the re-parsed task is inserted. Returns the number of inserted
+    tasks.
+    """
+    replace = replace or {}
+    docs, snls, vaspdirs = [], {}, {}
+    for vaspdir, task_doc, snl_dct in parsed:
+        if task_doc["state"] != "successful":
+            continue
 
+        task_id = task_doc["task_id"]
         try:
-            entry = MaterialsProject2020Compatibility().process_entry(
-                task_document.structure_entry
-            )
+            offload_task_data(target, task_doc)
+            task_doc["last_updated"] = datetime.utcnow()
+            docs.append(jsanitize(task_doc, allow_bson=True))
+        except EndpointConnectionError as exc:
+            logger.error(f"Connection failed for {task_id}: {exc}")
+            continue
         except Exception as exc:
-            logger.error(f"Unable to apply corrections: {exc}")
+            logger.error(f"Failed to prepare {task_id} for insertion: {exc}")
             continue
 
-        snl_dct = None
-        if snl_metas_avail:
-            snl_meta = snl_metas.get(launcher)
-            if snl_meta:
-                references = snl_meta.get("references")
-                authors = snl_meta.get(
-                    "authors", ["Materials Project <feedback@materialsproject.org>"]
+        vaspdirs[task_id] = vaspdir
+        if snl_dct:
+            snls[task_id] = snl_dct
+
+    if not docs:
+        return 0
+
+    task_ids = list(vaspdirs.keys())
+    replaced = {
+        task_id: replace[vaspdir]
+        for task_id, vaspdir in vaspdirs.items()
+        if vaspdir in replace
+    }
+    if replaced:
+        query = {
+            "$or": [
+                {"dir_name": {"$in": list(replaced.values())}},
+                {"task_id": {"$in": list(replaced.keys())}},
+            ]
+        }
+        result = target.collection.delete_many(query)
+        if result.deleted_count:
+            logger.warning(f"Removed {result.deleted_count} previously parsed tasks!")
+
+    query = {"task_id": {"$in": task_ids}}
+    try:
+        target.collection.insert_many(docs, ordered=False)
+    except (BulkWriteError, DocumentTooLarge) as exc:
+        logger.warning(f"Batch insert failed ({exc.__class__.__name__}), retrying.")
+        inserted = set(target.collection.distinct("task_id", query))
+        for doc in docs:
+            if doc["task_id"] not in inserted:
+                doc.pop("_id", None)
+                try:
+                    insert_task_doc(target, doc)
+                except Exception as ex:
+                    logger.error(f"Failed to insert {doc['task_id']}: {ex}")
+
+    inserted = set(target.collection.distinct("task_id", query))
+    snl_dcts = [
+        snls[task_id] for task_id in task_ids if task_id in inserted and task_id in snls
+    ]
+    if snl_dcts:
+        snl_collection = target.db.snls_user
+        try:
+            snl_collection.insert_many(snl_dcts, ordered=False)
+            logger.info(
+                f"{len(snl_dcts)} SNLs inserted into {snl_collection.full_name}."
+            )
+        except PyMongoError as exc:
+            logger.error(
+                f"Failed to insert SNLs into {snl_collection.full_name}: {exc}"
+            )
+
+    for task_id in task_ids:
+        if task_id in inserted:
+            launcher = get_subdir(vaspdirs[task_id])
+            try:
+                shutil.rmtree(vaspdirs[task_id])
+            except OSError as exc:
+                logger.error(
+                    f"Inserted {task_id} but failed to remove {launcher}: {exc}"
                 )
-                kwargs = {"projects": [tag]}
-                if references:
-                    kwargs["references"] = references
-
-                struct = Structure.from_dict(task_doc["input"]["structure"])
-                snl = StructureNL(struct, authors, **kwargs)
-                snl_dct = snl.as_dict()
-                snl_dct.update(get_meta_from_structure(struct))
-                snl_id = snl_meta["snl_id"]
-                snl_dct["snl_id"] = snl_id
-                logger.info(f"Created SNL object for {snl_id}.")
+                continue
+            logger.info(f"Successfully parsed and removed {launcher}.")
 
-        if run:
-            if task_doc["state"] == "successful":
-                if docs and no_dupe_check:
-                    # new_calc = task_doc["calcs_reversed"][0]
-                    # existing_calc = docs[0]["calcs_reversed"][0]
-                    # print(existing_calc.keys())
-
-                    # for fs_key in fs_keys:
-                    #    print(fs_key)
-                    #    fs_id_key = f"{fs_key}_fs_id"
-                    #    if fs_id_key in existing_calc:
-                    #        if fs_id_key in new_calc:
-                    #            # NOTE the duplicate fs_id / s3 object has already been
-                    #            # created in the drone though
-                    #            raise NotImplementedError(
-                    #                f"Missing duplicate check to decide on overwriting {key}_fs_id"
-                    #            )
-
-                    #        for k in [fs_id_key, f"{key}_compression"]:
-                    #            new_calc[k] = existing_calc[k]
-
-                    #        print(fs_id_key, task_doc["calcs_reversed"][0][fs_id_key])  # TODO CHECK
-                    target.collection.delete_one({"task_id": task_id})
-                    logger.warning(f"Removed previously parsed task {task_id}!")
-
-                # return count  # TODO remove
+    return len(inserted)
 
-                try:
-                    target.insert_task(task_doc, use_gridfs=True)
-                except EndpointConnectionError as exc:
-                    logger.error(f"Connection failed for {task_id}: {exc}")
-                    continue
-                except DocumentTooLarge:
-                    output = dotty(task_doc["calcs_reversed"][0]["output"])
-                    pop_keys = [
-                        "normalmode_eigenvecs",
-                        "force_constants",
-                        "outcar.onsite_density_matrices",
-                    ]
-
-                    for k in pop_keys:
-                        if k not in output:
-                            continue
-
-                        logger.warning(f"{name} Remove {k} and retry ...")
-                        output.pop(k)
-                        try:
-                            target.insert_task(task_doc, use_gridfs=True)
-                            break
-                        except DocumentTooLarge:
-                            continue
-                    else:
-                        logger.warning(f"{name} failed to reduce document size")
-                        continue
-                except Exception as ex:
-                    logger.error(f"{name} failed to insert: {ex}")
-                    continue
-
-                if target.collection.count_documents(query):
-                    if snl_dct:
-                        result = snl_collection.insert_one(snl_dct)
-                        logger.info(
-                            f"SNL {result.inserted_id} inserted into {snl_collection.full_name}."
-                        )
 
-                    shutil.rmtree(vaspdir)
-                    logger.info(f"{name} Successfully parsed and removed {launcher}.")
-                    count += 1
-        else:
-            count += 1
+def write_tasks(target, results, inflight, batch_size=50, run=False, replace=None):
+    """writer stage of the parse pipeline
+
+    Collects parsed launchers from the `results` queue into batches for `insert_tasks`
+    until None is received, and frees one `inflight` slot per written launcher to let
+    the directory walker submit more work. `replace` is handed to `insert_tasks`.
+    Returns the number of inserted tasks (or parsed launchers if not `run`).
+    """
+    count, batch, done = 0, [], False
+    while not done:
+        try:
+            item = results.get(timeout=5)
+        except queue.Empty:
+            item = False  # flush partial batch while parse workers are busy
+
+        if item is None:
+            done = True
+        elif item:
+            batch.append(item)
+            if len(batch) < batch_size:
+                continue
+
+        if not batch:
+            continue
+
+        try:
+            if run:
+                count += insert_tasks(target, batch, replace=replace)
+            else:
+                count += len(batch)
+        except PyMongoError as ex:
+            logger.error(f"Failed to insert batch of {len(batch)} tasks: {ex}")
+        finally:
+            # free the slots even if the batch failed to keep the walker going
+            for _ in batch:
+                inflight.release()
+            batch = []
 
     return count
@@ -17,7 +17,6 @@ setup(
         "colorama",
         "mongogrant",
         "atomate",
-        "mgzip",
         "slurmpy",
         "github3.py",
         "hpsspy",
@@ -0,0 +1,129 @@
+from collections import defaultdict
+from types import SimpleNamespace
+
+import mongomock
+import pytest
+from pymatgen.core import Lattice, Structure
+
+from emmet.cli import calc
+from emmet.cli.utils import get_meta_from_structure
+
+
+def make_snl(snl_id, structure):
+    dct = structure.as_dict()
+    dct.update(get_meta_from_structure(structure))
+    dct["snl_id"] = snl_id
+    # mongomock skips pushing documents with missing fields in aggregations
+    dct["about"] = {"_materialsproject": {"task_id": None}}
+    return dct
+
+
+@pytest.fixture
+def ctx(monkeypatch):
+    db = mongomock.MongoClient().db
+    index = db.canonical_structures
+    index.create_index([("collection", 1), ("formula", 1), ("id", 1)], unique=True)
+    monkeypatch.setattr(calc, "canonical_structures", defaultdict(dict))
+    return SimpleNamespace(
+        obj={"COLLECTIONS": {db.snls.full_name: db.snls}, "CANONICAL_INDEX": index}
+    )
+
+
+@pytest.fixture
+def snls(ctx):
+    fcc = Structure.from_spacegroup("Fm-3m", Lattice.cubic(3.6), ["Cu"], [[0, 0, 0]])
+    fcc_strained = Structure.from_spacegroup(
+        "Fm-3m", Lattice.cubic(3.62), ["Cu"], [[0, 0, 0]]
+    )
+    bcc = Structure.from_spacegroup("Im-3m", Lattice.cubic(2.9), ["Cu"], [[0, 0, 0]])
+    snls = [
+        make_snl("snl-1", fcc),
+        make_snl("snl-2", fcc_strained),
+        make_snl("snl-3", bcc),
+    ]
+    collection = ctx.obj["COLLECTIONS"]["db.snls"]
+    collection.insert_many(snls)
+    return collection
+
+
+def load_ids(ctx, monkeypatch, rebuild):
+    """canonical structure ids per spacegroup, asserting whether the index was rebuilt"""
+    calls = []
+
+    def group_structures(structures):
+        calls.append(structures)
+        return [[s] for s in structures]
+
+    monkeypatch.setattr(calc, "canonical_structures", defaultdict(dict))
+    monkeypatch.setattr(calc, "group_structures", group_structures)
+    calc.load_canonical_structures(ctx, "db.snls", "Cu")
+    assert bool(calls) == rebuild
+    return {
+        sg: sorted(s.id for s in structures)
+        for sg, structures in calc.canonical_structures["db.snls"]["Cu"].items()
+    }
+
+
+def test_load_canonical_structures(ctx, snls, monkeypatch):
+    index = ctx.obj["CANONICAL_INDEX"]
+    calc.load_canonical_structures(ctx, "db.snls", "Cu")
+    canonical = calc.canonical_structures["db.snls"]["Cu"]
+    assert {sg: len(structures) for sg, structures in canonical.items()} == {
+        225: 1,
+        229: 1,
+    }
+
+    # one index document per canonical structure plus the header
+    header = index.find_one({"id": None})
+    assert header["ndocs"] == 3
+    assert header["max_id"] == max(snls.distinct("_id"))
+    assert index.count_documents({"id": {"$ne": None}}) == 2
+
+    # an unchanged collection is loaded from the index
+    ids = {sg: [s.id for s in structures] for sg, structures in canonical.items()}
+    assert load_ids(ctx, monkeypatch, rebuild=False) == ids
+    loaded = calc.canonical_structures["db.snls"]["Cu"][225][0]
+    assert loaded.fingerprint == canonical[225][0].fingerprint
+
+
+def test_load_canonical_structures_stale(ctx, snls, monkeypatch):
+    calc.load_canonical_structures(ctx, "db.snls", "Cu")
+
+    # replacing a document keeps the count but triggers a rebuild
+    hcp = Structure.from_spacegroup(
+        "P6_3/mmc", Lattice.hexagonal(2.55, 4.2), ["Cu"], [[1 / 3, 2 / 3, 0.25]]
+    )
+    snls.update_one({"snl_id": "snl-3"}, {"$set": {"about.remarks": ["DEPRECATED"]}})
+    snls.insert_one(make_snl("snl-4", hcp))
+    ids = load_ids(ctx, monkeypatch, rebuild=True)
+    assert ids == {194: ["snl-4"], 225: ["snl-1", "snl-2"]}
+
+    # entries that are no longer canonical are removed from the index
+    index = ctx.obj["CANONICAL_INDEX"]
+    assert sorted(index.distinct("id", {"id": {"$ne": None}})) == [
+        "snl-1",
+        "snl-2",
+        "snl-4",
+    ]
+    assert load_ids(ctx, monkeypatch, rebuild=False) == ids
+
+    # the same holds when a document is updated in place
+    snls.update_one({"snl_id": "snl-4"}, {"$set": {"last_updated": "2024-01-01"}})
+    assert load_ids(ctx, monkeypatch, rebuild=True) == ids
+
+
+def test_add_canonical_structures(ctx, snls, monkeypatch):
+    calc.load_canonical_structures(ctx, "db.snls", "Cu")
+
+    hcp = Structure.from_spacegroup(
+        "P6_3/mmc", Lattice.hexagonal(2.55, 4.2), ["Cu"], [[1 / 3, 2 / 3, 0.25]]
+    )
+    new_snls = [make_snl("snl-4", hcp)]
+    snls.insert_many(new_snls)
+    calc.add_canonical_structures(ctx, "db.snls", new_snls)
+    assert [s.id for s in calc.canonical_structures["db.snls"]["Cu"][194]] == ["snl-4"]
+
+    # the header accounts for the new SNL so that the index stays current
+    ids = load_ids(ctx, monkeypatch, rebuild=False)
+    assert ids[194] == ["snl-4"]
+    assert ctx.obj["CANONICAL_INDEX"].find_one({"id": None})["ndocs"] == 4
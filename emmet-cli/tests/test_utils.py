@@ -0,0 +1,309 @@
+import gzip
+import os
+import queue
+import threading
+import time
+
+import click
+import mongomock
+import pytest
+from atomate.utils.utils import get_uri
+from bson.objectid import ObjectId
+from pymatgen.core import Lattice, Structure
+
+from emmet.cli import utils
+from emmet.cli.utils import (
+    get_parsed_launchers,
+    get_vasp_dirs,
+    gzip_file,
+    insert_tasks,
+    reserve_ids,
+    write_tasks,
+)
+
+
+class MemoryCalcDb:
+    """in-memory stand-in for VaspCalcDb with the insert_gridfs contract of atomate"""
+
+    def __init__(self, fail_task_ids=()):
+        self.db = mongomock.MongoClient().db
+        self.collection = self.db.tasks
+        self.gridfs = []
+        self.fail_task_ids = fail_task_ids
+
+    def insert_gridfs(self, d, collection="fs", compress=True, oid=None, task_id=None):
+        if task_id in self.fail_task_ids:
+            raise ValueError(f"GridFS unavailable for {task_id}")
+        d.encode()  # compressed as serialized string
+        self.gridfs.append((collection, task_id, d))
+        return ObjectId(), "zlib"
+
+
+def make_parsed(tmp_path, task_id, state="successful", dos=None, snl=False):
+    vaspdir = tmp_path / "block_2023" / f"launcher_{task_id}"
+    vaspdir.mkdir(parents=True)
+    calc = {"output": {"energy": -1.0}}
+    if dos is not None:
+        calc["dos"] = dos
+    task_doc = {
+        "task_id": task_id,
+        "state": state,
+        "dir_name": f"host:{vaspdir}",
+        "calcs_reversed": [calc],
+    }
+    snl_dct = {"snl_id": f"snl-{task_id}"} if snl else None
+    return str(vaspdir), task_doc, snl_dct
+
+
+@pytest.fixture
+def structure():
+    return Structure.from_spacegroup("Fm-3m", Lattice.cubic(3.6), ["Cu"], [[0, 0, 0]])
+
+
+def test_insert_tasks(tmp_path, structure):
+    target = MemoryCalcDb(fail_task_ids=["mp-4"])
+    parsed = [
+        make_parsed(tmp_path, "mp-1", dos=structure),
+        make_parsed(tmp_path, "mp-2", snl=True),
+        make_parsed(tmp_path, "mp-3", state="failed"),
+        make_parsed(tmp_path, "mp-4", dos={"energies": [0.0]}),
+    ]
+
+    assert insert_tasks(target, parsed) == 2
+    assert sorted(target.collection.distinct("task_id")) == ["mp-1", "mp-2"]
+    assert [(c, t) for c, t, _ in target.gridfs] == [("dos_fs", "mp-1")]
+    assert Structure.from_str(target.gridfs[0][2], fmt="json") == structure
+
+    calc = target.collection.find_one({"task_id": "mp-1"})["calcs_reversed"][0]
+    assert "dos" not in calc
+    assert calc["dos_compression"] == "zlib"
+    assert "dos_fs_id" in calc
+
+    assert target.db.snls_user.distinct("snl_id") == ["snl-mp-2"]
+    launchers = tmp_path / "block_2023"
+    assert sorted(p.name for p in launchers.iterdir()) == [
+        "launcher_mp-3",
+        "launcher_mp-4",
+    ]
+
+
+def test_insert_tasks_replace(tmp_path):
+    target = MemoryCalcDb()
+    vaspdir, task_doc, _ = make_parsed(tmp_path, "mp-9")
+    old_dir_name = "otherhost:/old/block_2023/launcher_mp-9"
+    target.collection.insert_one({"task_id": "mp-1", "dir_name": old_dir_name})
+
+    assert insert_tasks(target, [(vaspdir, task_doc, None)], {vaspdir: old_dir_name})
+    assert target.collection.distinct("task_id") == ["mp-9"]
+    assert target.collection.count_documents({"dir_name": old_dir_name}) == 0
+
+
+@pytest.mark.parametrize("run", [True, False])
+def test_write_tasks(tmp_path, run):
+    target = MemoryCalcDb(fail_task_ids=["mp-2"])
+    inflight = threading.BoundedSemaphore(5)
+    results = queue.Queue()
+    for i in range(5):
+        inflight.acquire()
+        results.put(make_parsed(tmp_path, f"mp-{i}", dos={"energies": [0.0]}))
+    results.put(None)
+
+    count = write_tasks(target, results, inflight, batch_size=2, run=run)
+    assert count == (4 if run else 5)
+    assert target.collection.count_documents({}) == (4 if run else 0)
+
+    # every launcher, including the failed one, frees its slot
+    for _ in range(5):
+        assert inflight.acquire(blocking=False)
+
+
+def test_write_tasks_releases_slots(tmp_path, monkeypatch):
+    target = MemoryCalcDb()
+    inflight = threading.BoundedSemaphore(3)
+    results = queue.Queue()
+    for i in range(3):
+        inflight.acquire()
+        results.put(make_parsed(tmp_path, f"mp-{i}"))
+    results.put(None)
+
+    def rmtree(path):
+        raise OSError(f"cannot remove {path}")
+
+    # tasks that cannot be removed after insertion do not stop the writer
+    monkeypatch.setattr(utils.shutil, "rmtree", rmtree)
+    assert write_tasks(target, results, inflight, batch_size=2, run=True) == 3
+    for _ in range(3):
+        assert inflight.acquire(blocking=False)
+    for _ in range(3):
+        inflight.release()
+
+    # unexpected errors propagate but still free the slots of the batch
+    def insert_tasks(*args, **kwargs):
+        raise RuntimeError("writer bug")
+
+    monkeypatch.setattr(utils, "insert_tasks", insert_tasks)
+    inflight.acquire()
+    results.put(make_parsed(tmp_path, "mp-9"))
+    with pytest.raises(RuntimeError):
+        write_tasks(target, results, inflight, batch_size=1, run=True)
+    assert inflight.acquire(blocking=False)
+
+
+def test_get_parsed_launchers(tmp_path):
+    collection = mongomock.MongoClient().db.tasks
+    block = tmp_path / "block_1"
+    parsed = {
+        "launcher_a": get_uri(block / "launcher_a"),
+        # same block name under another parent directory
+        "launcher_c": get_uri(tmp_path / "archive" / "block_1" / "launcher_c"),
+        "launcher_d": f"otherhost:{block / 'launcher_d'}",
+    }
+    collection.insert_many([{"dir_name": dir_name} for dir_name in parsed.values()])
+
+    vaspdirs = [str(block / f"launcher_{x}") for x in "abcd"]
+    vaspdirs.append(str(tmp_path / "block_2" / "launcher_e"))
+    cache = {}
+    result = get_parsed_launchers(collection, vaspdirs, cache=cache)
+    assert result == {"launcher_a": parsed["launcher_a"]}
+    assert set(cache) == {str(block), str(tmp_path / "block_2")}
+
+    # blocks are only queried once per cache
+    collection.insert_one({"dir_name": get_uri(block / "launcher_b")})
+    assert get_parsed_launchers(collection, vaspdirs, cache=cache) == result
+    assert "launcher_b" in get_parsed_launchers(collection, vaspdirs)
+
+
+@pytest.fixture
+def tasks():
+    collection = mongomock.MongoClient().db.tasks
+    collection.insert_many([{"task_id": f"mp-{i}"} for i in range(1, 4)])
+    return collection
+
+
+def make_bootstrap(collection):
+    calls = []
+
+    def bootstrap():
+        calls.append(True)
+        nums = [int(d["task_id"].split("-")[1]) for d in collection.find()]
+        return "mp", max(nums, default=0)
+
+    return bootstrap, calls
+
+
+def test_reserve_ids(tasks):
+    bootstrap, calls = make_bootstrap(tasks)
+    assert reserve_ids(tasks, "task_id", 2, bootstrap) == ["mp-4", "mp-5"]
+    assert reserve_ids(tasks, "task_id", 1, bootstrap) == ["mp-6"]
+    assert len(calls) == 1  # only to initialize the counter
+    assert tasks.database.counter.find_one()["c"] == 6
+
+    # IDs inserted without the counter move it past them
+    tasks.insert_many([{"task_id": f"mp-{i}"} for i in range(7, 10)])
+    assert reserve_ids(tasks, "task_id", 2, bootstrap) == ["mp-10", "mp-11"]
+    assert len(calls) == 2
+    assert reserve_ids(tasks, "task_id", 1, bootstrap) == ["mp-12"]
+
+
+def test_reserve_ids_concurrent_init(tasks):
+    counters = tasks.database.counter
+
+    def bootstrap():
+        # a concurrent job initializes the counter in the meantime
+        counters.insert_one({"_id": "tasks.task_id", "prefix": "mp", "c": 10})
+        return "mp", 3
+
+    assert reserve_ids(tasks, "task_id", 2, bootstrap) == ["mp-11", "mp-12"]
+    assert counters.find_one()["c"] == 12
+
+
+def test_reserve_ids_dry_run(tasks):
+    bootstrap, calls = make_bootstrap(tasks)
+    assert reserve_ids(tasks, "task_id", 2, bootstrap, run=False) == ["mp-4", "mp-5"]
+    assert tasks.database.counter.count_documents({}) == 0
+
+    reserve_ids(tasks, "task_id", 1, bootstrap)
+    tasks.insert_one({"task_id": "mp-5"})
+    assert reserve_ids(tasks, "task_id", 2, bootstrap, run=False) == ["mp-6", "mp-7"]
+    assert tasks.database.counter.find_one()["c"] == 4
+
+
+def test_gzip_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(utils.shutil, "chown", lambda *args, **kwargs: None)
+    monkeypatch.setattr(utils.SETTINGS, "gzip_block_size", 7)
+    fn = tmp_path / "OUTCAR"
+    content = b"".join(f"line {i}\n".encode() for i in range(100))
+    fn.write_bytes(content)
+    (tmp_path / "OUTCAR.gz").write_bytes(b"left-over")
+
+    nbytes, start, end = gzip_file(str(fn))
+    assert nbytes == len(content)
+    assert start <= end
+    assert not fn.exists()
+    with gzip.open(tmp_path / "OUTCAR.gz", "rb") as f:
+        assert f.read() == content
+
+
+@pytest.fixture
+def walk_context(tmp_path):
+    def make_context(nmax, run=True):
+        root = click.Context(click.Command("emmet"))
+        root.params = {"run": run}
+        parent = click.Context(click.Command("tasks"), parent=root)
+        parent.params = {"nmax": nmax, "pattern": "block_*", "directory": str(tmp_path)}
+        ctx = click.Context(click.Command("parse"), parent=parent)
+        ctx.params = {}
+        return ctx
+
+    return make_context
+
+
+def make_launchers(tmp_path, n):
+    launchers = []
+    for i in range(n):
+        launcher = tmp_path / "block_2023" / f"launcher_{i}"
+        launcher.mkdir(parents=True)
+        for f in ["INCAR", "OUTCAR", "vasprun.xml"]:
+            (launcher / f).write_text(f"{f} of launcher {i}")
+        launchers.append(launcher)
+    return launchers
+
+
+def test_get_vasp_dirs(tmp_path, walk_context, monkeypatch):
+    monkeypatch.setattr(utils.shutil, "chown", lambda *args, **kwargs: None)
+    monkeypatch.setattr(utils.SETTINGS, "gzip_lookahead", 2)
+    launchers = make_launchers(tmp_path, 5)
+    walked = [
+        os.path.join(root, d)
+        for root, dirs, _ in os.walk(tmp_path / "block_2023")
+        for d in dirs
+    ]
+
+    def slow_gzip_file(fn):
+        # launchers found first are compressed last
+        time.sleep(0.05 * (5 - walked.index(os.path.dirname(fn))))
+        return gzip_file(fn)
+
+    monkeypatch.setattr(utils, "gzip_file", slow_gzip_file)
+    with walk_context(nmax=3):
+        vaspdirs = list(get_vasp_dirs())
+
+    # launchers are yielded in walk order, at most nmax of them
+    assert vaspdirs == walked[:3]
+    for launcher in launchers:
+        gzipped = str(launcher) in vaspdirs
+        assert (launcher / "OUTCAR.gz").exists() == gzipped
+        assert (launcher / "OUTCAR").exists() != gzipped
+        if gzipped:
+            with gzip.open(launcher / "OUTCAR.gz", "rt") as f:
+                assert f.read() == f"OUTCAR of launcher {launcher.name[-1]}"
+            assert (launcher / "INCAR.orig.gz").exists()
+
+
+def test_get_vasp_dirs_dry_run(tmp_path, walk_context):
+    launchers = make_launchers(tmp_path, 3)
+    with walk_context(nmax=10, run=False):
+        vaspdirs = list(get_vasp_dirs())
+
+    assert sorted(vaspdirs) == [str(launcher) for launcher in launchers]
+    assert not list(tmp_path.glob("**/*.gz"))
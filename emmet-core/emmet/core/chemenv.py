@@ -13,12 +13,12 @@ from pymatgen.analysis.chemenv.coordination_environments.coordination_geometry_f
 from pymatgen.analysis.chemenv.coordination_environments.structure_environments import (
     LightStructureEnvironments,
 )
-from pymatgen.analysis.structure_analyzer import SpacegroupAnalyzer
 from pymatgen.core.structure import Molecule
 from pymatgen.core.structure import Structure
 
 from emmet.core.material_property import PropertyDoc
 from emmet.core.mpid import MPID
+from emmet.core.utils import get_spacegroup_analyzer
 
 DEFAULT_DISTANCE_CUTOFF = 1.4
 DEFAULT_ANGLE_CUTOFF = 0.3
@@ -419,7 +419,7 @@ class ChemEnvDoc(PropertyDoc):
 
             valences = [getattr(site.specie, "oxi_state", None) for site in structure]
             valences = [v for v in valences if v is not None]
-            sga = SpacegroupAnalyzer(structure)
+            sga = get_spacegroup_analyzer(structure)
             symm_struct = sga.get_symmetrized_structure()
             # We still need the whole list of indices
             inequivalent_indices = [
@@ -45,6 +45,14 @@ class EmmetSettings(BaseSettings):
     ANGLE_TOL: float = Field(
         5, description="Angle tolerance for structure matching in degrees."
     )
+    SYMMETRY_CACHE_SIZE: int = Field(
+        1024,
+        description="Maximum number of spacegroup analyses kept in the process-wide symmetry cache",
+    )
+    MOL_GRAPH_CACHE_SIZE: int = Field(
+        4096,
+        description="Maximum number of molecule graphs kept in the process-wide molecule graph cache",
+    )
 
     PGATOL: float = Field(
         0.3,
@@ -150,6 +158,11 @@ class EmmetSettings(BaseSettings):
         description="Default input sets for task validation",
     )
 
+    VASP_INPUT_SET_CACHE_SIZE: int = Field(
+        1024,
+        description="Maximum number of input set parameter bundles kept in the process-wide task validation cache",
+    )
+
     VASP_VALIDATE_POTCAR_HASHES: bool = Field(
         True, description="Whether to validate POTCAR hash values."
     )
@@ -9,7 +9,8 @@ from pydantic import BaseModel, Field, validator
 from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
 from pymatgen.core.composition import Composition
 from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
-from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+from emmet.core.utils import _fingerprint_structures, get_spacegroup_analyzer
 
 logger = logging.getLogger(__name__)
 
@@ -25,11 +26,11 @@ def generic_groupby(list_in, comp=operator.eq) -> List[int]:
     """
     list_out = [None] * len(list_in)  # type: List[Union[int, None]]
     label_num = 0
-    for i1, ls1 in enumerate(list_out):
-        if ls1 is not None:
+    for i1 in range(len(list_in)):
+        if list_out[i1] is not None:
             continue
         list_out[i1] = label_num
-        for i2, ls2 in list(enumerate(list_out))[i1 + 1 :]:
+        for i2 in range(i1 + 1, len(list_in)):
             if comp(list_in[i1], list_in[i2]):
                 if list_out[i2] is None:
                     list_out[i2] = list_out[i1]
@@ -259,18 +260,50 @@ def group_entries_with_structure_matcher(
     """
     if working_ion is None:
         wion: str = struct_matcher.as_dict()["ignored_species"][0]
+    else:
+        wion = working_ion
 
     # Sort the entries by symmetry and by working ion fraction
     def get_num_sym_ops(ent):
-        sga = SpacegroupAnalyzer(ent.structure)
+        sga = get_spacegroup_analyzer(ent.structure)
         return len(sga.get_space_group_operations())
 
     g.sort(key=get_num_sym_ops, reverse=True)
     g.sort(key=lambda x: x.composition.get_atomic_fraction(wion))
 
+    # Strip the ignored species and reduce every structure once up front,
+    # instead of twice per direction in every fit
+    sm = struct_matcher
+    reduced = [
+        sm._get_reduced_structure(s, sm._primitive_cell, niggli=True)
+        for s in sm._process_species([ent.structure for ent in g])
+    ]
+
+    if sm._scale and not sm._supercell and not sm._subset:
+        # See emmet.core.utils._fingerprint_structures, applied in both directions
+        fingerprints = _fingerprint_structures(reduced)
+        max_ratio = (1 + sm.ltol) * (1 + 1e-6)
+
+        def may_fit(i, j):
+            return (
+                fingerprints["num_sites"][i] == fingerprints["num_sites"][j]
+                and fingerprints["shortest"][i]
+                <= max_ratio * fingerprints["min_abc"][j]
+                and fingerprints["shortest"][j]
+                <= max_ratio * fingerprints["min_abc"][i]
+            )
+
+    else:
+
+        def may_fit(i, j):
+            return True
+
     labs = generic_groupby(
-        g,
-        comp=lambda x, y: struct_matcher.fit(x.structure, y.structure, symmetric=True),
+        list(range(len(g))),
+        comp=lambda i, j: may_fit(i, j)
+        and sm.fit(
+            reduced[i], reduced[j], symmetric=True, skip_structure_reduction=True
+        ),
     )
     for ilab in set(labs):
         sub_g = [g[itr] for itr, jlab in enumerate(labs) if jlab == ilab]
@@ -3,10 +3,10 @@ from typing import Any, Dict
 from pydantic import BaseModel, Field
 from pymatgen.core import Structure
 from pymatgen.core.structure import Molecule
-from pymatgen.symmetry.analyzer import PointGroupAnalyzer, SpacegroupAnalyzer, spglib
+from pymatgen.symmetry.analyzer import PointGroupAnalyzer, spglib
 
 from emmet.core.settings import EmmetSettings
-from emmet.core.utils import ValueEnum
+from emmet.core.utils import ValueEnum, get_spacegroup_analyzer
 
 SETTINGS = EmmetSettings()
 
@@ -147,10 +147,10 @@ class SymmetryData(BaseModel):
     @classmethod
     def from_structure(cls, structure: Structure) -> "SymmetryData":
         symprec = SETTINGS.SYMPREC
-        sg = SpacegroupAnalyzer(structure, symprec=symprec)
+        sg = get_spacegroup_analyzer(structure, symprec=symprec)
         symmetry: Dict[str, Any] = {"symprec": symprec}
         if not sg.get_symmetry_dataset():
-            sg = SpacegroupAnalyzer(structure, 1e-3, 1)
+            sg = get_spacegroup_analyzer(structure, 1e-3, 1)
             symmetry["symprec"] = 1e-3
 
         symmetry.update(
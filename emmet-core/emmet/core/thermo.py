@@ -1,9 +1,10 @@
 """ Core definition of a Thermo Document """
 from collections import defaultdict
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Set, Tuple, Union
 from datetime import datetime
 from emmet.core.utils import ValueEnum
 
+import numpy as np
 from pydantic import BaseModel, Field
 from pymatgen.analysis.phase_diagram import PhaseDiagram
 from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEntry
@@ -124,7 +125,7 @@ class ThermoDoc(PropertyDoc):
         thermo_type: Union[ThermoType, RunType],
         phase_diagram: Optional[PhaseDiagram] = None,
         use_max_chemsys: bool = False,
-        **kwargs
+        **kwargs,
     ):
         """Produce a list of ThermoDocs from a list of Entry objects
 
@@ -165,6 +166,7 @@ class ThermoDoc(PropertyDoc):
                 entry.energy,
             )
 
+        blessed_entries = {}
         for material_id, entry_group in entries_by_mpid.items():
             if (
                 use_max_chemsys
@@ -174,9 +176,26 @@ class ThermoDoc(PropertyDoc):
 
             sorted_entries = sorted(entry_group, key=_energy_eval)
 
-            blessed_entry = sorted_entries[0]
+            blessed_entries[material_id] = sorted_entries[0]
 
-            (decomp, ehull) = pd.get_decomp_and_e_above_hull(blessed_entry)
+        # Hull quantities are evaluated for all blessed entries at once
+        stable_entries = pd.stable_entries
+        blessed_list = list(blessed_entries.values())
+        decomps_and_ehulls = get_decomp_and_e_above_hull_batch(
+            pd, blessed_list, stable_entries=stable_entries
+        )
+        form_energies = get_form_energy_per_atom_batch(pd, blessed_list)
+        phase_separations = get_decomp_and_phase_separation_energy_batch(
+            pd,
+            blessed_list,
+            decomps_and_ehulls=decomps_and_ehulls,
+            stable_entries=stable_entries,
+        )
+
+        for i, (material_id, blessed_entry) in enumerate(blessed_entries.items()):
+            entry_group = entries_by_mpid[material_id]
+
+            (decomp, ehull) = decomps_and_ehulls[i]
 
             d = {
                 "thermo_id": "{}_{}".format(material_id, str(thermo_type)),
@@ -186,9 +205,9 @@ class ThermoDoc(PropertyDoc):
                 / blessed_entry.composition.num_atoms,
                 "energy_per_atom": blessed_entry.energy
                 / blessed_entry.composition.num_atoms,
-                "formation_energy_per_atom": pd.get_form_energy_per_atom(blessed_entry),
+                "formation_energy_per_atom": form_energies[i],
                 "energy_above_hull": ehull,
-                "is_stable": blessed_entry in pd.stable_entries,
+                "is_stable": blessed_entry in stable_entries,
             }
 
             # Uncomment to make last_updated line up with materials.
@@ -211,9 +230,11 @@ class ThermoDoc(PropertyDoc):
                 ]
 
             try:
-                decomp, energy = pd.get_decomp_and_phase_separation_energy(
-                    blessed_entry
-                )
+                phase_separation = phase_separations[i]
+                if isinstance(phase_separation, Exception):
+                    raise phase_separation
+
+                decomp, energy = phase_separation
                 d["decomposition_enthalpy"] = energy
                 d["decomposition_enthalpy_decomposes_to"] = [
                     {
@@ -257,19 +278,23 @@ class ThermoDoc(PropertyDoc):
         return docs
 
     @staticmethod
-    def construct_phase_diagram(entries) -> PhaseDiagram:
+    def construct_phase_diagram(entries, hull_entries=None) -> PhaseDiagram:
         """
         Efficienty construct a phase diagram using only the lowest entries at every composition
         represented in the entry data passed.
 
         Args:
             entries (List[ComputedStructureEntry]): List of corrected pymatgen entry objects.
+            hull_entries (List[ComputedStructureEntry]): Optional subset of entries that are
+                candidates for the convex hull. Entries known to lie above the hull (e.g. those
+                that are unstable in an already computed subsystem) can be left out to speed up
+                QHull. Defaults to all entries.
 
         Returns:
             PhaseDiagram: Pymatgen PhaseDiagram object
         """
         entries_by_comp = defaultdict(list)
-        for e in entries:
+        for e in hull_entries or entries:
             entries_by_comp[e.composition.reduced_formula].append(e)
 
         # Only use lowest entry per composition to speed up QHull in Phase Diagram
@@ -319,3 +344,172 @@ class PhaseDiagramDoc(BaseModel):
         description="Timestamp for the most recent calculation update for this property",
         default_factory=datetime.utcnow,
     )
+
+
+def get_decomp_and_e_above_hull_batch(
+    pd: PhaseDiagram,
+    entries: List[Union[ComputedEntry, ComputedStructureEntry]],
+    stable_entries: Optional[Set] = None,
+    facet_block_size: int = 256,
+) -> List[Tuple[Dict, float]]:
+    """
+    Batched equivalent of PhaseDiagram.get_decomp_and_e_above_hull. The barycentric
+    coordinates of all entries are evaluated against blocks of hull facets with
+    array operations, and every entry is assigned to the first facet containing it,
+    as PhaseDiagram does.
+
+    Args:
+        pd (PhaseDiagram): Phase diagram to evaluate the entries against
+        entries (List[Union[ComputedEntry, ComputedStructureEntry]]): Entries to evaluate
+        stable_entries (Optional[Set]): Stable entries of the phase diagram, if already known
+        facet_block_size (int): Number of facets evaluated at once, bounds memory use
+
+    Returns:
+        List[Tuple[Dict, float]]: (decomposition, energy above hull) for every entry
+    """
+    stable_entries = pd.stable_entries if stable_entries is None else stable_entries
+    results: List[Optional[Tuple[Dict, float]]] = [
+        ({e: 1.0}, 0.0) if e in stable_entries else None for e in entries
+    ]
+
+    todo = [i for i, r in enumerate(results) if r is None]
+    if not todo:
+        return results  # type: ignore
+
+    for i in todo:
+        if set(entries[i].composition.elements) - set(pd.elements):
+            raise ValueError(f"Unable to get decomposition for {entries[i]}")
+
+    # Augmented phase diagram coordinates, as used by Simplex.bary_coords
+    coords = np.array(
+        [
+            [entries[i].composition.get_atomic_fraction(el) for el in pd.elements[1:]]
+            + [1.0]
+            for i in todo
+        ]
+    )
+    aug_invs = np.array(
+        [
+            np.linalg.inv(
+                np.concatenate(
+                    [simplex.coords, np.ones((len(simplex.coords), 1))], axis=-1
+                )
+            )
+            for simplex in pd.simplexes
+        ]
+    )
+
+    facet_idx = np.full(len(todo), -1)
+    bary = np.zeros((len(todo), pd.dim))
+    tol = PhaseDiagram.numerical_tol / 10
+
+    for start in range(0, len(aug_invs), facet_block_size):
+        unassigned = np.where(facet_idx < 0)[0]
+        if len(unassigned) == 0:
+            break
+
+        block = aug_invs[start : start + facet_block_size]
+        # (facets, entries, vertices)
+        block_bary = np.einsum("nd,fde->fne", coords[unassigned], block)
+        inside = (block_bary >= -tol).all(axis=-1)
+
+        found = inside.any(axis=0)
+        first = inside.argmax(axis=0)[found]
+        facet_idx[unassigned[found]] = start + first
+        bary[unassigned[found]] = block_bary[first, np.where(found)[0]]
+
+    for n, i in enumerate(todo):
+        entry = entries[i]
+        if facet_idx[n] < 0:
+            raise ValueError(f"Unable to get decomposition for {entry}")
+
+        facet = pd.facets[facet_idx[n]]
+        decomp = {
+            pd.qhull_entries[f]: amt
+            for f, amt in zip(facet, bary[n])
+            if abs(amt) > PhaseDiagram.numerical_tol
+        }
+        e_above_hull = entry.energy_per_atom - sum(
+            e.energy_per_atom * amt for e, amt in decomp.items()
+        )
+
+        if e_above_hull < -PhaseDiagram.numerical_tol:
+            raise ValueError(
+                f"No valid decomposition found for {entry}! (e_h: {e_above_hull})"
+            )
+
+        results[i] = (decomp, e_above_hull)
+
+    return results  # type: ignore
+
+
+def get_form_energy_per_atom_batch(
+    pd: PhaseDiagram, entries: List[Union[ComputedEntry, ComputedStructureEntry]]
+) -> List[float]:
+    """
+    Batched equivalent of PhaseDiagram.get_form_energy_per_atom
+
+    Args:
+        pd (PhaseDiagram): Phase diagram holding the elemental references
+        entries (List[Union[ComputedEntry, ComputedStructureEntry]]): Entries to evaluate
+
+    Returns:
+        List[float]: Formation energy per atom for every entry
+    """
+    if not entries:
+        return []
+
+    fractions = np.array(
+        [[e.composition.get_atomic_fraction(el) for el in pd.elements] for e in entries]
+    )
+    ref_energies = np.array([pd.el_refs[el].energy_per_atom for el in pd.elements])
+    energies = np.array([e.energy_per_atom for e in entries])
+
+    return list(energies - fractions @ ref_energies)
+
+
+def get_decomp_and_phase_separation_energy_batch(
+    pd: PhaseDiagram,
+    entries: List[Union[ComputedEntry, ComputedStructureEntry]],
+    decomps_and_ehulls: Optional[List[Tuple[Dict, float]]] = None,
+    stable_entries: Optional[Set] = None,
+) -> List[Union[Tuple[Dict, float], Exception]]:
+    """
+    Batched equivalent of PhaseDiagram.get_decomp_and_phase_separation_energy.
+    Elemental entries and entries that are not polymorphs of a stable entry reduce
+    to the hull decomposition, which is reused from get_decomp_and_e_above_hull_batch.
+    Only the remaining entries need the SLSQP optimization, which is left to pymatgen.
+
+    Args:
+        pd (PhaseDiagram): Phase diagram to evaluate the entries against
+        entries (List[Union[ComputedEntry, ComputedStructureEntry]]): Entries to evaluate
+        decomps_and_ehulls (Optional[List[Tuple[Dict, float]]]): Output of
+            get_decomp_and_e_above_hull_batch for the same entries, if already computed
+        stable_entries (Optional[Set]): Stable entries of the phase diagram, if already known
+
+    Returns:
+        List[Union[Tuple[Dict, float], Exception]]: (decomposition, energy) for every entry,
+            or the exception raised while evaluating that entry
+    """
+    stable_entries = pd.stable_entries if stable_entries is None else stable_entries
+    if decomps_and_ehulls is None:
+        decomps_and_ehulls = get_decomp_and_e_above_hull_batch(
+            pd, entries, stable_entries=stable_entries
+        )
+
+    stable_formulas = {e.composition.reduced_formula for e in stable_entries}
+
+    results: List[Union[Tuple[Dict, float], Exception]] = []
+    for entry, decomp_and_ehull in zip(entries, decomps_and_ehulls):
+        is_stable_polymorph = entry.composition.reduced_formula in stable_formulas
+
+        if entry.is_element or not is_stable_polymorph:
+            results.append(decomp_and_ehull)
+            continue
+
+        try:
+            results.append(pd.get_decomp_and_phase_separation_energy(entry))
+        except ValueError as e:
+            results.append(e)
+
+    return results
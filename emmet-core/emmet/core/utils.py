@@ -1,8 +1,11 @@
-import copy
 import datetime
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from itertools import groupby
-from typing import Any, Dict, Iterator, List, Optional, Union
+from itertools import groupby, repeat
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -18,7 +21,9 @@ from pymatgen.analysis.structure_matcher import (
     ElementComparator,
     StructureMatcher,
 )
+from pymatgen.core.sites import Site
 from pymatgen.core.structure import Molecule, Structure
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.util.graph_hashing import weisfeiler_lehman_graph_hash
 
 from emmet.core.mpid import MPculeID
@@ -32,10 +37,74 @@ except ImportError:
 SETTINGS = EmmetSettings()
 
 
+_SYMMETRY_CACHE: "OrderedDict[Tuple[str, float, float], SpacegroupAnalyzer]" = (
+    OrderedDict()
+)
+_SYMMETRY_CACHE_LOCK = threading.Lock()
+
+_MOL_GRAPH_CACHE: "OrderedDict[str, List[Tuple[int, int, int, Dict]]]" = OrderedDict()
+_MOL_GRAPH_CACHE_LOCK = threading.Lock()
+
+# Loosens the structure fingerprint prefilter slightly so that numerical noise in
+# the reduction never rejects a match
+_FINGERPRINT_RTOL = 1e-6
+
+
+def get_structure_hash(structure: Structure) -> str:
+    """
+    Hash of everything SpacegroupAnalyzer reads from a structure: the lattice,
+    the fractional coordinates, the species on each site and the site properties
+    """
+    sha = hashlib.sha1()
+    sha.update(np.ascontiguousarray(structure.lattice.matrix).tobytes())
+    sha.update(np.ascontiguousarray(structure.frac_coords).tobytes())
+    sha.update(
+        repr(
+            [
+                sorted((str(sp), occu) for sp, occu in site.species.items())
+                for site in structure
+            ]
+        ).encode()
+    )
+    sha.update(repr(sorted(structure.site_properties.items())).encode())
+    return sha.hexdigest()
+
+
+def get_spacegroup_analyzer(
+    structure: Structure, symprec: float = 0.01, angle_tolerance: float = 5.0
+) -> SpacegroupAnalyzer:
+    """
+    Returns a SpacegroupAnalyzer for the structure from a process-wide cache
+    bounded by SETTINGS.SYMMETRY_CACHE_SIZE, so spglib is only run once per
+    structure and tolerance. The analyzer is shared and should not be modified.
+    It is built on a copy, so later changes to the structure cannot leak into it.
+
+    Args:
+        structure (Structure): structure to analyze
+        symprec (float): symmetry tolerance passed on to spglib
+        angle_tolerance (float): angle tolerance passed on to spglib
+    """
+    key = (get_structure_hash(structure), symprec, angle_tolerance)
+    with _SYMMETRY_CACHE_LOCK:
+        if key in _SYMMETRY_CACHE:
+            _SYMMETRY_CACHE.move_to_end(key)
+            return _SYMMETRY_CACHE[key]
+
+    sga = SpacegroupAnalyzer(
+        structure.copy(), symprec=symprec, angle_tolerance=angle_tolerance
+    )
+
+    with _SYMMETRY_CACHE_LOCK:
+        _SYMMETRY_CACHE[key] = sga
+        while len(_SYMMETRY_CACHE) > SETTINGS.SYMMETRY_CACHE_SIZE:
+            _SYMMETRY_CACHE.popitem(last=False)
+    return sga
+
+
 def get_sg(struc, symprec=SETTINGS.SYMPREC) -> int:
     """helper function to get spacegroup with a loose tolerance"""
     try:
-        return struc.get_space_group_info(symprec=symprec)[1]
+        return get_spacegroup_analyzer(struc, symprec=symprec).get_space_group_number()
     except Exception:
         return -1
 
@@ -47,19 +116,99 @@ def group_structures(
     angle_tol: float = SETTINGS.ANGLE_TOL,
     symprec: float = SETTINGS.SYMPREC,
     comparator: AbstractComparator = ElementComparator(),
+    num_processes: int = 1,
 ) -> Iterator[List[Structure]]:
     """
     Groups structures according to space group and structure matching
 
+    Within each space group, structures are only fit against cluster
+    representatives that pass a cheap fingerprint prefilter (see
+    _fingerprint_structures), so the groupings are identical to
+    StructureMatcher.group_structures with far fewer calls to fit.
+
     Args:
         structures ([Structure]): list of structures to group
         ltol (float): StructureMatcher tuning parameter for matching tasks to materials
         stol (float): StructureMatcher tuning parameter for matching tasks to materials
         angle_tol (float): StructureMatcher tuning parameter for matching tasks to materials
         symprec (float): symmetry tolerance for space group finding
+        num_processes (int): number of processes used to match space group buckets
+            in parallel. The default of 1 matches everything in this process
+    """
+
+    sm = _get_structure_matcher(ltol, stol, angle_tol, comparator)
+
+    def _get_sg(struc):
+        return get_sg(struc, symprec=symprec)
+
+    # First group by spacegroup number then by structure matching
+    pregroups = [
+        list(pregroup)
+        for _, pregroup in groupby(sorted(structures, key=_get_sg), key=_get_sg)
+    ]
+
+    if num_processes > 1 and len(pregroups) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(num_processes, len(pregroups))
+        ) as executor:
+            for groups in executor.map(
+                _match_structures, repeat(sm), pregroups, chunksize=1
+            ):
+                yield from groups
+    else:
+        for pregroup in pregroups:
+            yield from _match_structures(sm, pregroup)
+
+
+def get_structure_fingerprints(
+    structures: List[Structure],
+    ltol: float = SETTINGS.LTOL,
+    stol: float = SETTINGS.STOL,
+    angle_tol: float = SETTINGS.ANGLE_TOL,
+    comparator: AbstractComparator = ElementComparator(),
+) -> List[Dict[str, float]]:
     """
+    Fingerprints of structures as reduced by the matcher of group_structures
+
+    They are small enough to be stored alongside structures so that comparisons
+    that can never match are skipped with structures_may_match, without having
+    to reduce the stored structures again.
 
-    sm = StructureMatcher(
+    Args:
+        structures ([Structure]): list of structures to fingerprint
+        ltol (float): StructureMatcher tuning parameter for matching tasks to materials
+        stol (float): StructureMatcher tuning parameter for matching tasks to materials
+        angle_tol (float): StructureMatcher tuning parameter for matching tasks to materials
+    """
+    sm = _get_structure_matcher(ltol, stol, angle_tol, comparator)
+    fingerprints = _fingerprint_structures(_reduce_structures(sm, structures))
+    return [
+        {k: v[i].item() for k, v in fingerprints.items()}
+        for i in range(len(structures))
+    ]
+
+
+def structures_may_match(
+    fingerprint: Dict[str, float],
+    other_fingerprint: Dict[str, float],
+    ltol: float = SETTINGS.LTOL,
+) -> bool:
+    """
+    Whether group_structures could group the structure with fingerprint (as the
+    first one) together with the structure with other_fingerprint
+
+    False guarantees that the structures do not match, True still requires a fit.
+    """
+    return fingerprint["num_sites"] == other_fingerprint["num_sites"] and (
+        fingerprint["shortest"]
+        <= (1 + ltol) * (1 + _FINGERPRINT_RTOL) * other_fingerprint["min_abc"]
+    )
+
+
+def _get_structure_matcher(
+    ltol: float, stol: float, angle_tol: float, comparator: AbstractComparator
+) -> StructureMatcher:
+    return StructureMatcher(
         ltol=ltol,
         stol=stol,
         angle_tol=angle_tol,
@@ -70,13 +219,89 @@ def group_structures(
         comparator=comparator,
     )
 
-    def _get_sg(struc):
-        return get_sg(struc, symprec=symprec)
 
-    # First group by spacegroup number then by structure matching
-    for _, pregroup in groupby(sorted(structures, key=_get_sg), key=_get_sg):
-        for group in sm.group_structures(list(pregroup)):
-            yield group
+def _reduce_structures(
+    sm: StructureMatcher, structures: List[Structure]
+) -> List[Structure]:
+    """Structures as compared by sm.fit after its own reduction"""
+    processed = sm._process_species(structures)
+    return [
+        sm._get_reduced_structure(s, sm._primitive_cell, niggli=True) for s in processed
+    ]
+
+
+def _fingerprint_structures(structures: List[Structure]) -> Dict[str, np.ndarray]:
+    """
+    Computes the invariants used to skip StructureMatcher.fit calls
+    that can never succeed for a matcher with primitive_cell=True,
+    scale=True and attempt_supercell=False
+
+    Both are taken on the reduced structures used by the matcher:
+        num_sites: fit requires the same number of sites in both structures
+        shortest / min_abc: lattice lengths normalized by the cube root of
+            the volume, since scale=True rescales both cells to the same volume.
+            A fit of ref onto other needs a vector of ref within a factor of
+            (1 + ltol) of each of other's lattice lengths, so the shortest
+            vector of ref can be at most (1 + ltol) times other's shortest
+            lattice parameter
+
+    Volume per atom is deliberately not used since scale=True discards it.
+    """
+    num_sites = np.array([len(s) for s in structures])
+    norms = np.array([s.volume ** (1 / 3) for s in structures])
+    shortest = np.array([s.lattice.get_niggli_reduced_lattice().a for s in structures])
+    min_abc = np.array([min(s.lattice.abc) for s in structures])
+    return {
+        "num_sites": num_sites,
+        "shortest": shortest / norms,
+        "min_abc": min_abc / norms,
+    }
+
+
+def _match_structures(
+    sm: StructureMatcher, structures: List[Structure]
+) -> List[List[Structure]]:
+    """
+    Same grouping as sm.group_structures(structures) but only calls
+    fit for pairs that pass the fingerprint prefilter.
+
+    Each cluster is seeded by the first unmatched structure, which is then
+    fit against the remaining unmatched structures in order, exactly like
+    StructureMatcher.group_structures. Every skipped pair is one that fit would
+    reject, so the groups and their order are unchanged.
+    """
+    reduced = _reduce_structures(sm, structures)
+    fingerprints = _fingerprint_structures(reduced)
+    max_ratio = (1 + sm.ltol) * (1 + _FINGERPRINT_RTOL)
+
+    def c_hash(i):
+        return sm._comparator.get_hash(reduced[i].composition)
+
+    all_groups = []
+    for _, g in groupby(sorted(range(len(reduced)), key=c_hash), key=c_hash):
+        unmatched = np.array(list(g), dtype=int)
+        while len(unmatched) > 0:
+            ref, unmatched = unmatched[0], unmatched[1:]
+            candidates = np.flatnonzero(
+                (fingerprints["num_sites"][unmatched] == fingerprints["num_sites"][ref])
+                & (
+                    fingerprints["shortest"][ref]
+                    <= max_ratio * fingerprints["min_abc"][unmatched]
+                )
+            )
+            inds = [
+                i
+                for i in candidates
+                if sm.fit(
+                    reduced[ref], reduced[unmatched[i]], skip_structure_reduction=True
+                )
+            ]
+            all_groups.append(
+                [structures[ref]] + [structures[unmatched[i]] for i in inds]
+            )
+            unmatched = np.delete(unmatched, inds)
+
+    return all_groups
 
 
 def group_molecules(molecules: List[Molecule]):
@@ -88,6 +313,11 @@ def group_molecules(molecules: List[Molecule]):
         identical structures. Collapsing similar structures on the basis of e.g.
         graph isomorphism happens at a later stage.
 
+    Molecules are only compared with groups that could possibly match them
+    (see _MoleculeSignature), so the groups are identical to fitting every
+    molecule against every previous group, with far fewer calls to
+    MoleculeMatcher.fit.
+
     Args:
         molecules (List[Molecule])
     """
@@ -106,33 +336,104 @@ def group_molecules(molecules: List[Molecule]):
     # First, group by formula
     # Hopefully this step is unnecessary - builders should already be doing this
     for mol_key, pregroup in groupby(sorted(molecules, key=_mol_form), key=_mol_form):
-        groups: List[Dict[str, Any]] = list()
+        # Single atoms could always have identical structure
+        # So grouping by geometry isn't enough
+        # Need to also group by charge and spin
+        # Larger molecules are compared as neutral molecules, so charge and spin do not matter
+        buckets: Dict[Tuple[float, float], List[_MoleculeSignature]] = dict()
+        groups: List[List[Molecule]] = list()
         for mol in pregroup:
-            mol_copy = copy.deepcopy(mol)
-
-            # Single atoms could always have identical structure
-            # So grouping by geometry isn't enough
-            # Need to also group by charge
-            if len(mol_copy) > 1:
-                mol_copy.set_charge_and_spin(0)
+            bucket_key: Tuple[float, float]
+            if len(mol) > 1:
+                bucket_key = (0, 0)
+            else:
+                bucket_key = (mol.charge, mol.spin_multiplicity)
+            bucket = buckets.setdefault(bucket_key, list())
+
+            signature = _MoleculeSignature(mol, mm._tolerance)
             matched = False
 
             # Group by structure
-            for group in groups:
-                if (
-                    (mm.fit(mol_copy, group["mol"]) or mol_copy == group["mol"])
-                    and mol_copy.charge == group["mol"].charge
-                    and mol_copy.spin_multiplicity == group["mol"].spin_multiplicity
+            for group in bucket:
+                may_fit, may_equal = group.may_match(signature)
+                if (may_fit and mm.fit(signature.neutral, group.neutral)) or (
+                    may_equal and all(site in group.mol for site in mol)
                 ):
-                    group["mol_list"].append(mol)
+                    groups[group.index].append(mol)
                     matched = True
                     break
 
             if not matched:
-                groups.append({"mol": mol_copy, "mol_list": [mol]})
+                signature.index = len(groups)
+                bucket.append(signature)
+                groups.append([mol])
+
+        yield from groups
+
+
+class _MoleculeSignature:
+    """
+    Cheap invariants of a molecule, used by group_molecules to skip comparisons
+    that can never succeed
+
+    Two molecules can only fit with an RMSD below tolerance if each of their
+    sorted interatomic distances differ by at most 2 * sqrt(N) * tolerance. Two
+    molecules can only be equal (in the sense of Molecule.__eq__, i.e. every site
+    of one is within np.allclose of a site of the other) if the bounding box of
+    the first fits in the slightly enlarged bounding box of the second.
+    """
 
-        for group in groups:
-            yield group["mol_list"]
+    def __init__(self, mol: Molecule, tolerance: float):
+        self.mol = mol
+        self.index = -1
+
+        coords = mol.cart_coords
+        self.distances = np.sort(
+            np.linalg.norm(coords[:, None, :] - coords[None, :, :], axis=-1)[
+                np.triu_indices(len(mol), k=1)
+            ]
+        )
+        self.max_distance_diff = 2 * np.sqrt(len(mol)) * tolerance + 1e-8
+        self.lower = coords.min(axis=0)
+        self.upper = coords.max(axis=0)
+        # np.allclose tolerance of Site.__eq__, plus a margin for rounding
+        self.coords_tol = (Site.position_atol + 1e-5 * np.abs(coords).max(axis=0)) * (
+            1 + 1e-6
+        )
+
+        self._neutral: Optional[Molecule] = None
+
+    @property
+    def neutral(self) -> Molecule:
+        """
+        The molecule as it is fit by MoleculeMatcher: neutral unless it is a single atom
+        """
+        if self._neutral is None:
+            if len(self.mol) > 1:
+                self._neutral = Molecule(self.mol.species, self.mol.cart_coords.tolist())
+            else:
+                self._neutral = self.mol
+        return self._neutral
+
+    def may_match(self, other: "_MoleculeSignature") -> Tuple[bool, bool]:
+        """
+        Whether other could fit this molecule and whether other could be equal to
+        this molecule
+
+        Args:
+            other (_MoleculeSignature): signature of a molecule with the same formula
+        """
+        may_fit = bool(
+            np.all(
+                np.abs(self.distances - other.distances)
+                <= max(self.max_distance_diff, other.max_distance_diff)
+            )
+        )
+        may_equal = bool(
+            np.all(other.lower >= self.lower - self.coords_tol)
+            and np.all(other.upper <= self.upper + self.coords_tol)
+        )
+        return may_fit, may_equal
 
 
 def confirm_molecule(mol: Union[Molecule, Dict]):
@@ -150,6 +451,63 @@ def confirm_molecule(mol: Union[Molecule, Dict]):
         return mol
 
 
+def get_molecule_hash(mol: Molecule, decimals: int = 6) -> str:
+    """
+    Hash of the geometry of a molecule: its species, its Cartesian coordinates
+    rounded to the given number of decimals (in Angstrom), its charge and its
+    spin multiplicity
+
+    :param mol: Molecule
+    :param decimals: Number of decimals the coordinates are rounded to
+    :return: string of the hash
+    """
+    sha = hashlib.sha1()
+    sha.update(repr([str(sp) for sp in mol.species]).encode())
+    # Adding 0.0 turns -0.0 into 0.0, so that it hashes the same
+    coords = np.round(mol.cart_coords, decimals) + 0.0
+    sha.update(np.ascontiguousarray(coords).tobytes())
+    sha.update(repr((mol.charge, mol.spin_multiplicity)).encode())
+    return sha.hexdigest()
+
+
+def _get_mol_graph_edges(mol: Molecule) -> List[Tuple[int, int, int, Dict]]:
+    """
+    Edges of the OpenBabelNN + metal_edge_extender MoleculeGraph of a molecule
+    """
+    mol_graph = MoleculeGraph.with_local_env_strategy(mol, OpenBabelNN())
+    mol_graph = metal_edge_extender(mol_graph)
+    return list(mol_graph.graph.edges(keys=True, data=True))
+
+
+def _mol_graph_from_edges(
+    mol: Molecule, edges: List[Tuple[int, int, int, Dict]]
+) -> MoleculeGraph:
+    """
+    Rebuild an OpenBabelNN + metal_edge_extender MoleculeGraph from its edges
+    """
+    mol_graph = MoleculeGraph.with_empty_graph(
+        mol, name="bonds", edge_weight_name="weight", edge_weight_units=""
+    )
+    mol_graph.graph.add_edges_from(edges)
+    mol_graph.set_node_attributes()
+    return mol_graph
+
+
+def _cache_mol_graph_edges(key: str, edges: List[Tuple[int, int, int, Dict]]):
+    with _MOL_GRAPH_CACHE_LOCK:
+        _MOL_GRAPH_CACHE[key] = edges
+        while len(_MOL_GRAPH_CACHE) > SETTINGS.MOL_GRAPH_CACHE_SIZE:
+            _MOL_GRAPH_CACHE.popitem(last=False)
+
+
+def _get_cached_mol_graph_edges(key: str) -> Optional[List[Tuple[int, int, int, Dict]]]:
+    with _MOL_GRAPH_CACHE_LOCK:
+        if key in _MOL_GRAPH_CACHE:
+            _MOL_GRAPH_CACHE.move_to_end(key)
+            return _MOL_GRAPH_CACHE[key]
+    return None
+
+
 def make_mol_graph(
     mol: Molecule, critic_bonds: Optional[List[List[int]]] = None
 ) -> MoleculeGraph:
@@ -160,14 +518,24 @@ def make_mol_graph(
     This bonding scheme was used to define bonding for the Lithium-Ion Battery
     Electrolyte (LIBE) dataset (DOI: 10.1038/s41597-021-00986-9)
 
+    The OpenBabelNN + metal_edge_extender bonds are kept in a process-wide cache
+    keyed by get_molecule_hash and bounded by SETTINGS.MOL_GRAPH_CACHE_SIZE, so
+    they are only computed once per geometry. A new MoleculeGraph is returned on
+    every call, so it is safe to modify.
+
     :param mol: Molecule to be converted to MoleculeGraph
     :param critic_bonds: (optional) List of lists [a, b], where a and b are
         atom indices (0-indexed)
 
     :return: mol_graph, a MoleculeGraph
     """
-    mol_graph = MoleculeGraph.with_local_env_strategy(mol, OpenBabelNN())
-    mol_graph = metal_edge_extender(mol_graph)
+    key = get_molecule_hash(mol)
+    edges = _get_cached_mol_graph_edges(key)
+    if edges is None:
+        edges = _get_mol_graph_edges(mol)
+        _cache_mol_graph_edges(key, edges)
+
+    mol_graph = _mol_graph_from_edges(mol, edges)
     if critic_bonds:
         mg_edges = mol_graph.graph.edges()
         for bond in critic_bonds:
@@ -179,6 +547,51 @@ def make_mol_graph(
     return mol_graph
 
 
+def make_mol_graphs(
+    mols: List[Molecule], num_processes: int = 1
+) -> List[MoleculeGraph]:
+    """
+    Construct the OpenBabelNN + metal_edge_extender MoleculeGraphs of many
+    molecules at once, see make_mol_graph.
+
+    Geometries that are not in the cache are only computed once each, in a pool
+    of worker processes if num_processes > 1.
+
+    :param mols: Molecules to be converted to MoleculeGraphs
+    :param num_processes: Number of processes used to build the graphs. The
+        default of 1 builds everything in this process
+
+    :return: list of MoleculeGraphs, in the same order as mols
+    """
+    keys = [get_molecule_hash(mol) for mol in mols]
+    edges_by_key = dict()
+    to_build = dict()
+    for key, mol in zip(keys, mols):
+        if key in edges_by_key or key in to_build:
+            continue
+        edges = _get_cached_mol_graph_edges(key)
+        if edges is None:
+            to_build[key] = mol
+        else:
+            edges_by_key[key] = edges
+
+    if num_processes > 1 and len(to_build) > 1:
+        with ProcessPoolExecutor(
+            max_workers=min(num_processes, len(to_build))
+        ) as executor:
+            built = list(executor.map(_get_mol_graph_edges, to_build.values()))
+    else:
+        built = [_get_mol_graph_edges(mol) for mol in to_build.values()]
+
+    for key, edges in zip(to_build, built):
+        _cache_mol_graph_edges(key, edges)
+        edges_by_key[key] = edges
+
+    return [
+        _mol_graph_from_edges(mol, edges_by_key[key]) for key, mol in zip(keys, mols)
+    ]
+
+
 def get_graph_hash(mol: Molecule, node_attr: Optional[str] = None):
     """
     Return the Weisfeiler Lehman (WL) graph hash of the MoleculeGraph described
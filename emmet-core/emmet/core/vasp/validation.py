@@ -1,9 +1,13 @@
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import Dict, List, Union, Optional
+from itertools import groupby
+from typing import Any, Dict, List, NamedTuple, Tuple, Union, Optional
 
 import numpy as np
 from pydantic import Field, PyObject
 from pymatgen.core.structure import Structure
+from pymatgen.io.vasp.inputs import Kpoints
 from pymatgen.io.vasp.sets import VaspInputSet
 
 from emmet.core.settings import EmmetSettings
@@ -15,6 +19,12 @@ from emmet.core.vasp.calc_types.enums import CalcType, TaskType
 
 SETTINGS = EmmetSettings()
 
+# INCAR parameters read during validation
+_VALIDATED_INCAR_KEYS = ("ENCUT", "ISMEAR", "KSPACING", "LDAU", "LDAUU")
+
+_INPUT_SET_CACHE: "OrderedDict[Tuple, Tuple[Dict[str, Any], List[str]]]" = OrderedDict()
+_INPUT_SET_CACHE_LOCK = threading.Lock()
+
 
 class DeprecationMessage(DocEnum):
     MANUAL = "M", "Manual deprecation"
@@ -104,7 +114,7 @@ class ValidationDoc(EmmetBaseModel):
 
         if str(calc_type) in input_sets:
             try:
-                valid_input_set = _get_input_set(
+                valid_input_set = _get_input_set_params(
                     run_type, task_type, calc_type, structure, input_sets, bandgap
                 )
 
@@ -201,24 +211,83 @@ class ValidationDoc(EmmetBaseModel):
         return doc
 
 
-def _get_input_set(run_type, task_type, calc_type, structure, input_sets, bandgap):
+class _InputSetParams(NamedTuple):
+    """
+    The parts of a pymatgen input set that are checked during validation
+    """
+
+    incar: Dict[str, Any]
+    kpoints: Optional[Kpoints]
+    site_symbols: List[str]
+
+
+def _get_input_set_kwargs(run_type, task_type, bandgap) -> Dict[str, Any]:
     # Ensure inputsets get proper additional input values
     if "SCAN" in run_type.value:
-        valid_input_set: VaspInputSet = input_sets[str(calc_type)](structure, bandgap=bandgap)  # type: ignore
+        return {"bandgap": bandgap}
     elif task_type == TaskType.NSCF_Uniform or task_type == TaskType.NSCF_Line:
         # Constructing the k-path for line-mode calculations is too costly, so
         # the uniform input set is used instead and k-points are not checked.
-        valid_input_set = input_sets[str(calc_type)](structure, mode="uniform")
-
+        return {"mode": "uniform"}
     elif task_type == TaskType.NMR_Electric_Field_Gradient:
-        valid_input_set = input_sets[str(calc_type)](structure, mode="efg")
+        return {"mode": "efg"}
+    return {}
 
-    else:
-        valid_input_set = input_sets[str(calc_type)](structure)
 
+def _get_input_set(run_type, task_type, calc_type, structure, input_sets, bandgap):
+    valid_input_set: VaspInputSet = input_sets[str(calc_type)](
+        structure, **_get_input_set_kwargs(run_type, task_type, bandgap)
+    )  # type: ignore
     return valid_input_set
 
 
+def _get_input_set_params(
+    run_type, task_type, calc_type, structure, input_sets, bandgap
+) -> _InputSetParams:
+    """
+    Same as _get_input_set, but only the k-points are generated for every
+    structure. The checked INCAR parameters and the POSCAR site symbols only
+    depend on the input set and its arguments, the sequence of species in the
+    structure and whether the k-point mesh has fewer than 4 points (which
+    switches off the tetrahedron method). They are kept in a cache bounded
+    by SETTINGS.VASP_INPUT_SET_CACHE_SIZE.
+    """
+    valid_input_set = _get_input_set(
+        run_type, task_type, calc_type, structure, input_sets, bandgap
+    )
+    kpoints = valid_input_set.kpoints
+
+    # Site-specific LDAU parameters override those of the input set
+    if any(k.lower().startswith("ldau") for k in structure.site_properties):
+        key = None
+    else:
+        key = (
+            str(calc_type),
+            input_sets[str(calc_type)],
+            tuple(sorted(_get_input_set_kwargs(run_type, task_type, bandgap).items())),
+            # Order of the species in the POSCAR (and so in LDAUU)
+            tuple(sp for sp, _ in groupby(site.species_string for site in structure)),
+            kpoints is not None and np.prod(kpoints.kpts) < 4,
+        )
+        with _INPUT_SET_CACHE_LOCK:
+            if key in _INPUT_SET_CACHE:
+                _INPUT_SET_CACHE.move_to_end(key)
+                incar, site_symbols = _INPUT_SET_CACHE[key]
+                return _InputSetParams(dict(incar), kpoints, list(site_symbols))
+
+    full_incar = valid_input_set.incar
+    incar = {k: full_incar[k] for k in _VALIDATED_INCAR_KEYS if k in full_incar}
+    site_symbols = valid_input_set.poscar.site_symbols
+
+    if key is not None:
+        with _INPUT_SET_CACHE_LOCK:
+            _INPUT_SET_CACHE[key] = (incar, site_symbols)
+            while len(_INPUT_SET_CACHE) > SETTINGS.VASP_INPUT_SET_CACHE_SIZE:
+                _INPUT_SET_CACHE.popitem(last=False)
+
+    return _InputSetParams(dict(incar), kpoints, list(site_symbols))
+
+
 def _scf_upward_check(calcs_reversed, inputs, data, max_allowed_scf_gradient, warnings):
     skip = abs(inputs.get("incar", {}).get("NLEMDL", -5)) - 1
     energies = [
@@ -246,7 +315,7 @@ def _u_value_checks(task_doc, valid_input_set, warnings):
         # Assemble required input_set LDAU params into dictionary
         input_set_hubbards = dict(
             zip(
-                valid_input_set.poscar.site_symbols,
+                valid_input_set.site_symbols,
                 valid_input_set.incar.get("LDAUU", []),
             )
         )
@@ -6,12 +6,11 @@ import numpy as np
 from pydantic import Field
 from pymatgen.analysis.xas.spectrum import XAS, site_weighted_spectrum
 from pymatgen.core.periodic_table import Element
-from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
 from emmet.core.feff.task import TaskDocument
 from emmet.core.mpid import MPID
 from emmet.core.spectrum import SpectrumDoc
-from emmet.core.utils import ValueEnum
+from emmet.core.utils import ValueEnum, get_spacegroup_analyzer
 
 
 class Edge(ValueEnum):
@@ -252,7 +251,7 @@ class SymmSites:
 
     def __init__(self, structure):
         self.structure = structure
-        sa = SpacegroupAnalyzer(self.structure)
+        sa = get_spacegroup_analyzer(self.structure)
         symm_data = sa.get_symmetry_dataset()
         # equivalency mapping for the structure
         # i'th site in the input structure equivalent to eq_atoms[i]'th site
@@ -2,7 +2,13 @@ import pytest
 from monty.serialization import loadfn
 from pymatgen.core import Composition
 
-from emmet.core.structure_group import StructureGroupDoc
+from pymatgen.analysis.structure_matcher import ElementComparator, StructureMatcher
+
+from emmet.core.structure_group import (
+    StructureGroupDoc,
+    generic_groupby,
+    group_entries_with_structure_matcher,
+)
 
 
 @pytest.fixture(scope="session")
@@ -55,3 +61,33 @@ def test_StructureGroupDoc_from_ungrouped_entries(entries_lfeo):
                 dd_.pop(ignored)
             framework = Composition.from_dict(dd_).reduced_formula
             assert framework == framework_ref
+
+
+def test_group_entries_with_structure_matcher(test_dir):
+    entries = [
+        ent
+        for ent in loadfn(test_dir / "LiCoO2_batt.json")
+        if ent.composition.chemical_system != "Li"
+    ]
+    for itr, ient in enumerate(entries):
+        ient.entry_id = f"mp-{itr}"
+    sm = StructureMatcher(
+        comparator=ElementComparator(), primitive_cell=True, ignored_species=["Li"]
+    )
+
+    groups = [
+        [ent.entry_id for ent in group]
+        for group in group_entries_with_structure_matcher(entries, sm)
+    ]
+
+    # entries are sorted in place, so this compares against a plain pairwise fit
+    labs = generic_groupby(
+        entries,
+        comp=lambda x, y: sm.fit(x.structure, y.structure, symmetric=True),
+    )
+    expected = [
+        [ent.entry_id for ent, jlab in zip(entries, labs) if jlab == ilab]
+        for ilab in set(labs)
+    ]
+    assert groups == expected
+    assert len(groups) < len(entries)
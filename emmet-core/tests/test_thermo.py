@@ -1,7 +1,12 @@
 import pytest
 from monty.serialization import MontyDecoder
 from monty.serialization import loadfn
-from emmet.core.thermo import ThermoDoc
+from emmet.core.thermo import (
+    ThermoDoc,
+    get_decomp_and_e_above_hull_batch,
+    get_decomp_and_phase_separation_energy_batch,
+    get_form_energy_per_atom_batch,
+)
 
 
 @pytest.fixture(scope="session")
@@ -138,3 +143,28 @@ def test_from_entries(entries):
     unstable_doc = next(d for d in docs if d.material_id == "mp-5")
     assert unstable_doc.is_stable is False
     assert all([d.is_stable for d in docs if d != unstable_doc])
+
+
+def test_batched_hull_quantities(entries):
+    pd = ThermoDoc.construct_phase_diagram(entries)
+
+    decomps_and_ehulls = get_decomp_and_e_above_hull_batch(pd, entries)
+    form_energies = get_form_energy_per_atom_batch(pd, entries)
+    phase_separations = get_decomp_and_phase_separation_energy_batch(
+        pd, entries, decomps_and_ehulls=decomps_and_ehulls
+    )
+
+    for entry, (decomp, ehull), form_energy, (ps_decomp, ps_energy) in zip(
+        entries, decomps_and_ehulls, form_energies, phase_separations
+    ):
+        ref_decomp, ref_ehull = pd.get_decomp_and_e_above_hull(entry)
+        assert ehull == pytest.approx(ref_ehull)
+        assert {e.entry_id: amt for e, amt in decomp.items()} == pytest.approx(
+            {e.entry_id: amt for e, amt in ref_decomp.items()}
+        )
+
+        assert form_energy == pytest.approx(pd.get_form_energy_per_atom(entry))
+
+        ref_ps_decomp, ref_ps_energy = pd.get_decomp_and_phase_separation_energy(entry)
+        assert ps_energy == pytest.approx(ref_ps_energy)
+        assert {e.entry_id for e in ps_decomp} == {e.entry_id for e in ref_ps_decomp}
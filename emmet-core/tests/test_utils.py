@@ -1,12 +1,31 @@
 import datetime
 import json
+from itertools import groupby
 
 import numpy as np
 import pytest
 from bson.objectid import ObjectId
 from monty.json import MSONable
 
-from emmet.core.utils import DocEnum, ValueEnum, jsanitize
+from pymatgen.analysis.graphs import MoleculeGraph
+from pymatgen.analysis.local_env import OpenBabelNN, metal_edge_extender
+from pymatgen.analysis.structure_matcher import StructureMatcher
+from pymatgen.core import Lattice, Molecule, Structure
+
+from emmet.core.utils import (
+    DocEnum,
+    ValueEnum,
+    get_sg,
+    get_molecule_hash,
+    get_spacegroup_analyzer,
+    get_structure_fingerprints,
+    group_molecules,
+    group_structures,
+    jsanitize,
+    make_mol_graph,
+    make_mol_graphs,
+    structures_may_match,
+)
 
 
 def test_jsanitize():
@@ -84,3 +103,147 @@ def test_doc_enum():
 
     assert str(TestEnum.A) == "A"
     assert TestEnum.B.__doc__ == "Might describe B"
+
+
+def test_group_structures():
+    rng = np.random.default_rng(42)
+    base = Structure.from_spacegroup("Fm-3m", Lattice.cubic(5.4), ["Si"], [[0, 0, 0]])
+    structures = []
+    for _ in range(40):
+        s = base.copy()
+        s.apply_strain(rng.uniform(-0.3, 0.3, 3))
+        s.perturb(rng.uniform(0, 0.3))
+        s.scale_lattice(s.volume * rng.uniform(0.7, 1.3))
+        structures.append(s)
+    structures.append(base * (2, 1, 1))
+
+    sm = StructureMatcher(
+        ltol=0.2,
+        stol=0.3,
+        angle_tol=5,
+        primitive_cell=True,
+        scale=True,
+        attempt_supercell=False,
+        allow_subset=False,
+    )
+    expected = [
+        [structures.index(s) for s in group]
+        for _, pregroup in groupby(sorted(structures, key=get_sg), key=get_sg)
+        for group in sm.group_structures(list(pregroup))
+    ]
+    assert len(expected) < len(structures)
+
+    for num_processes in (1, 2):
+        groups = [
+            [structures.index(s) for s in group]
+            for group in group_structures(structures, num_processes=num_processes)
+        ]
+        assert groups == expected
+
+
+def test_structures_may_match():
+    base = Structure.from_spacegroup("Fm-3m", Lattice.cubic(5.4), ["Si"], [[0, 0, 0]])
+    scaled = base.copy()
+    scaled.scale_lattice(base.volume * 1.2)
+    diamond = Structure.from_spacegroup(
+        "Fd-3m", Lattice.cubic(5.4), ["Si"], [[0, 0, 0]]
+    )
+    structures = [base, scaled, diamond]
+
+    fingerprints = get_structure_fingerprints(structures)
+    assert json.loads(json.dumps(fingerprints)) == fingerprints
+    assert [fp["num_sites"] for fp in fingerprints] == [1, 1, 2]
+
+    groups = [
+        [structures.index(s) for s in group] for group in group_structures(structures)
+    ]
+    assert [0, 1] in groups
+    assert structures_may_match(fingerprints[0], fingerprints[1])
+    assert structures_may_match(fingerprints[1], fingerprints[0])
+    assert not structures_may_match(fingerprints[0], fingerprints[2])
+
+
+def test_get_spacegroup_analyzer():
+    structure = Structure.from_spacegroup(
+        "Fm-3m", Lattice.cubic(5.4), ["Si"], [[0, 0, 0]]
+    )
+    sga = get_spacegroup_analyzer(structure, symprec=0.1)
+    assert get_spacegroup_analyzer(structure.copy(), symprec=0.1) is sga
+    assert get_spacegroup_analyzer(structure, symprec=0.01) is not sga
+    assert get_sg(structure) == sga.get_space_group_number() == 225
+
+    perturbed = structure.copy()
+    perturbed.translate_sites([0], [0.01, 0, 0])
+    assert get_spacegroup_analyzer(perturbed, symprec=0.1) is not sga
+
+    oxidized = structure.copy()
+    oxidized.add_oxidation_state_by_element({"Si": 0})
+    assert get_spacegroup_analyzer(oxidized, symprec=0.1) is not sga
+
+    # Mutating the structure after the lookup must not change the cached analyzer
+    structure = Structure.from_spacegroup(
+        "Fm-3m", Lattice.cubic(5.4321), ["Si"], [[0, 0, 0]]
+    )
+    pristine = structure.copy()
+    get_spacegroup_analyzer(structure, symprec=0.1)
+    structure.translate_sites([0], [0.05, 0, 0])
+    symmetrized = get_spacegroup_analyzer(
+        pristine, symprec=0.1
+    ).get_symmetrized_structure()
+    assert symmetrized[0].frac_coords == pytest.approx([0, 0, 0])
+
+
+def test_make_mol_graph():
+    # Li+ coordinated by a water molecule
+    species = ["Li", "O", "H", "H"]
+    coords = np.array(
+        [[0.0, 0.0, -1.9], [0.0, 0.0, 0.0], [0.0, 0.76, 0.59], [0.0, -0.76, 0.59]]
+    )
+    mol = Molecule(species, coords, charge=1)
+    expected = metal_edge_extender(
+        MoleculeGraph.with_local_env_strategy(mol, OpenBabelNN())
+    )
+
+    mg = make_mol_graph(mol)
+    assert mg == expected
+    assert mg.graph.number_of_edges() == 3
+
+    # Graphs come from the cache, but each call gets its own copy
+    mg.break_edge(1, 2)
+    assert make_mol_graph(mol) == expected
+
+    # Bonds are looked up per geometry, charge and spin
+    shifted = Molecule(species, coords + 1e-9, charge=1)
+    assert get_molecule_hash(shifted) == get_molecule_hash(mol)
+    neutral = Molecule(species, coords, charge=0, spin_multiplicity=2)
+    assert get_molecule_hash(neutral) != get_molecule_hash(mol)
+    stretched_coords = coords.copy()
+    stretched_coords[2:, 2] += 5.0
+    stretched = Molecule(species, stretched_coords, charge=1)
+    assert get_molecule_hash(stretched) != get_molecule_hash(mol)
+
+    graphs = make_mol_graphs([mol, stretched, mol])
+    assert graphs[0] == graphs[2] == expected
+    assert graphs[1].graph.number_of_edges() == 1
+    assert [g.molecule for g in graphs] == [mol, stretched, mol]
+
+
+def test_group_molecules():
+    coords = np.array([[0.0, 0.0, 0.0], [0.0, 0.76, 0.59], [0.0, -0.76, 0.59]])
+    water = Molecule(["O", "H", "H"], coords)
+    molecules = [
+        water,
+        # Same geometry in another charge state
+        Molecule(["O", "H", "H"], coords, charge=1, spin_multiplicity=2),
+        # Rigidly moved
+        Molecule(["O", "H", "H"], coords + [1.0, 2.0, 3.0]),
+        # Different geometry
+        Molecule(["O", "H", "H"], coords * 1.1),
+        Molecule(["Li"], [[0.0, 0.0, 0.0]], charge=1),
+        Molecule(["Li"], [[0.0, 0.0, 0.0]], charge=0, spin_multiplicity=2),
+        Molecule(["Li"], [[1.0, 0.0, 0.0]], charge=1),
+    ]
+    groups = [
+        [molecules.index(m) for m in group] for group in group_molecules(molecules)
+    ]
+    assert sorted(groups) == [[0, 1, 2], [3], [4, 6], [5]]
@@ -54,6 +54,23 @@ def test_validator(tasks):
     assert all(doc.valid for doc in validation_docs)
 
 
+def test_validator_input_set_cache(tasks):
+    from emmet.core.vasp import validation
+
+    validation._INPUT_SET_CACHE.clear()
+    first = [ValidationDoc.from_task_doc(task) for task in tasks]
+    cached = list(validation._INPUT_SET_CACHE)
+    assert len(cached) > 0
+
+    # The second pass only reads the cache
+    second = [ValidationDoc.from_task_doc(task) for task in tasks]
+    assert list(validation._INPUT_SET_CACHE) == cached
+    for doc1, doc2 in zip(first, second):
+        assert doc1.data == doc2.data
+        assert doc1.reasons == doc2.reasons
+        assert doc1.warnings == doc2.warnings
+
+
 def test_computed_entry(tasks):
     entries = [task.entry for task in tasks]
     ids = {e.entry_id for e in entries}